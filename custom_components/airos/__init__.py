@@ -2,41 +2,139 @@
 
 from __future__ import annotations
 
-from airos.airos8 import AirOS
+from functools import partial
 
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
+from .client import AirOSClient
+from .connections import AirOSConnectionPool
+from .const import (
+    CONF_MAX_CONCURRENT_POLLS,
+    CONF_POLL_JITTER,
+    DEFAULT_MAX_CONCURRENT_POLLS,
+    DEFAULT_POLL_JITTER,
+    DOMAIN,
+)
 from .coordinator import AirOSConfigEntry, AirOSDataUpdateCoordinator
+from .events import StationOwners
+from .instrumentation import PollInstrumentation
+from .models import AIROS_DATA, AirOSDomainData
+from .remote import RemoteReports
+from .scheduler import AirOSPollScheduler
+from .services import async_setup_services
+from .snapshot import AirOSSnapshotStore
+from .station_statistics import StationStatistics
+from .topology import AirOSTopology
+from .views import AirOSDiagnosticsView
+from .websocket_api import async_setup_websocket
 
 _PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.BUTTON]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the data shared by all airOS devices."""
+    hass.data[AIROS_DATA] = AirOSDomainData(
+        scheduler=AirOSPollScheduler(),
+        connections=AirOSConnectionPool(),
+        station_owners=StationOwners(),
+        remote_reports=RemoteReports(),
+        topology=AirOSTopology(),
+    )
+    async_setup_services(hass)
+    async_setup_websocket(hass)
+    hass.http.register_view(AirOSDiagnosticsView())
+
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: AirOSConfigEntry) -> bool:
     """Set up Ubiquiti airOS from a config entry."""
+    domain_data = hass.data[AIROS_DATA]
+    session = domain_data.connections.async_get_session(hass)
 
-    # By default airOS 8 comes with self-signed SSL certificates,
-    # with no option in the web UI to change or upload a custom certificate.
-    session = async_get_clientsession(hass, verify_ssl=False)
-
-    airos_device = AirOS(
+    instrumentation = PollInstrumentation()
+    airos_device = AirOSClient(
         host=entry.data[CONF_HOST],
         username=entry.data[CONF_USERNAME],
         password=entry.data[CONF_PASSWORD],
         session=session,
+        instrumentation=instrumentation,
+    )
+
+    scheduler = domain_data.scheduler
+    # Polling shared by all devices follows the options of the first one
+    first = hass.config_entries.async_entries(DOMAIN)[0]
+    scheduler.async_configure(
+        first.options.get(CONF_MAX_CONCURRENT_POLLS, DEFAULT_MAX_CONCURRENT_POLLS),
+        first.options.get(CONF_POLL_JITTER, DEFAULT_POLL_JITTER),
+    )
+    snapshot = AirOSSnapshotStore(hass, entry.entry_id)
+    coordinator = AirOSDataUpdateCoordinator(
+        hass,
+        entry,
+        airos_device,
+        scheduler,
+        instrumentation,
+        snapshot=snapshot,
+        station_owners=domain_data.station_owners,
+        remote_reports=domain_data.remote_reports,
+        topology=domain_data.topology,
     )
+    entry.async_on_unload(partial(domain_data.topology.async_remove, entry.entry_id))
+    entry.async_on_unload(scheduler.async_register(coordinator))
+    if (statistics := coordinator.long_term_statistics) is not None:
+        # Continue the hour so far rather than write it partially
+        await statistics.async_load()
+        entry.async_on_unload(statistics.async_save)
 
-    coordinator = AirOSDataUpdateCoordinator(hass, entry, airos_device)
-    await coordinator.async_config_entry_first_refresh()
+    # Start from the last good status of this device rather than wait for it
+    stored = await snapshot.async_load()
+    if stored is not None and stored.host.device_id == entry.unique_id:
+        coordinator.async_restore(stored)
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
+    # The entities registered what they read, later polls decode only that
+    coordinator.async_start_projection()
+
+    if coordinator.stale:
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_delayed_first_refresh(),
+            f"{DOMAIN} {entry.title} first refresh",
+        )
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: AirOSConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: AirOSConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, _PLATFORMS):
+        domain_data = hass.data[AIROS_DATA]
+        # Stations reported by this device are polled directly again
+        domain_data.remote_reports.async_remove(entry.entry_id)
+        if not hass.config_entries.async_loaded_entries(DOMAIN):
+            # The last device is gone, so are its kept-alive connections
+            await domain_data.connections.async_close()
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: AirOSConfigEntry) -> None:
+    """Remove the stored status and statistics of a removed config entry."""
+    await AirOSSnapshotStore(hass, entry.entry_id).async_remove()
+    await StationStatistics(hass, entry.entry_id, str(entry.unique_id)).async_remove()
@@ -6,8 +6,6 @@ from collections.abc import Callable
 from dataclasses import dataclass
 import logging
 
-from airos.data import Station
-
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
@@ -18,9 +16,15 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
-from .coordinator import AirOSConfigEntry, AirOSData, AirOSDataUpdateCoordinator
-from .entity import AirOSEntity
-from .helpers import get_client_device_info
+from .coordinator import (
+    CONTEXT_DATA,
+    AirOSConfigEntry,
+    AirOSData,
+    AirOSDataUpdateCoordinator,
+)
+from .entity import AirOSEntity, AirOSInterfaceEntity, AirOSStationEntity
+from .helpers import async_add_interface_entities, async_add_station_entities
+from .interfaces import InterfaceState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +36,13 @@ class AirOSBinarySensorEntityDescription(BinarySensorEntityDescription):
     value_fn: Callable[[AirOSData], StateType]
 
 
+@dataclass(frozen=True, kw_only=True)
+class AirOSInterfaceBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describe an AirOS binary sensor for a network interface."""
+
+    value_fn: Callable[[InterfaceState], bool]
+
+
 BINARY_SENSORS: tuple[AirOSBinarySensorEntityDescription, ...] = (
     AirOSBinarySensorEntityDescription(
         key="portfw",
@@ -74,10 +85,33 @@ BINARY_SENSORS: tuple[AirOSBinarySensorEntityDescription, ...] = (
     ),
 )
 
+INTERFACE_BINARY_SENSORS: tuple[AirOSInterfaceBinarySensorEntityDescription, ...] = (
+    AirOSInterfaceBinarySensorEntityDescription(
+        key="plugged",
+        translation_key="interface_plugged",
+        device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda interface: interface.plugged,
+    ),
+    AirOSInterfaceBinarySensorEntityDescription(
+        key="duplex",
+        translation_key="interface_duplex",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda interface: interface.duplex,
+    ),
+    AirOSInterfaceBinarySensorEntityDescription(
+        key="enabled",
+        translation_key="interface_enabled",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda interface: interface.enabled,
+        entity_registry_enabled_default=False,
+    ),
+)
+
 CLIENT_BINARY_SENSOR_DESCRIPTION = BinarySensorEntityDescription(
     key="connectivity",
     device_class=BinarySensorDeviceClass.CONNECTIVITY,
-    translation_key="client_connectivity"
+    translation_key="client_connectivity",
 )
 
 
@@ -89,11 +123,26 @@ async def async_setup_entry(
     """Set up the AirOS binary sensors from a config entry."""
     coordinator = config_entry.runtime_data
 
-    async_add_entities([AirOSBinarySensor(coordinator, description) for description in BINARY_SENSORS], update_before_add=False)
+    async_add_entities(
+        [AirOSBinarySensor(coordinator, description) for description in BINARY_SENSORS],
+        update_before_add=False,
+    )
 
-    # Determine remote stations
-    stations = coordinator.data.wireless.sta
-    async_add_entities([AirOSClientBinarySensor(coordinator, client_data, stations) for client_data in stations], update_before_add=False)
+    # Determine remote stations, including those associating later on
+    async_add_station_entities(
+        config_entry,
+        async_add_entities,
+        lambda mac: [AirOSClientBinarySensor(coordinator, mac)],
+    )
+
+    async_add_interface_entities(
+        config_entry,
+        async_add_entities,
+        lambda ifname: [
+            AirOSInterfaceBinarySensor(coordinator, ifname, description)
+            for description in INTERFACE_BINARY_SENSORS
+        ],
+    )
 
 
 class AirOSBinarySensor(AirOSEntity, BinarySensorEntity):
@@ -110,6 +159,7 @@ class AirOSBinarySensor(AirOSEntity, BinarySensorEntity):
         super().__init__(coordinator)
 
         self.entity_description = description
+        self.coordinator_context = (CONTEXT_DATA, description.value_fn)
         self._attr_unique_id = f"{coordinator.data.host.device_id}_{description.key}"
 
     @property
@@ -118,39 +168,64 @@ class AirOSBinarySensor(AirOSEntity, BinarySensorEntity):
         return bool(self.entity_description.value_fn(self.coordinator.data))
 
 
-class AirOSClientBinarySensor(AirOSEntity, BinarySensorEntity):
+class AirOSInterfaceBinarySensor(AirOSInterfaceEntity, BinarySensorEntity):
+    """Representation of a binary sensor for a network interface."""
+
+    entity_description: AirOSInterfaceBinarySensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: AirOSDataUpdateCoordinator,
+        ifname: str,
+        description: AirOSInterfaceBinarySensorEntityDescription,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, ifname)
+
+        self.entity_description = description
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.unique_id}_{ifname}_{description.key}"
+        )
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return the state of the binary sensor."""
+        if (interface := self.interface) is None:
+            return None
+        return self.entity_description.value_fn(interface)
+
+
+class AirOSClientBinarySensor(AirOSStationEntity, BinarySensorEntity):
     """Represents a connected client (station) to the AirOS device."""
 
     entity_description: BinarySensorEntityDescription
 
-    def __init__(self, coordinator: AirOSDataUpdateCoordinator, client_data: Station, clients: list[Station]) -> None:
+    def __init__(self, coordinator: AirOSDataUpdateCoordinator, mac: str) -> None:
         """Initialize the AirOS client binary sensor."""
-        super().__init__(coordinator)
-        self._client_data = client_data
-        self._clients = clients
-
-        mac_lower = self._client_data.mac.lower()
-        self._attr_unique_id = f"{coordinator.config_entry.unique_id}_{mac_lower}_connectivity"
+        super().__init__(coordinator, mac)
 
-        self._attr_device_info = get_client_device_info(coordinator, self._client_data)
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.unique_id}_{self._mac}_connectivity"
+        )
 
         self._update_client_attributes()
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available, a disconnected client is reported as off."""
+        return self.coordinator.last_update_success
 
     @property
-    def is_on(self) -> bool | None:
+    def is_on(self) -> bool:
         """Return true if the client is currently connected."""
-        for client in self._clients:
-            if client.mac == self._client_data.mac:
-                return True # Client found, thus connected
-            return False # Client not found in the current list, thus disconnected
-        return None # Return None if not in AP mode or no client data
+        return self.station is not None
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._update_client_attributes() # Update name if hostname changes
+        self._update_client_attributes()  # Update name if hostname changes
         super()._handle_coordinator_update()
 
     def _update_client_attributes(self) -> None:
         """Update entity attributes based on current data."""
-        self._attr_name = self._client_data.remote.hostname
+        if (station := self.station) is not None:
+            self._attr_name = station.remote.hostname
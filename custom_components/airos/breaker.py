@@ -0,0 +1,110 @@
+"""Circuit breaker for unreachable airOS devices."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from enum import StrEnum
+import time
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import BREAKER_MAX_BACKOFF, BREAKER_MIN_BACKOFF, BREAKER_THRESHOLD
+
+
+class BreakerState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop polling a device that keeps failing to connect.
+
+    After a number of consecutive connection failures the breaker opens and
+    requests are refused until the backoff has passed. A single probe is then
+    let through (half open): success closes the breaker, failure opens it
+    again with double the backoff.
+    """
+
+    def __init__(
+        self,
+        threshold: int = BREAKER_THRESHOLD,
+        min_backoff: timedelta = BREAKER_MIN_BACKOFF,
+        max_backoff: timedelta = BREAKER_MAX_BACKOFF,
+    ) -> None:
+        """Initialize the breaker."""
+        self.threshold = threshold
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.state = BreakerState.CLOSED
+        self.consecutive_failures = 0
+        self.backoff = timedelta(0)
+        self.opened_count = 0
+        self._next_probe: float | None = None
+
+    def allow_request(self, now: float) -> bool:
+        """Return whether a request may be made, moving to half open when due."""
+        if self.state is BreakerState.CLOSED:
+            return True
+        if (
+            self.state is BreakerState.OPEN
+            and self._next_probe is not None
+            and now >= self._next_probe
+        ):
+            self.state = BreakerState.HALF_OPEN
+            return True
+        # Only the single probe is let through while half open
+        return False
+
+    def time_until_probe(self, now: float) -> timedelta:
+        """Return the time left until the next probe."""
+        if self._next_probe is None:
+            return timedelta(0)
+        return timedelta(seconds=max(self._next_probe - now, 0))
+
+    def record_success(self) -> None:
+        """Close the breaker, the device is reachable."""
+        self.state = BreakerState.CLOSED
+        self.consecutive_failures = 0
+        self.backoff = timedelta(0)
+        self._next_probe = None
+
+    def record_failure(self, now: float) -> None:
+        """Count a connection failure, opening the breaker when due."""
+        self.consecutive_failures += 1
+        if self.state is BreakerState.HALF_OPEN:
+            self._open(now, min(self.backoff * 2, self.max_backoff))
+        elif (
+            self.state is BreakerState.CLOSED
+            and self.consecutive_failures >= self.threshold
+        ):
+            self._open(now, self.min_backoff)
+
+    def _open(self, now: float, backoff: timedelta) -> None:
+        """Refuse requests for the backoff."""
+        self.state = BreakerState.OPEN
+        self.opened_count += 1
+        self.backoff = backoff
+        self._next_probe = now + backoff.total_seconds()
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether requests are being refused."""
+        return self.state is not BreakerState.CLOSED
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state, times in seconds."""
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "opened": self.opened_count,
+            "backoff_s": round(self.backoff.total_seconds()),
+            "next_probe": (
+                dt_util.utcnow() + self.time_until_probe(time.monotonic())
+            ).isoformat()
+            if self._next_probe is not None
+            else None,
+        }
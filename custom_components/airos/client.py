@@ -0,0 +1,229 @@
+"""AirOS client for the Ubiquiti airOS integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Collection
+from contextlib import AbstractContextManager, nullcontext
+from http import HTTPStatus
+import json
+import logging
+import time
+
+from airos.airos8 import AirOS, AirOSData
+from airos.exceptions import (
+    ConnectionAuthenticationError,
+    DataMissingError,
+    DeviceConnectionError,
+    KeyDataMissingError,
+)
+
+import aiohttp
+from mashumaro.exceptions import InvalidFieldValue, MissingField
+
+from .const import SESSION_MAX_AGE
+from .instrumentation import PollInstrumentation
+from .projection import decode_projected
+
+_LOGGER = logging.getLogger(__name__)
+
+_STATUS_PATH = "/status.cgi"
+_STAKICK_PATH = "/stakick.cgi"
+# Wireless interface the stations of an airOS device are connected to
+_STATION_INTERFACE = "ath0"
+_SESSION_REJECTED = (HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN)
+
+
+class AirOSClient:
+    """Reuse the session of an airOS device, logging in again once it expires.
+
+    Login goes through the public API of the airOS library. Its status() and
+    stakick() cannot tell an expired session from other errors, so status
+    and kick requests are sent here with the session and CSRF token of the
+    library instead. A request refused for an expired session logs in again
+    and is retried once. Concurrent requests refused by the same session
+    share a single new login.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str,
+        session: aiohttp.ClientSession,
+        use_ssl: bool = True,
+        *,
+        instrumentation: PollInstrumentation | None = None,
+    ) -> None:
+        """Initialize the client."""
+        self._airos = AirOS(host, username, password, session, use_ssl)
+        self.instrumentation = instrumentation
+        # Body of the last status response, decoded in full on request only
+        self.last_response: str | None = None
+        self.login_count = 0
+        self.relogin_count = 0
+        self._session_expires: float | None = None
+        # Counts logins, so a refused request knows whether its session is
+        # still the current one
+        self._session_generation = 0
+        self._login_lock = asyncio.Lock()
+
+    @property
+    def session_valid(self) -> bool:
+        """Return whether the current airOS session can be reused."""
+        return (
+            self._session_expires is not None
+            and time.monotonic() < self._session_expires
+        )
+
+    def invalidate_session(self) -> None:
+        """Log in again on the next request."""
+        self._session_expires = None
+
+    async def login(self) -> bool:
+        """Log in to the device, starting a new session."""
+        self._session_expires = None
+        self.login_count += 1
+        self._session_generation += 1
+        with self._measure("login"):
+            result = await self._airos.login()
+        self._session_expires = time.monotonic() + SESSION_MAX_AGE.total_seconds()
+        return bool(result)
+
+    async def ensure_session(self) -> None:
+        """Log in to the device unless the current session is still valid."""
+        if self.session_valid:
+            return
+        async with self._login_lock:
+            # Another request may have logged in while this one waited
+            if not self.session_valid:
+                await self.login()
+
+    async def status(self, keep: Collection[str] | None = None) -> AirOSData:
+        """Retrieve status from the device.
+
+        Only the projection fields in keep are decoded, all of them when None.
+        """
+        if not self.session_valid:
+            await self.ensure_session()
+            return await self._async_status(keep)
+        generation = self._session_generation
+        try:
+            return await self._async_status(keep)
+        except ConnectionAuthenticationError:
+            await self._async_relogin(generation)
+            return await self._async_status(keep)
+
+    async def stakick(self, mac: str) -> bool:
+        """Disconnect a station, returning whether the device accepted it."""
+        if not self.session_valid:
+            await self.ensure_session()
+            return await self._async_stakick(mac)
+        generation = self._session_generation
+        try:
+            return await self._async_stakick(mac)
+        except ConnectionAuthenticationError:
+            await self._async_relogin(generation)
+            return await self._async_stakick(mac)
+
+    async def _async_relogin(self, generation: int) -> None:
+        """Log in again after the device refused the session of a generation."""
+        async with self._login_lock:
+            if generation != self._session_generation:
+                # Another request already replaced the refused session
+                return
+            _LOGGER.debug("airOS session no longer accepted, logging in again")
+            self.relogin_count += 1
+            await self.login()
+
+    def _headers(self) -> dict[str, str]:
+        """Return the headers of a request within the current session."""
+        base_url = self._airos.base_url
+        headers = {
+            "Accept": "application/json, text/javascript, */*; q=0.01",
+            "Origin": base_url,
+            "Referer": f"{base_url}/",
+            "X-Requested-With": "XMLHttpRequest",
+        }
+        if token := self._airos.current_csrf_token:
+            headers["X-CSRF-ID"] = token
+        return headers
+
+    @staticmethod
+    def _session_rejected(status: int) -> bool:
+        """Return whether a response status means the session is gone."""
+        # airOS redirects to the login page once the session is gone
+        return status in _SESSION_REJECTED or (
+            HTTPStatus.MULTIPLE_CHOICES <= status < HTTPStatus.BAD_REQUEST
+        )
+
+    async def _async_stakick(self, mac: str) -> bool:
+        """Disconnect a station within the current session.
+
+        Raises ConnectionAuthenticationError when the device no longer accepts
+        the session cookie. Any other refusal, like a station that is not
+        connected, returns False.
+        """
+        try:
+            async with self._airos.session.post(
+                f"{self._airos.base_url}{_STAKICK_PATH}",
+                headers=self._headers(),
+                data={"staif": _STATION_INTERFACE, "staid": mac.upper()},
+                allow_redirects=False,
+            ) as response:
+                if self._session_rejected(response.status):
+                    raise ConnectionAuthenticationError from None
+                if response.status != HTTPStatus.OK:
+                    _LOGGER.debug("Kick of %s refused: %s", mac, await response.text())
+                    return False
+        except aiohttp.ClientError as err:
+            raise DeviceConnectionError from err
+        return True
+
+    async def _async_status(self, keep: Collection[str] | None) -> AirOSData:
+        """Request and decode the status within the current session.
+
+        Raises ConnectionAuthenticationError when the device no longer accepts
+        the session cookie, so the caller knows a new login is required.
+        """
+        with self._measure("request"):
+            try:
+                async with self._airos.session.get(
+                    f"{self._airos.base_url}{_STATUS_PATH}",
+                    headers=self._headers(),
+                    allow_redirects=False,
+                ) as response:
+                    if self._session_rejected(response.status):
+                        raise ConnectionAuthenticationError from None
+                    if response.status != HTTPStatus.OK:
+                        _LOGGER.error("Status request failed: %s", response.status)
+                        raise DeviceConnectionError from None
+                    response_text = await response.text()
+            except aiohttp.ClientError as err:
+                raise DeviceConnectionError from err
+
+        with self._measure("decode"):
+            data = decode_status(response_text, keep)
+        self.last_response = response_text
+        return data
+
+    def _measure(self, phase: str) -> AbstractContextManager[None]:
+        """Time a phase of the request when instrumented."""
+        if self.instrumentation is None:
+            return nullcontext()
+        return self.instrumentation.measure(phase)
+
+
+def decode_status(response_text: str, keep: Collection[str] | None = None) -> AirOSData:
+    """Decode a status response, leaving the fields not kept undecoded."""
+    try:
+        response_json = json.loads(response_text)
+    except json.JSONDecodeError as err:
+        raise DataMissingError from err
+
+    try:
+        if keep is not None:
+            return decode_projected(response_json, keep)
+        return AirOSData.from_dict(response_json)
+    except (MissingField, InvalidFieldValue) as err:
+        raise KeyDataMissingError from err
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
+import ipaddress
 import logging
 from typing import Any
 
+from airos.airos8 import AirOSData
 from airos.exceptions import (
+    AirOSException,
     ConnectionAuthenticationError,
     ConnectionSetupError,
     DataMissingError,
@@ -14,12 +19,41 @@ from airos.exceptions import (
 )
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    SOURCE_INTEGRATION_DISCOVERY,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv, discovery_flow
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.typing import DiscoveryInfoType
 
-from .const import DOMAIN
-from .coordinator import AirOS
+from .client import AirOSClient
+from .const import (
+    CONF_DEVICES,
+    CONF_MAX_CONCURRENT_POLLS,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_POLL_JITTER,
+    CONF_REMOTE_REPORT,
+    CONF_STATION_STATISTICS,
+    CONF_SUBNET,
+    CONNECTION_LIMIT,
+    DEFAULT_MAX_CONCURRENT_POLLS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_POLL_JITTER,
+    DOMAIN,
+    MAX_SCAN_HOSTS,
+    MAX_SCAN_INTERVAL_LIMIT,
+    SCAN_CONCURRENCY,
+    VALIDATE_TIMEOUT,
+)
+from .coordinator import AirOSConfigEntry
+from .discovery import async_scan
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,33 +65,77 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+STEP_REAUTH_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_PASSWORD): str,
+    }
+)
+
+STEP_SCAN_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SUBNET): str,
+        vol.Required(CONF_USERNAME, default="ubnt"): str,
+        vol.Required(CONF_PASSWORD): str,
+    }
+)
+
+STEP_OPTIONS_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_MIN_SCAN_INTERVAL, default=DEFAULT_MIN_SCAN_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=5, max=MAX_SCAN_INTERVAL_LIMIT)),
+        vol.Required(
+            CONF_MAX_SCAN_INTERVAL, default=DEFAULT_MAX_SCAN_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=5, max=MAX_SCAN_INTERVAL_LIMIT)),
+        vol.Required(CONF_STATION_STATISTICS, default=False): bool,
+        vol.Required(CONF_REMOTE_REPORT, default=False): bool,
+        vol.Required(
+            CONF_MAX_CONCURRENT_POLLS, default=DEFAULT_MAX_CONCURRENT_POLLS
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=CONNECTION_LIMIT)),
+        vol.Required(CONF_POLL_JITTER, default=DEFAULT_POLL_JITTER): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=MAX_SCAN_INTERVAL_LIMIT)
+        ),
+    }
+)
+
 
 class AirOSConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Ubiquiti airOS."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: AirOSConfigEntry) -> AirOSOptionsFlow:
+        """Get the options flow for this handler."""
+        return AirOSOptionsFlow()
+
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self._credentials: dict[str, str] = {}
+        self._subnet: ipaddress.IPv4Network | ipaddress.IPv6Network | None = None
+        self._scan_task: asyncio.Task[dict[str, AirOSData]] | None = None
+        # Devices found by a subnet scan, by host
+        self._found: dict[str, AirOSData] = {}
+        # Hosts found by a subnet scan that are not recognized as airOS
+        self._unknown: list[str] = []
+
     async def async_step_user(
         self,
         user_input: dict[str, Any] | None = None,
     ) -> ConfigFlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["manual", "scan"])
+
+    async def async_step_manual(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Add a device by its address."""
         errors: dict[str, str] = {}
         if user_input is not None:
-            # By default airOS 8 comes with self-signed SSL certificates,
-            # with no option in the web UI to change or upload a custom certificate.
-            session = async_get_clientsession(self.hass, verify_ssl=False)
-
-            airos_device = AirOS(
-                host=user_input[CONF_HOST],
-                username=user_input[CONF_USERNAME],
-                password=user_input[CONF_PASSWORD],
-                session=session,
-            )
             try:
-                await airos_device.login()
-                airos_data = await airos_device.status()
-
+                airos_data = await self._async_fetch_status(user_input)
             except (
                 ConnectionSetupError,
                 DeviceConnectionError,
@@ -78,5 +156,254 @@ class AirOSConfigFlow(ConfigFlow, domain=DOMAIN):
                 )
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="manual", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_reauth(
+        self, entry_data: Mapping[str, Any]
+    ) -> ConfigFlowResult:
+        """Start reauthentication after the device refused the password."""
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Ask for the new password of the device."""
+        errors: dict[str, str] = {}
+        reauth_entry = self._get_reauth_entry()
+        if user_input is not None:
+            try:
+                airos_data = await self._async_fetch_status(
+                    {**reauth_entry.data, **user_input}
+                )
+            except (
+                ConnectionSetupError,
+                DeviceConnectionError,
+            ):
+                errors["base"] = "cannot_connect"
+            except (ConnectionAuthenticationError, DataMissingError):
+                errors["base"] = "invalid_auth"
+            except KeyDataMissingError:
+                errors["base"] = "key_data_missing"
+            except Exception:
+                _LOGGER.exception("Unexpected exception")
+                errors["base"] = "unknown"
+            else:
+                await self.async_set_unique_id(airos_data.host.device_id)
+                self._abort_if_unique_id_mismatch()
+                return self.async_update_reload_and_abort(
+                    reauth_entry, data_updates=user_input
+                )
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=STEP_REAUTH_DATA_SCHEMA,
+            description_placeholders={CONF_HOST: reauth_entry.data[CONF_HOST]},
+            errors=errors,
+        )
+
+    async def async_step_scan(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Scan a subnet for devices accepting the given credentials."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            try:
+                subnet = ipaddress.ip_network(user_input[CONF_SUBNET], strict=False)
+            except ValueError:
+                errors[CONF_SUBNET] = "invalid_subnet"
+            else:
+                if subnet.num_addresses > MAX_SCAN_HOSTS:
+                    errors[CONF_SUBNET] = "subnet_too_large"
+                else:
+                    self._credentials = {
+                        CONF_USERNAME: user_input[CONF_USERNAME],
+                        CONF_PASSWORD: user_input[CONF_PASSWORD],
+                    }
+                    self._subnet = subnet
+                    return await self.async_step_scan_progress()
+
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_SCAN_DATA_SCHEMA, user_input
+            ),
+            errors=errors,
+        )
+
+    async def async_step_scan_progress(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Scan the subnet in the background."""
+        assert self._subnet is not None
+        if self._scan_task is None:
+            self._scan_task = self.hass.async_create_task(
+                self._async_scan(self._subnet), f"{DOMAIN} scan {self._subnet}"
+            )
+        if not self._scan_task.done():
+            return self.async_show_progress(
+                step_id="scan_progress",
+                progress_action="scan",
+                progress_task=self._scan_task,
+                description_placeholders={CONF_SUBNET: str(self._subnet)},
+            )
+
+        self._found = self._scan_task.result()
+        self._scan_task = None
+        return self.async_show_progress_done(
+            next_step_id="select" if self._found else "no_devices"
+        )
+
+    async def async_step_no_devices(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Abort a scan that found no devices to add."""
+        return self.async_abort(reason="no_devices_found")
+
+    async def async_step_select(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Add the devices selected from a subnet scan."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if not (hosts := user_input[CONF_DEVICES]):
+                errors["base"] = "no_devices_selected"
+            else:
+                first, *others = hosts
+                # A flow creates a single entry, the others get a flow each
+                # that validates the device again before adding it
+                for host in others:
+                    discovery_flow.async_create_flow(
+                        self.hass,
+                        DOMAIN,
+                        context={"source": SOURCE_INTEGRATION_DISCOVERY},
+                        data={CONF_HOST: host, **self._credentials},
+                    )
+                airos_data = self._found[first]
+                await self.async_set_unique_id(airos_data.host.device_id)
+                self._abort_if_unique_id_configured()
+                return self.async_create_entry(
+                    title=airos_data.host.hostname,
+                    data={CONF_HOST: first, **self._credentials},
+                )
+
+        devices = {
+            host: f"{airos_data.host.hostname} ({airos_data.host.devmodel}, {host})"
+            for host, airos_data in self._found.items()
+        }
+        return self.async_show_form(
+            step_id="select",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_DEVICES, default=list(devices)): cv.multi_select(
+                        devices
+                    )
+                }
+            ),
+            description_placeholders={"unknown": ", ".join(self._unknown) or "-"},
+            errors=errors,
+        )
+
+    async def async_step_integration_discovery(
+        self, discovery_info: DiscoveryInfoType
+    ) -> ConfigFlowResult:
+        """Add a device selected from the subnet scan of another flow."""
+        try:
+            async with asyncio.timeout(VALIDATE_TIMEOUT.total_seconds()):
+                airos_data = await self._async_fetch_status(discovery_info)
+        except (ConnectionAuthenticationError, DataMissingError):
+            return self.async_abort(reason="invalid_auth")
+        except KeyDataMissingError:
+            return self.async_abort(reason="key_data_missing")
+        except (AirOSException, TimeoutError):
+            return self.async_abort(reason="cannot_connect")
+
+        await self.async_set_unique_id(airos_data.host.device_id)
+        self._abort_if_unique_id_configured(
+            updates={CONF_HOST: discovery_info[CONF_HOST]}
+        )
+        return self.async_create_entry(
+            title=airos_data.host.hostname,
+            data={
+                CONF_HOST: discovery_info[CONF_HOST],
+                CONF_USERNAME: discovery_info[CONF_USERNAME],
+                CONF_PASSWORD: discovery_info[CONF_PASSWORD],
+            },
+        )
+
+    async def _async_fetch_status(self, user_input: dict[str, Any]) -> AirOSData:
+        """Log in to a device and return its status."""
+        # By default airOS 8 comes with self-signed SSL certificates,
+        # with no option in the web UI to change or upload a custom certificate.
+        session = async_get_clientsession(self.hass, verify_ssl=False)
+
+        airos_device = AirOSClient(
+            host=user_input[CONF_HOST],
+            username=user_input[CONF_USERNAME],
+            password=user_input[CONF_PASSWORD],
+            session=session,
+        )
+        await airos_device.login()
+        return await airos_device.status()
+
+    async def _async_scan(
+        self, subnet: ipaddress.IPv4Network | ipaddress.IPv6Network
+    ) -> dict[str, AirOSData]:
+        """Return the status of the unconfigured airOS devices on a subnet.
+
+        Credentials are only sent to hosts confirmed to run airOS.
+        """
+        result = await async_scan(
+            subnet, async_get_clientsession(self.hass, verify_ssl=False)
+        )
+        self._unknown = result.unknown
+        devices = result.devices
+        configured = self._async_current_ids()
+        semaphore = asyncio.Semaphore(SCAN_CONCURRENCY)
+
+        async def _async_validate(host: str) -> AirOSData | None:
+            async with semaphore:
+                try:
+                    async with asyncio.timeout(VALIDATE_TIMEOUT.total_seconds()):
+                        return await self._async_fetch_status(
+                            {CONF_HOST: host, **self._credentials}
+                        )
+                except (AirOSException, TimeoutError) as err:
+                    _LOGGER.debug("Skipping %s found by scan: %r", host, err)
+                    return None
+
+        results = await asyncio.gather(*(_async_validate(host) for host in devices))
+        return {
+            host: airos_data
+            for host, airos_data in zip(devices, results, strict=True)
+            if airos_data is not None and airos_data.host.device_id not in configured
+        }
+
+
+class AirOSOptionsFlow(OptionsFlow):
+    """Handle options for Ubiquiti airOS."""
+
+    async def async_step_init(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Manage the poll interval bounds, statistics and shared polling."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if user_input[CONF_MIN_SCAN_INTERVAL] > user_input[CONF_MAX_SCAN_INTERVAL]:
+                errors["base"] = "invalid_scan_interval"
+            else:
+                return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_OPTIONS_DATA_SCHEMA, user_input or self.config_entry.options
+            ),
+            errors=errors,
         )
@@ -0,0 +1,109 @@
+"""HTTP connection pool shared by all airOS devices."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.util.ssl import get_default_no_verify_context
+
+from .const import (
+    CONNECT_TIMEOUT,
+    CONNECTION_KEEPALIVE,
+    CONNECTION_LIMIT,
+    CONNECTION_LIMIT_PER_HOST,
+    REQUEST_TIMEOUT,
+)
+
+
+class AirOSConnectionPool:
+    """Keep connections to airOS devices open between polls.
+
+    A TLS handshake is expensive for the CPU of an airOS device. All devices
+    share a dedicated connector that keeps an idle connection open for longer
+    than the largest poll interval, so every poll reuses the connection of
+    the previous one, and the pool counts how many requests needed a new
+    connection.
+
+    TLS sessions are not resumed: the SSL context is already shared, but
+    asyncio cannot hand a previous TLS session to a new connection, so a
+    connection closed by the device pays a full handshake.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the pool."""
+        self._session: aiohttp.ClientSession | None = None
+        self._unsub_close: CALLBACK_TYPE | None = None
+        self.created = 0
+        self.reused = 0
+
+    @callback
+    def async_get_session(self, hass: HomeAssistant) -> aiohttp.ClientSession:
+        """Return the session of the pool, created on first use."""
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+
+            async def _async_close(event: Event) -> None:
+                self._unsub_close = None
+                await self.async_close()
+
+            self._unsub_close = hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_CLOSE, _async_close
+            )
+        return self._session
+
+    async def async_close(self) -> None:
+        """Close the session and its connections, once no device uses them."""
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create a session with a connector tuned for airOS devices."""
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_created)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+
+        # By default airOS 8 comes with self-signed SSL certificates,
+        # with no option in the web UI to change or upload a custom certificate.
+        connector = aiohttp.TCPConnector(
+            ssl=get_default_no_verify_context(),
+            limit=CONNECTION_LIMIT,
+            limit_per_host=CONNECTION_LIMIT_PER_HOST,
+            keepalive_timeout=CONNECTION_KEEPALIVE.total_seconds(),
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(
+                total=REQUEST_TIMEOUT.total_seconds(),
+                connect=CONNECT_TIMEOUT.total_seconds(),
+            ),
+            trace_configs=[trace_config],
+        )
+
+    async def _on_connection_created(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        """Count a request that opened a new connection."""
+        self.created += 1
+
+    async def _on_connection_reused(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        """Count a request sent over an idle connection."""
+        self.reused += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return connection statistics."""
+        total = self.created + self.reused
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "reuse_ratio": round(self.reused / total, 3) if total else 0,
+        }
@@ -8,3 +8,90 @@ MANUFACTURER = "Ubiquiti"
 
 SCAN_INTERVAL = timedelta(minutes=1)
 
+# Log in again before the airOS session cookie is expected to expire
+SESSION_MAX_AGE = timedelta(minutes=10)
+
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+
+DEFAULT_MIN_SCAN_INTERVAL = 15  # seconds
+DEFAULT_MAX_SCAN_INTERVAL = 300  # seconds
+# Largest poll interval that can be configured
+MAX_SCAN_INTERVAL_LIMIT = 3600  # seconds
+
+CONF_SUBNET = "subnet"
+CONF_DEVICES = "devices"
+
+# Subnet scans in the config flow
+DISCOVERY_PORT = 10001
+DISCOVERY_TIMEOUT = timedelta(seconds=3)
+PROBE_TIMEOUT = timedelta(seconds=3)
+VALIDATE_TIMEOUT = timedelta(seconds=10)
+SCAN_CONCURRENCY = 32
+MAX_SCAN_HOSTS = 1024
+
+# Keep station metrics as long-term statistics instead of sensors
+CONF_STATION_STATISTICS = "station_statistics"
+
+# Take the status of a station from the access point it is connected to
+CONF_REMOTE_REPORT = "remote_report"
+
+# Poll a station reported by its access point directly at least this often
+REMOTE_REPORT_DIRECT_POLL = timedelta(minutes=15)
+
+# Devices polled at the same time and the maximum start offset of a device,
+# shared by all devices and taken from the options of the first one
+CONF_MAX_CONCURRENT_POLLS = "max_concurrent_polls"
+CONF_POLL_JITTER = "poll_jitter"
+DEFAULT_MAX_CONCURRENT_POLLS = 8
+DEFAULT_POLL_JITTER = 30  # seconds
+
+# Connections to devices shared by all entries, kept open between polls
+CONNECTION_LIMIT = 64
+CONNECTION_LIMIT_PER_HOST = 2
+CONNECTION_KEEPALIVE = timedelta(seconds=MAX_SCAN_INTERVAL_LIMIT + 60)
+CONNECT_TIMEOUT = timedelta(seconds=10)
+REQUEST_TIMEOUT = timedelta(seconds=30)
+
+# Number of polls kept per station for rolling statistics
+HISTORY_SIZE = 30
+
+# Least healthy stations listed per access point
+HEALTH_WORST_COUNT = 5
+
+# Number of polls kept per phase for the latency histograms
+TIMING_WINDOW = 100
+
+# Consecutive connection failures before polling of a device backs off
+BREAKER_THRESHOLD = 3
+BREAKER_MIN_BACKOFF = timedelta(minutes=1)
+BREAKER_MAX_BACKOFF = timedelta(minutes=30)
+
+# Minimum time between writes of the last good status to storage
+SNAPSHOT_SAVE_DELAY = timedelta(minutes=15)
+# Minimum time between writes of the hours not yet in the statistics to storage
+STATISTICS_SAVE_DELAY = timedelta(minutes=15)
+
+EVENT_STATION_CONNECTED = f"{DOMAIN}_station_connected"
+EVENT_STATION_DISCONNECTED = f"{DOMAIN}_station_disconnected"
+EVENT_STATION_ROAMED = f"{DOMAIN}_station_roamed"
+
+# Station events kept per device for diagnostics
+EVENT_LOG_SIZE = 100
+
+# A station connecting within this time after leaving another device roamed
+ROAM_WINDOW = timedelta(minutes=5)
+
+# Interfaces whose name starts with this are wired ports
+ETHERNET_PREFIX = "eth"
+
+SERVICE_KICK_STATIONS = "kick_stations"
+ATTR_MACS = "macs"
+ATTR_SIGNAL_BELOW = "signal_below"
+
+SERVICE_GET_TOPOLOGY = "get_topology"
+ATTR_DEVICE_ID = "device_id"
+ATTR_MAC = "mac"
+
+# Station kicks running at the same time per device
+KICK_CONCURRENCY = 4
@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
+from collections.abc import Collection
+from datetime import timedelta
+import heapq
 import logging
+from operator import itemgetter
+import time
+from typing import Any
 
-from airos.airos8 import AirOS, AirOSData
+from airos.airos8 import AirOSData
+from airos.data import Station
 from airos.exceptions import (
     ConnectionAuthenticationError,
     ConnectionSetupError,
@@ -13,16 +22,58 @@ from airos.exceptions import (
 )
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryError
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, SCAN_INTERVAL
+from .breaker import CircuitBreaker
+from .client import AirOSClient
+from .const import (
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_REMOTE_REPORT,
+    CONF_STATION_STATISTICS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DOMAIN,
+    HEALTH_WORST_COUNT,
+    REMOTE_REPORT_DIRECT_POLL,
+    SCAN_INTERVAL,
+)
+from .events import StationEvents, StationOwners
+from .health import score_stations
+from .history import HISTORY_METRICS, StationHistory
+from .instrumentation import PollInstrumentation
+from .interfaces import InterfaceState, extract_interface_states
+from .polling import AdaptivePollInterval
+from .remote import RemoteReports, apply_remote_report
+from .scheduler import AirOSPollScheduler
+from .snapshot import AirOSSnapshotStore
+from .station_statistics import StationStatistics
+from .stations import (
+    RATE_METRICS,
+    StationMetrics,
+    StationRateTracker,
+    extract_station_metrics,
+)
+from .topology import AirOSTopology
 
 _LOGGER = logging.getLogger(__name__)
 
 type AirOSConfigEntry = ConfigEntry[AirOSDataUpdateCoordinator]
 
+# Listener contexts name the coordinator data an entity reads: a value
+# function of the status, an interface, a station or one metric of a station
+CONTEXT_DATA = "data"
+CONTEXT_INTERFACE = "interface"
+CONTEXT_STATION = "station"
+
+type UpdateContext = tuple[Any, ...]
+
+_UNSET = object()
+_GONE = object()
+
 
 class AirOSDataUpdateCoordinator(DataUpdateCoordinator[AirOSData]):
     """Class to manage fetching AirOS data from single endpoint."""
@@ -30,37 +81,364 @@ class AirOSDataUpdateCoordinator(DataUpdateCoordinator[AirOSData]):
     config_entry: AirOSConfigEntry
 
     def __init__(
-        self, hass: HomeAssistant, config_entry: AirOSConfigEntry, airos_device: AirOS
+        self,
+        hass: HomeAssistant,
+        config_entry: AirOSConfigEntry,
+        airos_device: AirOSClient,
+        scheduler: AirOSPollScheduler | None = None,
+        instrumentation: PollInstrumentation | None = None,
+        *,
+        snapshot: AirOSSnapshotStore | None = None,
+        station_owners: StationOwners | None = None,
+        remote_reports: RemoteReports | None = None,
+        topology: AirOSTopology | None = None,
     ) -> None:
         """Initialize the coordinator."""
         self.airos_device = airos_device
+        self.snapshot = snapshot
+        # Data restored from the snapshot, replaced by the first live update
+        self.stale = False
+        self.scheduler = scheduler or AirOSPollScheduler()
+        self.instrumentation = instrumentation or PollInstrumentation()
+        self.breaker = CircuitBreaker()
+        self._start_offset = self.scheduler.start_offset()
+        self.poll_count = 0
+        self.stations: dict[str, Station] = {}
+        self.new_stations: set[str] = set()
+        self.station_metrics: dict[str, StationMetrics] = {}
+        self._station_rates = StationRateTracker()
+        # MAC and health of the stations with the least healthy links
+        self.worst_stations: list[tuple[str, int]] = []
+        self.station_history = StationHistory()
+        self.station_events = StationEvents(
+            hass, config_entry.entry_id, station_owners or StationOwners()
+        )
+        # Stations of the previous live poll, None until the first one
+        self._live_stations: dict[str, Station] | None = None
+        # Interfaces keep their last state while no entity decodes them
+        self.interface_states: dict[str, InterfaceState] = {}
+        self.new_interfaces: set[str] = set()
+        self._seen_interfaces: set[str] = set()
+        self.remote_reports = remote_reports or RemoteReports()
+        self.topology = topology or AirOSTopology()
+        self.use_remote_report = config_entry.options.get(CONF_REMOTE_REPORT, False)
+        self.remote_report_count = 0
+        self._last_direct_poll: float | None = None
+        self.long_term_statistics: StationStatistics | None = None
+        if config_entry.options.get(CONF_STATION_STATISTICS):
+            self.long_term_statistics = StationStatistics(
+                hass, config_entry.entry_id, str(config_entry.unique_id)
+            )
+        # Data of every listener context on the previous update
+        self._context_values: dict[UpdateContext, Any] = {}
+        # Contexts changed by the latest update, None when all listeners update
+        self._changed_contexts: set[UpdateContext] | None = None
+        # Projection fields required by the enabled entities, all fields are
+        # decoded until the entities are added
+        self._required_fields: Counter[str] = Counter()
+        self._projecting = False
+        self._dispatch_all = False
+        self.notified_count = 0
+        self.skipped_count = 0
+        self._seen_stations: set[str] = set()
+        self.poll_interval = AdaptivePollInterval(
+            minimum=timedelta(
+                seconds=config_entry.options.get(
+                    CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+                )
+            ),
+            maximum=timedelta(
+                seconds=config_entry.options.get(
+                    CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                )
+            ),
+            initial=SCAN_INTERVAL,
+        )
         super().__init__(
             hass,
             _LOGGER,
             config_entry=config_entry,
             name=DOMAIN,
-            update_interval=SCAN_INTERVAL,
+            update_interval=self.poll_interval.interval,
         )
 
+    @callback
+    def async_require_fields(self, fields: Collection[str]) -> CALLBACK_TYPE:
+        """Decode the given projection fields until the callback is called."""
+        self._required_fields.update(fields)
+
+        @callback
+        def _async_release() -> None:
+            self._required_fields.subtract(fields)
+
+        return _async_release
+
+    @callback
+    def async_start_projection(self) -> None:
+        """Decode only the fields required by entities from now on."""
+        self._projecting = True
+
+    @property
+    def projection(self) -> frozenset[str] | None:
+        """Return the projection fields to decode from a status, None for all."""
+        if not self._projecting:
+            return None
+        return frozenset(+self._required_fields)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners, timing the fan-out to the entities."""
+        with self.instrumentation.measure("dispatch"):
+            self._changed_contexts = self._async_changed_contexts()
+            super().async_update_listeners()
+
+    @callback
+    def _async_changed_contexts(self) -> set[UpdateContext] | None:
+        """Diff the data of every listener context, None when all changed."""
+        if not self.last_update_success:
+            # Recovering from a failure needs every entity to become available again
+            self._dispatch_all = True
+            return None
+
+        values = {
+            context: self.context_value(context)
+            for context in set(self.async_contexts())
+        }
+        changed = {
+            context
+            for context, value in values.items()
+            if self._context_values.get(context, _UNSET) != value
+        }
+        self._context_values = values
+
+        if self._dispatch_all:
+            self._dispatch_all = False
+            return None
+        return changed
+
+    def context_value(self, context: UpdateContext) -> Any:
+        """Return the coordinator data a listener context depends on."""
+        kind, key, *metric = context
+        if kind == CONTEXT_DATA:
+            return key(self.data)
+        if kind == CONTEXT_INTERFACE:
+            return self.interface_states.get(key, _GONE)
+        if (station := self.stations.get(key)) is None:
+            return _GONE
+        if not metric:
+            # The station itself, shown by the hostname of the remote
+            return station.remote.hostname
+        value = self.station_metrics[key].get(metric[0])
+        if metric[0] in HISTORY_METRICS:
+            # The rolling statistics shown with the value slide on every poll
+            return value, self.station_history.statistics(key, metric[0])
+        return value
+
+    @callback
+    def context_changed(self, context: UpdateContext | None) -> bool:
+        """Return whether the latest update changed the data of a context."""
+        if (
+            context is None
+            or self._changed_contexts is None
+            or context in self._changed_contexts
+        ):
+            self.notified_count += 1
+            return True
+        self.skipped_count += 1
+        return False
+
+    async def async_delayed_first_refresh(self) -> None:
+        """Refresh after the start offset, so the fleet does not poll in phase."""
+        offset, self._start_offset = self._start_offset, 0
+        await asyncio.sleep(offset)
+        await self.async_refresh()
+
+    @callback
+    def async_restore(self, data: AirOSData) -> None:
+        """Start from a stored status, entities stay unavailable until live data."""
+        self.data = data
+        self.stale = True
+        self.last_update_success = False
+        self._dispatch_all = True
+        self._process(data, live=False)
+
+    async def _async_fetch_status(self) -> AirOSData:
+        """Fetch status, the client reuses its session and logs in when needed."""
+        self.poll_count += 1
+        return await self.airos_device.status(keep=self.projection)
+
+    async def _async_poll(self) -> AirOSData:
+        """Fetch status within a scheduler slot, counting failures by class."""
+        try:
+            async with self.scheduler.slot():
+                data = await self._async_fetch_status()
+        except (DeviceConnectionError, TimeoutError) as err:
+            self.instrumentation.record_failure(err)
+            self.breaker.record_failure(time.monotonic())
+            raise
+        except Exception as err:
+            self.instrumentation.record_failure(err)
+            # The device answered, so it is reachable
+            self.breaker.record_success()
+            raise
+        self.breaker.record_success()
+        return data
+
     async def _async_update_data(self) -> AirOSData:
         """Fetch data from AirOS."""
+        self.new_stations = set()
+        self.new_interfaces = set()
+        now = time.monotonic()
+        data = self._remote_report_data(now)
+        if reported := data is not None:
+            self.remote_report_count += 1
+        else:
+            data = await self._async_poll_directly(now)
+
+        with self.instrumentation.measure("process"):
+            self._process(data, reported=reported)
+            # A report carries the stations of the last direct poll again
+            if self.long_term_statistics is not None and not reported:
+                self.long_term_statistics.async_add(
+                    self.stations, self.station_metrics, dt_util.utcnow()
+                )
+        self.instrumentation.record_success()
+        self.stale = False
+        if (
+            self.snapshot is not None
+            and (response := self.airos_device.last_response) is not None
+        ):
+            self.snapshot.async_schedule_save(response)
+
+        self.update_interval = self.poll_interval.update(data)
+        if self._start_offset:
+            # A device set up without a stored status polled right away,
+            # shift its second poll instead
+            self.update_interval += timedelta(seconds=self._start_offset)
+            self._start_offset = 0
+        return data
+
+    async def _async_poll_directly(self, now: float) -> AirOSData:
+        """Poll the device itself, unless the breaker holds polls back."""
+        if not self.breaker.allow_request(now):
+            # Skip the poll rather than wait for another timeout
+            self.update_interval = (
+                self.breaker.time_until_probe(now) or self.breaker.backoff
+            )
+            raise UpdateFailed(
+                translation_domain=DOMAIN, translation_key="device_unreachable"
+            )
         try:
-            await self.airos_device.login()
-            return await self.airos_device.status()
+            data = await self._async_poll()
         except (ConnectionAuthenticationError,) as err:
+            self.airos_device.invalidate_session()
             _LOGGER.exception("Error authenticating with airOS device")
-            raise ConfigEntryError(
+            raise ConfigEntryAuthFailed(
                 translation_domain=DOMAIN, translation_key="invalid_auth"
             ) from err
         except (ConnectionSetupError, DeviceConnectionError, TimeoutError) as err:
-            _LOGGER.error("Error connecting to airOS device: %s", err)
+            self.airos_device.invalidate_session()
+            if self.breaker.is_open:
+                # Back off until the breaker lets the next probe through
+                self.update_interval = self.breaker.backoff
+                _LOGGER.warning(
+                    "airOS device unreachable, next attempt in %s: %s",
+                    self.breaker.backoff,
+                    err,
+                )
+            else:
+                _LOGGER.error("Error connecting to airOS device: %s", err)
             raise UpdateFailed(
                 translation_domain=DOMAIN,
                 translation_key="cannot_connect",
             ) from err
         except (DataMissingError,) as err:
+            self.airos_device.invalidate_session()
             _LOGGER.error("Expected data not returned by airOS device: %s", err)
             raise UpdateFailed(
                 translation_domain=DOMAIN,
                 translation_key="error_data_missing",
             ) from err
+        self._last_direct_poll = now
+        return data
+
+    @property
+    def remote_report_max_age(self) -> float:
+        """Return the seconds the station reports of this device stay usable.
+
+        The next report is due one interval later, or at most one and a half
+        when the interval backs off, and may start late by the poll jitter.
+        """
+        interval = self.update_interval or self.poll_interval.interval
+        return 2 * interval.total_seconds() + self.scheduler.jitter
+
+    def _remote_report_data(self, now: float) -> AirOSData | None:
+        """Return the status as reported by the access point, None to poll."""
+        if (
+            not self.use_remote_report
+            or self._last_direct_poll is None
+            # Stations and interfaces are only known from polling the device
+            or now - self._last_direct_poll > REMOTE_REPORT_DIRECT_POLL.total_seconds()
+        ):
+            return None
+        remote = self.remote_reports.get(str(self.config_entry.unique_id), now)
+        if remote is None:
+            # The access point stopped reporting this device, poll it directly
+            return None
+        return apply_remote_report(self.data, remote)
+
+    def _process(
+        self, data: AirOSData, live: bool = True, reported: bool = False
+    ) -> None:
+        """Derive the station and interface data entities read from a status.
+
+        A status reported by the access point carries the stations of the last
+        direct poll, which keep their rates and are not added to the history.
+        """
+        previous_metrics = self.station_metrics
+        # Index stations by lower case MAC for constant time entity lookups
+        self.stations = {station.mac.lower(): station for station in data.wireless.sta}
+        # Stations never seen before need entities, returning ones already have them
+        self.new_stations = self.stations.keys() - self._seen_stations
+        self._seen_stations |= self.new_stations
+        self.topology.async_update(self.config_entry.entry_id, data, self.stations)
+        self.station_metrics = extract_station_metrics(self.stations)
+        if (keep := self.projection) is None or "interfaces" in keep:
+            self.interface_states = extract_interface_states(data.interfaces)
+            self.new_interfaces = self.interface_states.keys() - self._seen_interfaces
+            self._seen_interfaces |= self.new_interfaces
+        if reported:
+            for mac, metrics in self.station_metrics.items():
+                previous = previous_metrics.get(mac, {})
+                metrics.update(
+                    {metric: previous.get(metric) for metric in RATE_METRICS}
+                )
+        elif live:
+            for mac, rates in self._station_rates.update(
+                self.stations, time.monotonic()
+            ).items():
+                self.station_metrics[mac].update(rates)
+        else:
+            # Rates and history need consecutive live samples
+            for metrics in self.station_metrics.values():
+                metrics.update(dict.fromkeys(RATE_METRICS))
+        # All stations are scored in one pass, entities only read the result
+        health = score_stations(self.stations, self.station_metrics)
+        for mac, score in health.items():
+            self.station_metrics[mac]["health"] = score
+        self.worst_stations = heapq.nsmallest(
+            HEALTH_WORST_COUNT, health.items(), key=itemgetter(1)
+        )
+        if not live or reported:
+            return
+        self.station_history.update(self.station_metrics)
+        self.remote_reports.update(
+            self.config_entry.entry_id,
+            self.stations,
+            time.monotonic(),
+            self.remote_report_max_age,
+        )
+        self.station_events.async_update(
+            self._live_stations, self.stations, data.wireless.sta_disconnected
+        )
+        self._live_stations = self.stations
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
+import json
 from typing import Any
 
-from homeassistant.components.diagnostics import async_redact_data
+from airos.exceptions import KeyDataMissingError
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
 from homeassistant.const import CONF_HOST, CONF_PASSWORD
 from homeassistant.core import HomeAssistant
 
+from .client import decode_status
 from .coordinator import AirOSConfigEntry
+from .history import HISTORY_METRICS
+from .models import AIROS_DATA
 
 IP_REDACT = ["addr", "ipaddr", "ip6addr", "lastip"]  # IP related
 HW_REDACT = ["apmac", "hwaddr", "mac"]  # MAC address
@@ -24,11 +31,108 @@ TO_REDACT_AIROS = [
 ]
 
 
-async def async_get_config_entry_diagnostics(
+class Redactor:
+    """Redact keys from nested data in a single pass.
+
+    The keys are compiled into a set once, every call walks the data once,
+    copying only dicts and lists and skipping empty values like
+    async_redact_data does.
+    """
+
+    __slots__ = ("_keys",)
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        """Initialize the redactor."""
+        self._keys = frozenset(keys)
+
+    def __call__(self, data: Any) -> Any:
+        """Return a redacted copy of the data."""
+        if isinstance(data, Mapping):
+            keys = self._keys
+            return {
+                key: (
+                    REDACTED
+                    if key in keys and value is not None and value != ""
+                    else self(value)
+                    if isinstance(value, (Mapping, list))
+                    else value
+                )
+                for key, value in data.items()
+            }
+        if isinstance(data, list):
+            return [self(item) for item in data]
+        return data
+
+
+redact_airos = Redactor(TO_REDACT_AIROS)
+
+
+def _full_status(response: str) -> dict[str, Any]:
+    """Decode a status response in full, raw when a field does not decode."""
+    try:
+        return decode_status(response).to_dict()
+    except KeyDataMissingError:
+        # Polls skip the fields no entity reads, those can still be invalid
+        return json.loads(response)
+
+
+async def async_entry_diagnostics(
     hass: HomeAssistant, entry: AirOSConfigEntry
 ) -> dict[str, Any]:
-    """Return diagnostics for a config entry."""
+    """Return the redacted diagnostics of a loaded config entry."""
+    coordinator = entry.runtime_data
+    if (response := coordinator.airos_device.last_response) is not None:
+        # Polls leave out fields no entity reads, diagnostics show them all
+        data = await hass.async_add_executor_job(_full_status, response)
+    else:
+        # Restored from the snapshot, which is decoded in full
+        data = coordinator.data.to_dict()
     return {
         "entry_data": async_redact_data(entry.data, TO_REDACT_HA),
-        "data": async_redact_data(entry.runtime_data.data.to_dict(), TO_REDACT_AIROS),
+        "data": redact_airos(data),
+        "projection": sorted(coordinator.projection or ()),
+        "remote_report": {
+            "enabled": coordinator.use_remote_report,
+            "used": coordinator.remote_report_count,
+        },
+        "session": {
+            "logins": coordinator.airos_device.login_count,
+            "relogins": coordinator.airos_device.relogin_count,
+            "polls": coordinator.poll_count,
+        },
+        "scheduler": coordinator.scheduler.as_dict(),
+        "connections": hass.data[AIROS_DATA].connections.as_dict(),
+        "stale": coordinator.stale,
+        "dispatch": {
+            "notified": coordinator.notified_count,
+            "skipped": coordinator.skipped_count,
+        },
+        "timing": coordinator.instrumentation.as_dict(),
+        "breaker": coordinator.breaker.as_dict(),
+        "events": redact_airos(list(coordinator.station_events.log)),
     }
+
+
+def entry_history(entry: AirOSConfigEntry) -> list[dict[str, Any]]:
+    """Return the redacted rolling statistics of the connected stations."""
+    coordinator = entry.runtime_data
+    history = coordinator.station_history
+    return redact_airos(
+        [
+            {
+                "mac": mac,
+                **{
+                    metric: history.statistics(mac, metric)
+                    for metric in HISTORY_METRICS
+                },
+            }
+            for mac in coordinator.stations
+        ]
+    )
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: AirOSConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    return await async_entry_diagnostics(hass, entry)
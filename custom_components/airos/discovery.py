@@ -0,0 +1,187 @@
+"""Subnet discovery of airOS devices."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+import ipaddress
+import logging
+import struct
+
+import aiohttp
+
+from .const import DISCOVERY_PORT, DISCOVERY_TIMEOUT, PROBE_TIMEOUT, SCAN_CONCURRENCY
+
+_LOGGER = logging.getLogger(__name__)
+
+# Version 1 discovery request of the Ubiquiti discovery protocol
+DISCOVERY_REQUEST = b"\x01\x00\x00\x00"
+
+# Fields of a discovery response, each sent as type, length and value
+_FIELD_IPINFO = 0x02
+_FIELD_FWVERSION = 0x03
+_FIELD_HOSTNAME = 0x0B
+_FIELD_PLATFORM = 0x0C
+_FIELD_MODEL = 0x14
+
+_HEADER = struct.Struct("!BBH")
+_FIELD = struct.Struct("!BH")
+
+# The airOS web interface sets a session cookie with this prefix, and names
+# itself on its login page
+_AIROS_COOKIE_PREFIX = "AIROS_"
+_AIROS_PAGE_MARKER = b"airos"
+_PAGE_READ_LIMIT = 65536
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveredDevice:
+    """A device answering on the scanned subnet."""
+
+    host: str
+    hostname: str | None = None
+    model: str | None = None
+    mac: str | None = None
+    firmware: str | None = None
+
+
+@dataclass(slots=True)
+class ScanResult:
+    """The hosts found on a scanned subnet."""
+
+    # Hosts confirmed to run airOS, the only ones to send credentials to
+    devices: dict[str, DiscoveredDevice] = field(default_factory=dict)
+    # Hosts with a web server that does not look like airOS
+    unknown: list[str] = field(default_factory=list)
+
+
+def parse_discovery_response(host: str, packet: bytes) -> DiscoveredDevice | None:
+    """Parse a discovery response, None when it is not one."""
+    if len(packet) < _HEADER.size:
+        return None
+    version, _command, length = _HEADER.unpack_from(packet)
+    if version != 1 or length == 0:
+        return None
+
+    fields: dict[int, bytes] = {}
+    offset = _HEADER.size
+    end = min(len(packet), _HEADER.size + length)
+    while offset + _FIELD.size <= end:
+        field, size = _FIELD.unpack_from(packet, offset)
+        offset += _FIELD.size
+        # Keep the first value, devices repeat the IP info for every interface
+        fields.setdefault(field, packet[offset : offset + size])
+        offset += size
+
+    def _text(field: int) -> str | None:
+        value = fields.get(field)
+        return value.decode("utf-8", "replace") if value else None
+
+    mac = None
+    if len(ipinfo := fields.get(_FIELD_IPINFO, b"")) >= 6:
+        mac = ":".join(f"{byte:02x}" for byte in ipinfo[:6])
+    return DiscoveredDevice(
+        host=host,
+        hostname=_text(_FIELD_HOSTNAME),
+        model=_text(_FIELD_MODEL) or _text(_FIELD_PLATFORM),
+        mac=mac,
+        firmware=_text(_FIELD_FWVERSION),
+    )
+
+
+class _DiscoveryProtocol(asyncio.DatagramProtocol):
+    """Collect discovery responses by sending host."""
+
+    def __init__(self) -> None:
+        """Initialize the protocol."""
+        self.devices: dict[str, DiscoveredDevice] = {}
+
+    def datagram_received(self, data: bytes, addr: tuple[str | int, ...]) -> None:
+        """Keep the first response of every host."""
+        host = str(addr[0])
+        if host not in self.devices and (
+            device := parse_discovery_response(host, data)
+        ):
+            self.devices[host] = device
+
+    def error_received(self, exc: Exception) -> None:
+        """Ignore unreachable hosts."""
+        _LOGGER.debug("Discovery request failed: %s", exc)
+
+
+async def async_discover(
+    hosts: Iterable[str], timeout: float = DISCOVERY_TIMEOUT.total_seconds()
+) -> dict[str, DiscoveredDevice]:
+    """Send a discovery request to every host, collecting answers until timeout."""
+    loop = asyncio.get_running_loop()
+    transport, protocol = await loop.create_datagram_endpoint(
+        _DiscoveryProtocol, local_addr=("0.0.0.0", 0)
+    )
+    try:
+        # Unicast requests, unlike a broadcast, also reach routed subnets
+        for host in hosts:
+            transport.sendto(DISCOVERY_REQUEST, (host, DISCOVERY_PORT))
+        await asyncio.sleep(timeout)
+    finally:
+        transport.close()
+    return protocol.devices
+
+
+async def async_fingerprint(
+    session: aiohttp.ClientSession,
+    host: str,
+    timeout: float = PROBE_TIMEOUT.total_seconds(),
+) -> bool | None:
+    """Return whether the web interface of a host is airOS, None without one.
+
+    Only the login page is requested, no credentials are sent.
+    """
+    try:
+        async with (
+            asyncio.timeout(timeout),
+            session.get(f"https://{host}/", allow_redirects=True) as response,
+        ):
+            if any(
+                cookie.startswith(_AIROS_COOKIE_PREFIX) for cookie in response.cookies
+            ):
+                return True
+            page = await response.content.read(_PAGE_READ_LIMIT)
+    except (aiohttp.ClientError, OSError, TimeoutError):
+        return None
+    return _AIROS_PAGE_MARKER in page.lower()
+
+
+async def async_scan(
+    subnet: ipaddress.IPv4Network | ipaddress.IPv6Network,
+    session: aiohttp.ClientSession,
+    concurrency: int = SCAN_CONCURRENCY,
+) -> ScanResult:
+    """Find the airOS devices on a subnet.
+
+    Devices answering the discovery protocol are found in one round trip.
+    As the discovery service can be disabled on airOS, the remaining hosts
+    are probed for the airOS login page with bounded concurrency. Hosts
+    with another web server are returned as unknown.
+    """
+    hosts = [str(address) for address in subnet.hosts()]
+    try:
+        devices = await async_discover(hosts)
+    except OSError as err:
+        _LOGGER.debug("Discovery protocol unavailable: %s", err)
+        devices = {}
+
+    result = ScanResult(devices)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _async_probe(host: str) -> None:
+        async with semaphore:
+            airos = await async_fingerprint(session, host)
+        if airos:
+            result.devices[host] = DiscoveredDevice(host=host)
+        elif airos is not None:
+            result.unknown.append(host)
+
+    await asyncio.gather(*(_async_probe(host) for host in hosts if host not in devices))
+    result.unknown.sort(key=ipaddress.ip_address)
+    return result
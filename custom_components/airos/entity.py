@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+from airos.data import Station
+
 from homeassistant.const import CONF_HOST
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
-from .coordinator import AirOSDataUpdateCoordinator
+from .const import DOMAIN, ETHERNET_PREFIX, MANUFACTURER
+from .coordinator import CONTEXT_INTERFACE, CONTEXT_STATION, AirOSDataUpdateCoordinator
+from .helpers import get_client_device_info
+from .interfaces import InterfaceState
 
 
 class AirOSEntity(CoordinatorEntity[AirOSDataUpdateCoordinator]):
     """Represent a AirOS Entity."""
 
     _attr_has_entity_name = True
+    # Projection fields of the status this entity reads
+    _projection_fields: frozenset[str] = frozenset()
 
     def __init__(self, coordinator: AirOSDataUpdateCoordinator) -> None:
         """Initialise the gateway."""
@@ -33,3 +40,72 @@ class AirOSEntity(CoordinatorEntity[AirOSDataUpdateCoordinator]):
             name=airos_data.host.hostname,
             sw_version=airos_data.host.fwversion,
         )
+
+    async def async_added_to_hass(self) -> None:
+        """Register for coordinator updates and the fields this entity reads."""
+        await super().async_added_to_hass()
+        if self._projection_fields:
+            self.async_on_remove(
+                self.coordinator.async_require_fields(self._projection_fields)
+            )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the data behind the listener context changed."""
+        if self.coordinator.context_changed(self.coordinator_context):
+            super()._handle_coordinator_update()
+
+
+class AirOSStationEntity(AirOSEntity):
+    """Represent an AirOS Entity for a connected station."""
+
+    def __init__(self, coordinator: AirOSDataUpdateCoordinator, mac: str) -> None:
+        """Initialise the station entity."""
+        super().__init__(coordinator)
+
+        self._mac = mac.lower()
+        self.coordinator_context = (CONTEXT_STATION, self._mac)
+        self._attr_device_info = get_client_device_info(
+            coordinator, coordinator.stations[self._mac]
+        )
+
+    @property
+    def station(self) -> Station | None:
+        """Return the current data of the station, None when disconnected."""
+        return self.coordinator.stations.get(self._mac)
+
+    @property
+    def available(self) -> bool:
+        """Return if the station is still connected."""
+        return super().available and self._mac in self.coordinator.stations
+
+
+class AirOSInterfaceEntity(AirOSEntity):
+    """Represent an AirOS Entity for a network interface of the device."""
+
+    _projection_fields = frozenset({"interfaces"})
+
+    def __init__(self, coordinator: AirOSDataUpdateCoordinator, ifname: str) -> None:
+        """Initialise the interface entity."""
+        super().__init__(coordinator)
+
+        self._ifname = ifname
+        self.coordinator_context = (CONTEXT_INTERFACE, ifname)
+        self._attr_translation_placeholders = {"interface": ifname}
+
+    @property
+    def interface(self) -> InterfaceState | None:
+        """Return the current state of the interface, None when it is gone."""
+        return self.coordinator.interface_states.get(self._ifname)
+
+    @property
+    def available(self) -> bool:
+        """Return if the interface is still reported by the device."""
+        return super().available and self._ifname in self.coordinator.interface_states
+
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        """Only enable the entities of wired ports by default."""
+        return super().entity_registry_enabled_default and self._ifname.startswith(
+            ETHERNET_PREFIX
+        )
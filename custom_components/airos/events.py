@@ -0,0 +1,127 @@
+"""Station association events of airOS devices."""
+
+from __future__ import annotations
+
+from collections import deque
+import time
+from typing import Any
+
+from airos.data import Station
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    EVENT_LOG_SIZE,
+    EVENT_STATION_CONNECTED,
+    EVENT_STATION_DISCONNECTED,
+    EVENT_STATION_ROAMED,
+    ROAM_WINDOW,
+)
+
+
+class StationOwners:
+    """Track the device every station was last connected to, across devices."""
+
+    def __init__(self) -> None:
+        """Initialize the owners."""
+        # Config entry a station is connected to, with the time it left or None
+        self._owners: dict[str, tuple[str, float | None]] = {}
+
+    def claim(self, mac: str, entry_id: str, now: float) -> str | None:
+        """Record a station connecting, returning the entry it roamed from."""
+        previous = self._owners.get(mac)
+        self._owners[mac] = (entry_id, None)
+        if previous is None:
+            return None
+        previous_entry_id, left = previous
+        if previous_entry_id == entry_id:
+            return None
+        if left is not None and now - left > ROAM_WINDOW.total_seconds():
+            return None
+        return previous_entry_id
+
+    def release(self, mac: str, entry_id: str, now: float) -> None:
+        """Record a station leaving a device."""
+        if (owner := self._owners.get(mac)) is not None and owner[0] == entry_id:
+            self._owners[mac] = (entry_id, now)
+
+
+def _disconnect_info(mac: str, disconnected: list[Any]) -> dict[str, Any] | None:
+    """Return what the device reported on a station it lost, if anything."""
+    for info in disconnected:
+        if isinstance(info, dict) and str(info.get("mac", "")).lower() == mac:
+            return info
+    return None
+
+
+class StationEvents:
+    """Fire events for stations associating with and leaving a device.
+
+    Consecutive polls are compared as sets of MACs, so only the stations that
+    changed cost anything. The latest events are kept for diagnostics.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        owners: StationOwners,
+        size: int = EVENT_LOG_SIZE,
+    ) -> None:
+        """Initialize the events of a device."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._owners = owners
+        self.log: deque[dict[str, Any]] = deque(maxlen=size)
+
+    @callback
+    def async_update(
+        self,
+        previous: dict[str, Station] | None,
+        current: dict[str, Station],
+        disconnected: list[Any],
+    ) -> None:
+        """Compare the stations of consecutive polls, None for the first poll."""
+        now = time.monotonic()
+        if previous is None:
+            # Stations already connected at startup did not just associate
+            for mac in current:
+                self._owners.claim(mac, self._entry_id, now)
+            return
+
+        for mac in current.keys() - previous.keys():
+            data = self._event_data(mac, current[mac])
+            self._async_fire(EVENT_STATION_CONNECTED, data)
+            if (
+                roamed_from := self._owners.claim(mac, self._entry_id, now)
+            ) is not None:
+                self._async_fire(
+                    EVENT_STATION_ROAMED, {**data, "from_config_entry_id": roamed_from}
+                )
+
+        for mac in previous.keys() - current.keys():
+            self._owners.release(mac, self._entry_id, now)
+            data = self._event_data(mac, previous[mac])
+            if (info := _disconnect_info(mac, disconnected)) is not None:
+                data["disconnect_info"] = info
+            self._async_fire(EVENT_STATION_DISCONNECTED, data)
+
+    def _event_data(self, mac: str, station: Station) -> dict[str, Any]:
+        """Return the event data of a station."""
+        return {
+            "config_entry_id": self._entry_id,
+            "mac": mac,
+            "hostname": station.remote.hostname,
+            "signal": station.signal,
+            "uptime": station.uptime,
+            "last_disc": station.last_disc,
+        }
+
+    @callback
+    def _async_fire(self, event_type: str, data: dict[str, Any]) -> None:
+        """Fire an event on the bus and keep it in the log."""
+        self._hass.bus.async_fire(event_type, data)
+        self.log.append(
+            {"event": event_type, "time": dt_util.utcnow().isoformat(), **data}
+        )
@@ -0,0 +1,214 @@
+"""Link health scoring of airOS stations."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from airos.data import Station
+
+from .stations import StationMetrics
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Weight of every component in the health of a link, adding up to 1
+HEALTH_WEIGHTS: dict[str, float] = {
+    "signal": 0.25,
+    "linkscore": 0.3,
+    "capacity": 0.15,
+    "retries": 0.2,
+    "chains": 0.1,
+}
+
+# Signal below the expected signal, in dB, scoring zero
+SIGNAL_SHORTFALL_RANGE = 10.0
+# Difference between the receive chains, in dB, scoring zero
+CHAIN_IMBALANCE_RANGE = 10.0
+# Share of the expected capacity in use before the link counts as congested
+CAPACITY_HEADROOM = 0.5
+# Retry ratio, in percent, scoring zero
+RETRY_RATIO_RANGE = 20.0
+
+# Columns read from every station, scored together in one pass
+COLUMNS = (
+    "signal",
+    "remote_signal",
+    "ul_signal_expect",
+    "dl_signal_expect",
+    "chain0_rssi",
+    "chain1_rssi",
+    "ul_throughput",
+    "dl_throughput",
+    "ul_capacity_expect",
+    "dl_capacity_expect",
+    "ul_linkscore",
+    "dl_linkscore",
+    "ul_avg_linkscore",
+    "dl_avg_linkscore",
+    "retry_ratio",
+)
+
+type Columns = dict[str, list[float]]
+
+
+def build_columns(
+    stations: Iterable[Station], station_metrics: Iterable[StationMetrics]
+) -> Columns:
+    """Lay out the scored fields of all stations as one column per field."""
+    columns: Columns = {column: [] for column in COLUMNS}
+    append = [columns[column].append for column in COLUMNS]
+    for station, metrics in zip(stations, station_metrics, strict=True):
+        chainrssi = station.chainrssi
+        remote = station.remote
+        row = (
+            station.signal,
+            remote.signal,
+            station.ul_signal_expect,
+            station.dl_signal_expect,
+            chainrssi[0] if len(chainrssi) > 1 else 0,
+            chainrssi[1] if len(chainrssi) > 1 else 0,
+            # The transmit throughput of the remote is the uplink
+            remote.tx_throughput,
+            remote.rx_throughput,
+            station.ul_capacity_expect,
+            station.dl_capacity_expect,
+            station.ul_linkscore,
+            station.dl_linkscore,
+            station.ul_avg_linkscore,
+            station.dl_avg_linkscore,
+            metrics.get("retry_ratio") or 0,
+        )
+        for add, value in zip(append, row, strict=True):
+            add(value)
+    return columns
+
+
+def _clip(value: float) -> float:
+    """Limit a score to between 0 and 1."""
+    return min(max(value, 0.0), 1.0)
+
+
+def _score_python(columns: Columns) -> list[int]:
+    """Score the stations one by one."""
+    scores: list[int] = []
+    for (
+        signal,
+        remote_signal,
+        ul_signal_expect,
+        dl_signal_expect,
+        chain0,
+        chain1,
+        ul_throughput,
+        dl_throughput,
+        ul_capacity,
+        dl_capacity,
+        ul_linkscore,
+        dl_linkscore,
+        ul_avg_linkscore,
+        dl_avg_linkscore,
+        retry_ratio,
+    ) in zip(*(columns[column] for column in COLUMNS), strict=True):
+        # An expected signal of zero means the device has no expectation
+        shortfall = max(
+            ul_signal_expect - signal if ul_signal_expect else 0,
+            dl_signal_expect - remote_signal if dl_signal_expect else 0,
+            0,
+        )
+        imbalance = abs(chain0 - chain1) if chain0 and chain1 else 0
+        utilization = max(
+            ul_throughput / ul_capacity if ul_capacity else 0,
+            dl_throughput / dl_capacity if dl_capacity else 0,
+        )
+        # A linkscore below its average is trending down
+        drop = max(ul_avg_linkscore - ul_linkscore, dl_avg_linkscore - dl_linkscore, 0)
+        health = (
+            HEALTH_WEIGHTS["signal"] * _clip(1 - shortfall / SIGNAL_SHORTFALL_RANGE)
+            + HEALTH_WEIGHTS["linkscore"]
+            * _clip((min(ul_linkscore, dl_linkscore) - drop) / 100)
+            + HEALTH_WEIGHTS["capacity"]
+            * _clip((1 - utilization) / (1 - CAPACITY_HEADROOM))
+            + HEALTH_WEIGHTS["retries"] * _clip(1 - retry_ratio / RETRY_RATIO_RANGE)
+            + HEALTH_WEIGHTS["chains"] * _clip(1 - imbalance / CHAIN_IMBALANCE_RANGE)
+        )
+        scores.append(round(health * 100))
+    return scores
+
+
+def _score_numpy(columns: Columns) -> list[int]:
+    """Score all stations at once with array operations."""
+    col = {column: np.asarray(columns[column], dtype=float) for column in COLUMNS}
+
+    def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        return np.divide(
+            numerator,
+            denominator,
+            out=np.zeros_like(numerator),
+            where=denominator != 0,
+        )
+
+    shortfall = np.maximum.reduce(
+        [
+            np.where(
+                col["ul_signal_expect"] != 0,
+                col["ul_signal_expect"] - col["signal"],
+                0,
+            ),
+            np.where(
+                col["dl_signal_expect"] != 0,
+                col["dl_signal_expect"] - col["remote_signal"],
+                0,
+            ),
+            np.zeros_like(col["signal"]),
+        ]
+    )
+    imbalance = np.where(
+        (col["chain0_rssi"] != 0) & (col["chain1_rssi"] != 0),
+        np.abs(col["chain0_rssi"] - col["chain1_rssi"]),
+        0,
+    )
+    utilization = np.maximum(
+        _ratio(col["ul_throughput"], col["ul_capacity_expect"]),
+        _ratio(col["dl_throughput"], col["dl_capacity_expect"]),
+    )
+    drop = np.maximum.reduce(
+        [
+            col["ul_avg_linkscore"] - col["ul_linkscore"],
+            col["dl_avg_linkscore"] - col["dl_linkscore"],
+            np.zeros_like(col["signal"]),
+        ]
+    )
+    health = (
+        HEALTH_WEIGHTS["signal"] * np.clip(1 - shortfall / SIGNAL_SHORTFALL_RANGE, 0, 1)
+        + HEALTH_WEIGHTS["linkscore"]
+        * np.clip(
+            (np.minimum(col["ul_linkscore"], col["dl_linkscore"]) - drop) / 100, 0, 1
+        )
+        + HEALTH_WEIGHTS["capacity"]
+        * np.clip((1 - utilization) / (1 - CAPACITY_HEADROOM), 0, 1)
+        + HEALTH_WEIGHTS["retries"]
+        * np.clip(1 - col["retry_ratio"] / RETRY_RATIO_RANGE, 0, 1)
+        + HEALTH_WEIGHTS["chains"]
+        * np.clip(1 - imbalance / CHAIN_IMBALANCE_RANGE, 0, 1)
+    )
+    return np.rint(health * 100).astype(int).tolist()
+
+
+def score_columns(columns: Columns) -> list[int]:
+    """Return the 0 to 100 health of every station in the columns."""
+    if np is None:
+        return _score_python(columns)
+    return _score_numpy(columns)
+
+
+def score_stations(
+    stations: dict[str, Station], station_metrics: dict[str, StationMetrics]
+) -> dict[str, int]:
+    """Return the link health of all stations, by MAC."""
+    if not stations:
+        return {}
+    columns = build_columns(
+        stations.values(), (station_metrics[mac] for mac in stations)
+    )
+    return dict(zip(stations, score_columns(columns), strict=True))
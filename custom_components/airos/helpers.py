@@ -1,20 +1,32 @@
 """Helpers for airOS."""
+
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
 import logging
 
 from airos.data import Station
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import DOMAIN
-from .coordinator import AirOSDataUpdateCoordinator
+from .coordinator import AirOSConfigEntry, AirOSDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-def get_client_device_info(coordinator: AirOSDataUpdateCoordinator, client_data: Station) -> DeviceInfo:
+
+def get_client_device_info(
+    coordinator: AirOSDataUpdateCoordinator, client_data: Station
+) -> DeviceInfo:
     """Generate device info for a client."""
-    remote_type = "Access Point/Uplink" if client_data.remote.mode.value == "ap-ptp" else "Station"
+    remote_type = (
+        "Access Point/Uplink"
+        if client_data.remote.mode.value == "ap-ptp"
+        else "Station"
+    )
 
     mac_lower = client_data.mac.lower()
     unique_id = coordinator.config_entry.unique_id
@@ -26,3 +38,61 @@ def get_client_device_info(coordinator: AirOSDataUpdateCoordinator, client_data:
     if unique_id:
         device_info["via_device"] = (DOMAIN, unique_id)
     return device_info
+
+
+@callback
+def async_add_station_entities(
+    config_entry: AirOSConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+    entity_factory: Callable[[str], Iterable[Entity]],
+) -> None:
+    """Add entities for connected stations, and for every station associating later."""
+    coordinator = config_entry.runtime_data
+
+    async_add_entities(
+        entity for mac in coordinator.stations for entity in entity_factory(mac)
+    )
+
+    @callback
+    def _async_add_new_stations() -> None:
+        """Add entities for stations seen for the first time."""
+        if coordinator.new_stations:
+            async_add_entities(
+                entity
+                for mac in coordinator.new_stations
+                for entity in entity_factory(mac)
+            )
+
+    config_entry.async_on_unload(
+        coordinator.async_add_listener(_async_add_new_stations)
+    )
+
+
+@callback
+def async_add_interface_entities(
+    config_entry: AirOSConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+    entity_factory: Callable[[str], Iterable[Entity]],
+) -> None:
+    """Add entities for the interfaces of the device, and for interfaces appearing later."""
+    coordinator = config_entry.runtime_data
+
+    async_add_entities(
+        entity
+        for ifname in coordinator.interface_states
+        for entity in entity_factory(ifname)
+    )
+
+    @callback
+    def _async_add_new_interfaces() -> None:
+        """Add entities for interfaces seen for the first time."""
+        if coordinator.new_interfaces:
+            async_add_entities(
+                entity
+                for ifname in coordinator.new_interfaces
+                for entity in entity_factory(ifname)
+            )
+
+    config_entry.async_on_unload(
+        coordinator.async_add_listener(_async_add_new_interfaces)
+    )
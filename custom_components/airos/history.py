@@ -0,0 +1,87 @@
+"""Short-window history of station metrics for airOS."""
+
+from __future__ import annotations
+
+from array import array
+import math
+
+from .const import HISTORY_SIZE
+from .stations import StationMetrics
+
+# Station metrics kept in history
+HISTORY_METRICS = ("signal", "dl_linkscore", "ul_linkscore")
+
+type Statistics = dict[str, float]
+
+
+class RingBuffer:
+    """Fixed size circular buffer of integers backed by an array."""
+
+    __slots__ = ("_count", "_index", "_values")
+
+    def __init__(self, size: int) -> None:
+        """Initialize the buffer."""
+        self._values = array("i", bytes(array("i").itemsize * size))
+        self._index = 0
+        self._count = 0
+
+    def append(self, value: int) -> None:
+        """Add a value, overwriting the oldest once the buffer is full."""
+        self._values[self._index] = value
+        self._index = (self._index + 1) % len(self._values)
+        self._count = min(self._count + 1, len(self._values))
+
+    def statistics(self) -> Statistics | None:
+        """Return min, max, mean and 95th percentile of the stored values."""
+        if not self._count:
+            return None
+        values = sorted(self._values[: self._count])
+        return {
+            "min": values[0],
+            "max": values[-1],
+            "mean": round(sum(values) / self._count, 1),
+            # Nearest-rank percentile
+            "p95": values[math.ceil(0.95 * self._count) - 1],
+            "samples": self._count,
+        }
+
+
+class StationHistory:
+    """Keep the last polls of the history metrics for every connected station.
+
+    Memory is bounded by the number of connected stations, buffers of
+    departed stations are dropped.
+    """
+
+    def __init__(self, size: int = HISTORY_SIZE) -> None:
+        """Initialize the history."""
+        self._size = size
+        self._buffers: dict[str, dict[str, RingBuffer]] = {}
+        self._statistics: dict[tuple[str, str], Statistics | None] = {}
+
+    def update(self, station_metrics: dict[str, StationMetrics]) -> None:
+        """Append the metrics of the latest poll."""
+        self._statistics = {}
+        for mac in self._buffers.keys() - station_metrics.keys():
+            del self._buffers[mac]
+
+        for mac, metrics in station_metrics.items():
+            if (buffers := self._buffers.get(mac)) is None:
+                buffers = self._buffers[mac] = {
+                    metric: RingBuffer(self._size) for metric in HISTORY_METRICS
+                }
+            for metric, buffer in buffers.items():
+                if (value := metrics.get(metric)) is not None:
+                    buffer.append(value)
+
+    def statistics(self, mac: str, metric: str) -> Statistics | None:
+        """Return the rolling statistics of a station metric."""
+        key = (mac, metric)
+        if key not in self._statistics:
+            buffers = self._buffers.get(mac)
+            self._statistics[key] = (
+                buffers[metric].statistics()
+                if buffers is not None and metric in buffers
+                else None
+            )
+        return self._statistics[key]
@@ -0,0 +1,104 @@
+"""Per-phase poll instrumentation for airOS."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+import time
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import TIMING_WINDOW
+
+# Phases of a poll, login, request and decode are only reported by AirOSClient
+PHASES = ("login", "request", "decode", "process", "dispatch")
+
+# Upper bounds of the histogram buckets in milliseconds
+BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyHistogram:
+    """Latency histogram over a rolling window of samples."""
+
+    def __init__(self, window: int = TIMING_WINDOW) -> None:
+        """Initialize the histogram."""
+        self._samples: deque[float] = deque(maxlen=window)
+        self._buckets = [0] * (len(BUCKETS_MS) + 1)
+        self.last: float | None = None
+
+    def add(self, duration: float) -> None:
+        """Add a duration in seconds, evicting the oldest once the window is full."""
+        if len(self._samples) == self._samples.maxlen:
+            self._buckets[self._bucket(self._samples[0])] -= 1
+        self._samples.append(duration)
+        self._buckets[self._bucket(duration)] += 1
+        self.last = duration
+
+    @staticmethod
+    def _bucket(duration: float) -> int:
+        """Return the index of the bucket a duration falls in."""
+        return bisect_left(BUCKETS_MS, duration * 1000)
+
+    @property
+    def mean_ms(self) -> float | None:
+        """Return the mean duration of the window in milliseconds."""
+        if not self._samples:
+            return None
+        return round(sum(self._samples) * 1000 / len(self._samples), 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram, durations in milliseconds."""
+        return {
+            "samples": len(self._samples),
+            "last_ms": None if self.last is None else round(self.last * 1000, 1),
+            "avg_ms": self.mean_ms,
+            "max_ms": round(max(self._samples) * 1000, 1) if self._samples else None,
+            "histogram": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(BUCKETS_MS, self._buckets, strict=False)
+                },
+                "le_inf": self._buckets[-1],
+            },
+        }
+
+
+class PollInstrumentation:
+    """Time the phases of a poll and count its failures."""
+
+    def __init__(self, window: int = TIMING_WINDOW) -> None:
+        """Initialize the instrumentation."""
+        self.phases = {phase: LatencyHistogram(window) for phase in PHASES}
+        self.failures: Counter[str] = Counter()
+        self.last_success: datetime | None = None
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Time a phase, failed attempts included."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[phase].add(time.perf_counter() - start)
+
+    def record_failure(self, err: Exception) -> None:
+        """Count a failed poll by exception class."""
+        self.failures[type(err).__name__] += 1
+
+    def record_success(self) -> None:
+        """Remember the time of the last successful poll."""
+        self.last_success = dt_util.utcnow()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return phase histograms, failures and the last success."""
+        return {
+            "phases": {phase: hist.as_dict() for phase, hist in self.phases.items()},
+            "failures": dict(self.failures),
+            "last_success": self.last_success.isoformat()
+            if self.last_success
+            else None,
+        }
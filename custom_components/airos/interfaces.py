@@ -0,0 +1,33 @@
+"""Per-interface state extraction for airOS."""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from airos.data import Interface
+
+
+class InterfaceState(NamedTuple):
+    """The part of an interface status reported by entities."""
+
+    enabled: bool
+    plugged: bool
+    speed: int
+    duplex: bool
+    mtu: int
+
+
+def extract_interface_states(
+    interfaces: list[Interface],
+) -> dict[str, InterfaceState]:
+    """Extract the state of all interfaces in one pass, by interface name."""
+    return {
+        interface.ifname: InterfaceState(
+            enabled=interface.enabled,
+            plugged=interface.status.plugged,
+            speed=interface.status.speed,
+            duplex=interface.status.duplex,
+            mtu=interface.mtu,
+        )
+        for interface in interfaces
+    }
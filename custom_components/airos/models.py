@@ -0,0 +1,28 @@
+"""Models shared by the Ubiquiti airOS integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from homeassistant.util.hass_dict import HassKey
+
+from .connections import AirOSConnectionPool
+from .const import DOMAIN
+from .events import StationOwners
+from .remote import RemoteReports
+from .scheduler import AirOSPollScheduler
+from .topology import AirOSTopology
+
+
+@dataclass
+class AirOSDomainData:
+    """Data shared between all airOS config entries."""
+
+    scheduler: AirOSPollScheduler
+    connections: AirOSConnectionPool
+    station_owners: StationOwners
+    remote_reports: RemoteReports
+    topology: AirOSTopology
+
+
+AIROS_DATA: HassKey[AirOSDomainData] = HassKey(DOMAIN)
@@ -0,0 +1,67 @@
+"""Adaptive poll interval for airOS devices."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from airos.airos8 import AirOSData
+
+# Changes from one poll to the next that count as an unsettled link
+SIGNAL_CHANGE_THRESHOLD = 3  # dBm
+LINKSCORE_CHANGE_THRESHOLD = 5  # percent
+
+# Growth of the interval for each poll without meaningful changes
+BACKOFF_FACTOR = 1.5
+
+type LinkSample = dict[str, tuple[int, int, int]]
+
+
+def _link_sample(data: AirOSData) -> LinkSample:
+    """Return signal and linkscores per station MAC."""
+    return {
+        station.mac: (station.signal, station.dl_linkscore, station.ul_linkscore)
+        for station in data.wireless.sta
+    }
+
+
+def _link_changed(previous: LinkSample, current: LinkSample) -> bool:
+    """Return whether the link changed noticeably between two samples."""
+    if previous.keys() != current.keys():
+        return True
+    for mac, (signal, dl_linkscore, ul_linkscore) in current.items():
+        prev_signal, prev_dl_linkscore, prev_ul_linkscore = previous[mac]
+        if (
+            abs(signal - prev_signal) >= SIGNAL_CHANGE_THRESHOLD
+            or abs(dl_linkscore - prev_dl_linkscore) >= LINKSCORE_CHANGE_THRESHOLD
+            or abs(ul_linkscore - prev_ul_linkscore) >= LINKSCORE_CHANGE_THRESHOLD
+        ):
+            return True
+    return False
+
+
+class AdaptivePollInterval:
+    """Pick the poll interval based on how much the wireless link changes.
+
+    Any noticeable change in station count, signal or linkscore drops the
+    interval to the minimum, every stable poll stretches it towards the maximum.
+    """
+
+    def __init__(
+        self, minimum: timedelta, maximum: timedelta, initial: timedelta
+    ) -> None:
+        """Initialize the poll interval."""
+        self.minimum = minimum
+        self.maximum = maximum
+        self.interval = min(maximum, max(minimum, initial))
+        self._previous: LinkSample | None = None
+
+    def update(self, data: AirOSData) -> timedelta:
+        """Return the interval to use after receiving new data."""
+        current = _link_sample(data)
+        if self._previous is not None:
+            if _link_changed(self._previous, current):
+                self.interval = self.minimum
+            else:
+                self.interval = min(self.maximum, self.interval * BACKOFF_FACTOR)
+        self._previous = current
+        return self.interval
@@ -0,0 +1,131 @@
+"""Field projection of the airOS status."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection
+from dataclasses import MISSING, fields
+from functools import lru_cache
+from typing import Any, get_args, get_origin, get_type_hints
+
+from airos.airos8 import AirOSData
+
+from mashumaro.codecs.basic import BasicDecoder
+from mashumaro.exceptions import InvalidFieldValue, MissingField
+
+# Subtrees of the raw status only some entities need, by field name.
+# A "*" step walks every item of a list, a subtree left out of the
+# projection is not decoded and keeps its raw value.
+PROJECTION_FIELDS: dict[str, tuple[tuple[str, ...], ...]] = {
+    "chain_names": (("chain_names",),),
+    "interfaces": (("interfaces",),),
+    "firewall": (("firewall",),),
+    "gps": (("gps",),),
+    "unms": (("unms",),),
+    "chainrssi": (("wireless", "sta", "*", "chainrssi"),),
+    "stats": (("wireless", "sta", "*", "stats"),),
+    "airmax": (("wireless", "sta", "*", "airmax"),),
+    "tx_ratedata": (
+        ("wireless", "sta", "*", "tx_ratedata"),
+        ("wireless", "sta", "*", "remote", "tx_ratedata"),
+    ),
+    "remote_ethlist": (("wireless", "sta", "*", "remote", "ethlist"),),
+    "remote_gps": (("wireless", "sta", "*", "remote", "gps"),),
+    "remote_service": (("wireless", "sta", "*", "remote", "service"),),
+}
+
+type _Path = tuple[str, ...]
+
+# Field types decoded as they come, like mashumaro does
+_PASSTHROUGH: tuple[Any, ...] = (int, float, str, bool, Any)
+
+
+def _field_decoder(
+    field_type: Any, skip: frozenset[_Path]
+) -> Callable[[Any], Any] | None:
+    """Return the decoder of a field, None to keep the raw value."""
+    if () in skip:
+        return None
+    if not skip:
+        if field_type in _PASSTHROUGH:
+            return None
+        return BasicDecoder(field_type).decode
+    if get_origin(field_type) is list:
+        (item_type,) = get_args(field_type)
+        item = _ProjectedDecoder(
+            item_type, frozenset(path[1:] for path in skip if path[0] == "*")
+        )
+        return lambda value: [item.decode(raw) for raw in value]
+    return _ProjectedDecoder(field_type, skip).decode
+
+
+class _ProjectedDecoder:
+    """Decode a dataclass field by field, keeping skipped subtrees raw.
+
+    Fields without a skipped subtree are decoded by mashumaro, the others
+    are walked down to the skipped subtree, so the bulk of a status that no
+    entity reads is never decoded.
+    """
+
+    def __init__(self, cls: type, skip: frozenset[_Path]) -> None:
+        """Initialize the decoder."""
+        self._cls = cls
+        self._pre_deserialize: Callable[[dict[str, Any]], dict[str, Any]] | None = (
+            getattr(cls, "__pre_deserialize__")
+            if "__pre_deserialize__" in vars(cls)
+            else None
+        )
+        hints = get_type_hints(cls)
+        self._fields = [
+            (
+                field.name,
+                hints[field.name],
+                field.default is MISSING and field.default_factory is MISSING,
+                _field_decoder(
+                    hints[field.name],
+                    frozenset(path[1:] for path in skip if path[0] == field.name),
+                ),
+            )
+            for field in fields(cls)
+        ]
+
+    def decode(self, raw: dict[str, Any]) -> Any:
+        """Decode a raw dict into the dataclass."""
+        if self._pre_deserialize is not None:
+            raw = self._pre_deserialize(raw)
+        values: dict[str, Any] = {}
+        for name, field_type, required, decode in self._fields:
+            if name not in raw:
+                if required:
+                    raise MissingField(name, field_type, self._cls)
+                continue
+            value = raw[name]
+            if decode is None:
+                values[name] = value
+                continue
+            try:
+                values[name] = decode(value)
+            except (MissingField, InvalidFieldValue):
+                raise
+            except (TypeError, ValueError, KeyError, AttributeError) as err:
+                raise InvalidFieldValue(name, field_type, value, self._cls) from err
+        return self._cls(**values)
+
+
+@lru_cache(maxsize=8)
+def _status_decoder(keep: frozenset[str]) -> Callable[[dict[str, Any]], AirOSData]:
+    """Return the decoder of a status keeping the given projection fields."""
+    skip = frozenset(
+        path
+        for field, paths in PROJECTION_FIELDS.items()
+        if field not in keep
+        for path in paths
+    )
+    return _ProjectedDecoder(AirOSData, skip).decode
+
+
+def decode_projected(status: dict[str, Any], keep: Collection[str]) -> AirOSData:
+    """Decode a raw status, leaving the subtrees of fields not kept raw.
+
+    Raises MissingField or InvalidFieldValue like AirOSData.from_dict.
+    """
+    return _status_decoder(frozenset(keep))(status)
@@ -0,0 +1,97 @@
+"""Status of airOS stations as reported by their access point."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+from airos.airos8 import AirOSData
+from airos.data import Remote, Station
+
+from homeassistant.core import callback
+
+
+class RemoteReports:
+    """Keep the latest report of every station across access points.
+
+    An access point reports the host data of its stations with every poll,
+    so a station configured as its own entry can take its data from there
+    instead of being polled as well. Reports expire once older than the
+    access point takes to report again and are dropped with the config entry
+    that received them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the reports."""
+        # Report by device id, with the time it was received, the entry of
+        # the access point reporting it and the age it expires at
+        self._reports: dict[str, tuple[Remote, float, str, float]] = {}
+
+    def update(
+        self, entry_id: str, stations: dict[str, Station], now: float, max_age: float
+    ) -> None:
+        """Keep the reports of the stations of an access point poll."""
+        self._expire(now)
+        for station in stations.values():
+            self._reports[station.remote.device_id] = (
+                station.remote,
+                now,
+                entry_id,
+                max_age,
+            )
+
+    def get(self, device_id: str, now: float) -> Remote | None:
+        """Return the report of a device, None when there is no recent one."""
+        if (report := self._reports.get(device_id)) is None:
+            return None
+        if self._expired(report, now):
+            del self._reports[device_id]
+            return None
+        return report[0]
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        """Drop the reports received by an unloaded config entry."""
+        self._reports = {
+            device_id: report
+            for device_id, report in self._reports.items()
+            if report[2] != entry_id
+        }
+
+    @staticmethod
+    def _expired(report: tuple[Remote, float, str, float], now: float) -> bool:
+        """Return whether a report is too old to use."""
+        remote, received, _entry_id, max_age = report
+        # The access point itself reports how old the data of the station is
+        return remote.age + now - received > max_age
+
+    def _expire(self, now: float) -> None:
+        """Drop the reports too old to use."""
+        for device_id in [
+            device_id
+            for device_id, report in self._reports.items()
+            if self._expired(report, now)
+        ]:
+            del self._reports[device_id]
+
+
+def apply_remote_report(data: AirOSData, remote: Remote) -> AirOSData:
+    """Return a status updated with what the access point reported on it."""
+    return replace(
+        data,
+        host=replace(
+            data.host,
+            cpuload=remote.cpuload,
+            temperature=remote.temperature,
+            totalram=remote.totalram,
+            freeram=remote.freeram,
+            uptime=remote.uptime,
+        ),
+        wireless=replace(
+            data.wireless,
+            throughput=replace(
+                data.wireless.throughput,
+                tx=remote.tx_throughput,
+                rx=remote.rx_throughput,
+            ),
+        ),
+    )
@@ -0,0 +1,108 @@
+"""Fleet-wide poll scheduling for airOS devices."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import random
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .const import DEFAULT_MAX_CONCURRENT_POLLS, DEFAULT_POLL_JITTER
+
+if TYPE_CHECKING:
+    from .coordinator import AirOSDataUpdateCoordinator
+
+
+class AirOSPollScheduler:
+    """Share request capacity between all airOS coordinators.
+
+    Requests to devices are limited by a semaphore so a fleet of devices
+    cannot flood the HTTP session, and every registered coordinator gets a
+    random start offset so their polls drift out of phase.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_POLLS,
+        jitter: float = DEFAULT_POLL_JITTER,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.max_concurrent = max_concurrent
+        self.jitter = jitter
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._coordinators: set[AirOSDataUpdateCoordinator] = set()
+        self.in_flight = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.requests = 0
+        self.last_wait = 0.0
+        self.max_wait = 0.0
+        self._total_wait = 0.0
+
+    @callback
+    def async_configure(self, max_concurrent: int, jitter: float) -> None:
+        """Change the request limit and start offsets of later polls."""
+        if max_concurrent != self.max_concurrent:
+            # Requests holding a slot release it to the semaphore they took
+            # it from, the new limit applies from the next request on
+            self._semaphore = asyncio.Semaphore(max_concurrent)
+            self.max_concurrent = max_concurrent
+        self.jitter = jitter
+
+    @callback
+    def async_register(self, coordinator: AirOSDataUpdateCoordinator) -> CALLBACK_TYPE:
+        """Register a coordinator, returning a callback to unregister it."""
+        self._coordinators.add(coordinator)
+
+        @callback
+        def _async_unregister() -> None:
+            self._coordinators.discard(coordinator)
+
+        return _async_unregister
+
+    def start_offset(self) -> float:
+        """Return a random delay in seconds to shift a coordinator's polls."""
+        return random.uniform(0, self.jitter)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for a free request slot and hold it for the duration."""
+        queued_at = time.monotonic()
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        semaphore = self._semaphore
+        try:
+            await semaphore.acquire()
+        finally:
+            self.queue_depth -= 1
+
+        self.last_wait = time.monotonic() - queued_at
+        self.max_wait = max(self.max_wait, self.last_wait)
+        self._total_wait += self.last_wait
+        self.requests += 1
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            semaphore.release()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return scheduler statistics, wait times in milliseconds."""
+        return {
+            "registered": len(self._coordinators),
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "requests": self.requests,
+            "last_wait_ms": round(self.last_wait * 1000),
+            "avg_wait_ms": round(self._total_wait * 1000 / self.requests)
+            if self.requests
+            else 0,
+            "max_wait_ms": round(self.max_wait * 1000),
+        }
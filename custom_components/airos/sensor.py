@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime
 import logging
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -15,15 +17,30 @@ from homeassistant.components.sensor import (
 from homeassistant.const import (
     PERCENTAGE,
     SIGNAL_STRENGTH_DECIBELS,
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    EntityCategory,
     UnitOfDataRate,
     UnitOfFrequency,
+    UnitOfInformation,
+    UnitOfTemperature,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
-from .coordinator import AirOSConfigEntry, AirOSData, AirOSDataUpdateCoordinator
-from .entity import AirOSEntity
+from .coordinator import (
+    CONTEXT_DATA,
+    CONTEXT_STATION,
+    AirOSConfigEntry,
+    AirOSData,
+    AirOSDataUpdateCoordinator,
+)
+from .entity import AirOSEntity, AirOSInterfaceEntity, AirOSStationEntity
+from .helpers import async_add_interface_entities, async_add_station_entities
+from .history import HISTORY_METRICS
+from .instrumentation import PHASES
+from .interfaces import InterfaceState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +52,32 @@ class AirOSSensorEntityDescription(SensorEntityDescription):
     value_fn: Callable[[AirOSData], StateType]
 
 
+@dataclass(frozen=True, kw_only=True)
+class AirOSStationSensorEntityDescription(SensorEntityDescription):
+    """Describe an AirOS sensor for a connected station.
+
+    The key refers to a metric extracted once per update by the coordinator.
+    """
+
+    projection_fields: frozenset[str] = frozenset()
+
+
+@dataclass(frozen=True, kw_only=True)
+class AirOSInterfaceSensorEntityDescription(SensorEntityDescription):
+    """Describe an AirOS sensor for a network interface."""
+
+    value_fn: Callable[[InterfaceState], StateType]
+
+
+@dataclass(frozen=True, kw_only=True)
+class AirOSCoordinatorSensorEntityDescription(SensorEntityDescription):
+    """Describe an AirOS sensor reporting on the coordinator itself."""
+
+    value_fn: Callable[[AirOSDataUpdateCoordinator], StateType | datetime]
+    attributes_fn: Callable[[AirOSDataUpdateCoordinator], dict[str, Any]] | None = None
+    projection_fields: frozenset[str] = frozenset()
+
+
 SENSORS: tuple[AirOSSensorEntityDescription, ...] = (
     AirOSSensorEntityDescription(
         key="host_cpuload",
@@ -109,6 +152,253 @@ SENSORS: tuple[AirOSSensorEntityDescription, ...] = (
     ),
 )
 
+STATION_SENSORS: tuple[AirOSStationSensorEntityDescription, ...] = (
+    AirOSStationSensorEntityDescription(
+        key="health",
+        translation_key="station_health",
+        state_class=SensorStateClass.MEASUREMENT,
+        projection_fields=frozenset({"chainrssi"}),
+    ),
+    AirOSStationSensorEntityDescription(
+        key="signal",
+        translation_key="station_signal",
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="rssi",
+        translation_key="station_rssi",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="noisefloor",
+        translation_key="station_noisefloor",
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="chain0_rssi",
+        translation_key="station_chain0_rssi",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        projection_fields=frozenset({"chainrssi"}),
+    ),
+    AirOSStationSensorEntityDescription(
+        key="chain1_rssi",
+        translation_key="station_chain1_rssi",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        projection_fields=frozenset({"chainrssi"}),
+    ),
+    AirOSStationSensorEntityDescription(
+        key="tx_latency",
+        translation_key="station_tx_latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="dl_linkscore",
+        translation_key="station_dl_linkscore",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="ul_linkscore",
+        translation_key="station_ul_linkscore",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="dl_capacity_expect",
+        translation_key="station_dl_capacity_expect",
+        native_unit_of_measurement=UnitOfDataRate.KILOBITS_PER_SECOND,
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="ul_capacity_expect",
+        translation_key="station_ul_capacity_expect",
+        native_unit_of_measurement=UnitOfDataRate.KILOBITS_PER_SECOND,
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="remote_tx_throughput",
+        translation_key="station_remote_tx_throughput",
+        native_unit_of_measurement=UnitOfDataRate.KILOBITS_PER_SECOND,
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="remote_rx_throughput",
+        translation_key="station_remote_rx_throughput",
+        native_unit_of_measurement=UnitOfDataRate.KILOBITS_PER_SECOND,
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="remote_cpuload",
+        translation_key="station_remote_cpuload",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="remote_temperature",
+        translation_key="station_remote_temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="remote_freeram",
+        translation_key="station_remote_freeram",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.MEBIBYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="remote_uptime",
+        translation_key="station_remote_uptime",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.DAYS,
+        device_class=SensorDeviceClass.DURATION,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="tx_packet_rate",
+        translation_key="station_tx_packet_rate",
+        native_unit_of_measurement="packets/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="retry_ratio",
+        translation_key="station_retry_ratio",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="remote_tx_rate",
+        translation_key="station_remote_tx_rate",
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+    ),
+    AirOSStationSensorEntityDescription(
+        key="remote_rx_rate",
+        translation_key="station_remote_rx_rate",
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+    ),
+)
+
+INTERFACE_SENSORS: tuple[AirOSInterfaceSensorEntityDescription, ...] = (
+    AirOSInterfaceSensorEntityDescription(
+        key="speed",
+        translation_key="interface_speed",
+        native_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda interface: interface.speed,
+    ),
+    AirOSInterfaceSensorEntityDescription(
+        key="mtu",
+        translation_key="interface_mtu",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda interface: interface.mtu,
+    ),
+)
+
+COORDINATOR_SENSORS: tuple[AirOSCoordinatorSensorEntityDescription, ...] = (
+    AirOSCoordinatorSensorEntityDescription(
+        key="poll_interval",
+        translation_key="poll_interval",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda coordinator: coordinator.poll_interval.interval.total_seconds(),
+    ),
+    *(
+        AirOSCoordinatorSensorEntityDescription(
+            key=f"{phase}_duration",
+            translation_key=f"{phase}_duration",
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=1,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+            value_fn=lambda coordinator, phase=phase: (
+                coordinator.instrumentation.phases[phase].mean_ms
+            ),
+        )
+        for phase in PHASES
+    ),
+    AirOSCoordinatorSensorEntityDescription(
+        key="worst_link_health",
+        translation_key="worst_link_health",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: (
+            coordinator.worst_stations[0][1] if coordinator.worst_stations else None
+        ),
+        attributes_fn=lambda coordinator: {
+            "stations": [
+                {
+                    "mac": mac,
+                    "hostname": coordinator.stations[mac].remote.hostname,
+                    "health": health,
+                }
+                for mac, health in coordinator.worst_stations
+            ]
+        },
+        projection_fields=frozenset({"chainrssi"}),
+    ),
+    AirOSCoordinatorSensorEntityDescription(
+        key="poll_failures",
+        translation_key="poll_failures",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.instrumentation.failures.total(),
+    ),
+    AirOSCoordinatorSensorEntityDescription(
+        key="last_success",
+        translation_key="last_success",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.instrumentation.last_success,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -119,6 +409,31 @@ async def async_setup_entry(
     coordinator = config_entry.runtime_data
 
     async_add_entities(AirOSSensor(coordinator, description) for description in SENSORS)
+    async_add_entities(
+        AirOSCoordinatorSensor(coordinator, description)
+        for description in COORDINATOR_SENSORS
+    )
+    async_add_interface_entities(
+        config_entry,
+        async_add_entities,
+        lambda ifname: [
+            AirOSInterfaceSensor(coordinator, ifname, description)
+            for description in INTERFACE_SENSORS
+        ],
+    )
+
+    if coordinator.long_term_statistics is not None:
+        # Station metrics are kept as long-term statistics instead
+        return
+
+    async_add_station_entities(
+        config_entry,
+        async_add_entities,
+        lambda mac: [
+            AirOSStationSensor(coordinator, mac, description)
+            for description in STATION_SENSORS
+        ],
+    )
 
 
 class AirOSSensor(AirOSEntity, SensorEntity):
@@ -135,9 +450,108 @@ class AirOSSensor(AirOSEntity, SensorEntity):
         super().__init__(coordinator)
 
         self.entity_description = description
+        self.coordinator_context = (CONTEXT_DATA, description.value_fn)
         self._attr_unique_id = f"{coordinator.data.host.device_id}_{description.key}"
 
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
         return self.entity_description.value_fn(self.coordinator.data)
+
+
+class AirOSCoordinatorSensor(AirOSEntity, SensorEntity):
+    """Representation of a Sensor reporting on the coordinator."""
+
+    entity_description: AirOSCoordinatorSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: AirOSDataUpdateCoordinator,
+        description: AirOSCoordinatorSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+
+        self.entity_description = description
+        self._projection_fields = description.projection_fields
+        self._attr_unique_id = f"{coordinator.data.host.device_id}_{description.key}"
+
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self.coordinator)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the attributes of the sensor."""
+        if (attributes_fn := self.entity_description.attributes_fn) is None:
+            return None
+        return attributes_fn(self.coordinator)
+
+
+class AirOSInterfaceSensor(AirOSInterfaceEntity, SensorEntity):
+    """Representation of a Sensor for a network interface."""
+
+    entity_description: AirOSInterfaceSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: AirOSDataUpdateCoordinator,
+        ifname: str,
+        description: AirOSInterfaceSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, ifname)
+
+        self.entity_description = description
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.unique_id}_{ifname}_{description.key}"
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if (interface := self.interface) is None:
+            return None
+        return self.entity_description.value_fn(interface)
+
+
+class AirOSStationSensor(AirOSStationEntity, SensorEntity):
+    """Representation of a Sensor for a connected station."""
+
+    entity_description: AirOSStationSensorEntityDescription
+
+    _unrecorded_attributes = frozenset({"min", "max", "mean", "p95", "samples"})
+
+    def __init__(
+        self,
+        coordinator: AirOSDataUpdateCoordinator,
+        mac: str,
+        description: AirOSStationSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, mac)
+
+        self.entity_description = description
+        self._projection_fields = description.projection_fields
+        # The context includes the rolling statistics of the metric, if any
+        self.coordinator_context = (CONTEXT_STATION, self._mac, description.key)
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.unique_id}_{self._mac}_{description.key}"
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if (metrics := self.coordinator.station_metrics.get(self._mac)) is None:
+            return None
+        return metrics[self.entity_description.key]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the rolling statistics over the last polls."""
+        if self.entity_description.key not in HISTORY_METRICS:
+            return None
+        return self.coordinator.station_history.statistics(
+            self._mac, self.entity_description.key
+        )
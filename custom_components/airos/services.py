@@ -0,0 +1,189 @@
+"""Services for the Ubiquiti airOS integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from airos.exceptions import AirOSException
+import voluptuous as vol
+
+import aiohttp
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_DEVICE_ID,
+    ATTR_MAC,
+    ATTR_MACS,
+    ATTR_SIGNAL_BELOW,
+    DOMAIN,
+    KICK_CONCURRENCY,
+    SERVICE_GET_TOPOLOGY,
+    SERVICE_KICK_STATIONS,
+)
+from .coordinator import AirOSConfigEntry, AirOSDataUpdateCoordinator
+from .models import AIROS_DATA
+
+_LOGGER = logging.getLogger(__name__)
+
+# Errors of a kick reported in the response rather than failing the call
+_KICK_ERRORS = (AirOSException, TimeoutError, aiohttp.ClientError)
+
+KICK_STATIONS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_MACS): vol.All(
+                cv.ensure_list, [vol.All(cv.string, vol.Lower)]
+            ),
+            vol.Optional(ATTR_SIGNAL_BELOW): vol.Coerce(int),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_MACS, ATTR_SIGNAL_BELOW),
+)
+
+
+GET_TOPOLOGY_SCHEMA = vol.Schema(
+    {
+        vol.Exclusive(ATTR_DEVICE_ID, "device"): cv.string,
+        vol.Exclusive(ATTR_MAC, "device"): cv.string,
+    }
+)
+
+
+def _loaded_entries(hass: HomeAssistant, call: ServiceCall) -> list[AirOSConfigEntry]:
+    """Return the loaded config entries targeted by a service call."""
+    entry_ids: list[str] | None = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    entries: list[AirOSConfigEntry] = [
+        entry
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN)
+        if entry_ids is None or entry.entry_id in entry_ids
+    ]
+    if not entries:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="no_loaded_entries"
+        )
+    return entries
+
+
+def _select_stations(
+    coordinator: AirOSDataUpdateCoordinator,
+    macs: list[str] | None,
+    signal_below: int | None,
+) -> dict[str, str]:
+    """Return the connected stations matching both the MACs and the signal filter.
+
+    Stations are matched by lower case MAC and map to the MAC as reported by
+    the device, which is what the device expects to be kicked by.
+    """
+    return {
+        mac: station.mac
+        for mac, station in coordinator.stations.items()
+        if (macs is None or mac in macs)
+        and (signal_below is None or station.signal < signal_below)
+    }
+
+
+def _kick_result(kicked: bool, error: BaseException | None = None) -> dict[str, Any]:
+    """Return the result of kicking a station."""
+    return {
+        "kicked": kicked,
+        "error": type(error).__name__ if error is not None else None,
+    }
+
+
+async def _async_kick_device(
+    coordinator: AirOSDataUpdateCoordinator, macs: list[str]
+) -> dict[str, dict[str, Any]]:
+    """Kick stations from a device, logging in once for all of them."""
+    semaphore = asyncio.Semaphore(KICK_CONCURRENCY)
+
+    async def _async_kick(mac: str) -> dict[str, Any]:
+        async with semaphore:
+            try:
+                kicked = await coordinator.airos_device.stakick(mac)
+            except _KICK_ERRORS as err:
+                return _kick_result(False, err)
+        return _kick_result(bool(kicked))
+
+    async with coordinator.scheduler.slot():
+        try:
+            await coordinator.airos_device.ensure_session()
+        except _KICK_ERRORS as err:
+            return {mac: _kick_result(False, err) for mac in macs}
+        results = await asyncio.gather(*(_async_kick(mac) for mac in macs))
+    return dict(zip(macs, results, strict=True))
+
+
+async def _async_kick_stations(call: ServiceCall) -> ServiceResponse:
+    """Disconnect stations so they associate again."""
+    entries = _loaded_entries(call.hass, call)
+    macs: list[str] | None = call.data.get(ATTR_MACS)
+    signal_below: int | None = call.data.get(ATTR_SIGNAL_BELOW)
+
+    selections = {
+        entry.entry_id: (entry.runtime_data, selected)
+        for entry in entries
+        if (selected := _select_stations(entry.runtime_data, macs, signal_below))
+    }
+    device_results = await asyncio.gather(
+        *(
+            _async_kick_device(coordinator, list(selected.values()))
+            for coordinator, selected in selections.values()
+        )
+    )
+
+    # A station is only kicked from the devices it is connected to
+    found = {mac for _, selected in selections.values() for mac in selected}
+    results: dict[str, Any] = {
+        "entries": dict(zip(selections, device_results, strict=True)),
+        "not_connected": [mac for mac in macs or () if mac not in found],
+    }
+    _LOGGER.debug("Kicked stations: %s", results)
+    return results
+
+
+@callback
+def _async_get_topology(call: ServiceCall) -> ServiceResponse:
+    """Return a device with its links, or all devices without a device or MAC."""
+    topology = call.hass.data[AIROS_DATA].topology
+    device_id: str | None = call.data.get(ATTR_DEVICE_ID)
+    mac: str | None = call.data.get(ATTR_MAC)
+    if device_id is None and mac is None:
+        return topology.as_dict()
+    if (result := topology.lookup(device_id, mac)) is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="device_not_found",
+            translation_placeholders={"device": device_id or mac or ""},
+        )
+    return result
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the airOS services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_KICK_STATIONS,
+        _async_kick_stations,
+        schema=KICK_STATIONS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_TOPOLOGY,
+        _async_get_topology,
+        schema=GET_TOPOLOGY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
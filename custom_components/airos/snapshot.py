@@ -0,0 +1,76 @@
+"""Persist the last good status of an airOS device."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+from airos.airos8 import AirOSData
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from mashumaro.exceptions import InvalidFieldValue, MissingField
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+def _compact(response: str) -> dict[str, Any]:
+    """Return a status response without the bulky per-station lists."""
+    status = json.loads(response)
+    for station in status["wireless"]["sta"]:
+        station["tx_ratedata"] = []
+        station["remote"]["tx_ratedata"] = []
+        station["airmax"]["rx"]["evm"] = []
+        station["airmax"]["tx"]["evm"] = []
+    return status
+
+
+class AirOSSnapshotStore:
+    """Store the last good status of a device to start from on the next setup."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        # Polls decode only part of a status, the response is stored in full
+        self._response: str | None = None
+        self._save_pending = False
+
+    async def async_load(self) -> AirOSData | None:
+        """Return the stored status, None when missing or no longer valid."""
+        if (status := await self._store.async_load()) is None:
+            return None
+        try:
+            return AirOSData.from_dict(status)
+        except (MissingField, InvalidFieldValue) as err:
+            _LOGGER.debug("Ignoring stored airOS status: %s", err)
+            return None
+
+    @callback
+    def async_schedule_save(self, response: str) -> None:
+        """Save a status response, at most once per save delay."""
+        self._response = response
+        if self._save_pending:
+            # The pending write picks up the latest status
+            return
+        self._save_pending = True
+        self._store.async_delay_save(
+            self._data_to_save, SNAPSHOT_SAVE_DELAY.total_seconds()
+        )
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the latest status to write."""
+        self._save_pending = False
+        assert self._response is not None
+        return _compact(self._response)
+
+    async def async_remove(self) -> None:
+        """Remove the stored status."""
+        await self._store.async_remove()
@@ -0,0 +1,204 @@
+"""Long-term statistics of the stations of an airOS device."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime
+import logging
+from typing import Any
+
+from airos.data import Station
+
+from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import (
+    PERCENTAGE,
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    UnitOfDataRate,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN, STATISTICS_SAVE_DELAY
+from .stations import StationMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Station metrics kept as statistics, with their name and unit
+STATISTICS_METRICS: dict[str, tuple[str, str | None]] = {
+    "health": ("Link health", None),
+    "signal": ("Signal", SIGNAL_STRENGTH_DECIBELS_MILLIWATT),
+    "noisefloor": ("Noise floor", SIGNAL_STRENGTH_DECIBELS_MILLIWATT),
+    "tx_latency": ("Transmit latency", UnitOfTime.MILLISECONDS),
+    "dl_linkscore": ("Download linkscore", PERCENTAGE),
+    "ul_linkscore": ("Upload linkscore", PERCENTAGE),
+    "dl_capacity_expect": (
+        "Expected download capacity",
+        UnitOfDataRate.KILOBITS_PER_SECOND,
+    ),
+    "ul_capacity_expect": (
+        "Expected upload capacity",
+        UnitOfDataRate.KILOBITS_PER_SECOND,
+    ),
+    "remote_tx_throughput": (
+        "Remote throughput transmit",
+        UnitOfDataRate.KILOBITS_PER_SECOND,
+    ),
+    "remote_rx_throughput": (
+        "Remote throughput receive",
+        UnitOfDataRate.KILOBITS_PER_SECOND,
+    ),
+    "tx_packet_rate": ("Transmit packet rate", "packets/s"),
+    "retry_ratio": ("Retry ratio", PERCENTAGE),
+    "remote_tx_rate": ("Remote transmit rate", UnitOfDataRate.BYTES_PER_SECOND),
+    "remote_rx_rate": ("Remote receive rate", UnitOfDataRate.BYTES_PER_SECOND),
+}
+
+
+def statistic_id(device_id: str, mac: str, metric: str) -> str:
+    """Return the external statistic id of a station metric."""
+    return f"{DOMAIN}:{slugify(f'{device_id}_{mac}_{metric}')}"
+
+
+# Count, sum, min and max of a station metric over an hour, by MAC and metric
+type Aggregates = dict[tuple[str, str], list[float]]
+
+
+class StationStatistics:
+    """Aggregate station metrics per hour into external statistics.
+
+    Every poll only updates a running count, sum, min and max per station
+    metric in memory. Once an hour has passed, the hour is written to the
+    recorder in one batch, so stations need no entities or state writes.
+    Hours not written yet are stored, and aggregated further after the next
+    setup, so a reload or restart never writes a partial hour.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, device_id: str) -> None:
+        """Initialize the statistics of a device."""
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.station_statistics"
+        )
+        self._device_id = device_id
+        self._hours: dict[datetime, Aggregates] = {}
+        self._names: dict[str, str] = {}
+        self._save_pending = False
+        self.written = 0
+
+    async def async_load(self) -> None:
+        """Continue the hours stored on the previous unload."""
+        if (stored := await self._store.async_load()) is None:
+            return
+        try:
+            for start, rows in stored["hours"].items():
+                hour = datetime.fromisoformat(start)
+                aggregates = self._hours.setdefault(hour, {})
+                for mac, metric, *aggregate in rows:
+                    if metric in STATISTICS_METRICS:
+                        aggregates[mac, metric] = aggregate
+            self._names.update(stored["names"])
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Ignoring stored airOS station statistics: %s", err)
+            self._hours.clear()
+
+    async def async_save(self) -> None:
+        """Store the hours not written yet, to continue after the next setup."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the hours not written yet to store."""
+        self._save_pending = False
+        return {
+            "hours": {
+                hour.isoformat(): [
+                    [mac, metric, *aggregate]
+                    for (mac, metric), aggregate in aggregates.items()
+                ]
+                for hour, aggregates in self._hours.items()
+            },
+            "names": self._names,
+        }
+
+    async def async_remove(self) -> None:
+        """Remove the stored hours."""
+        await self._store.async_remove()
+
+    @callback
+    def async_add(
+        self,
+        stations: dict[str, Station],
+        station_metrics: dict[str, StationMetrics],
+        now: datetime,
+    ) -> None:
+        """Add the metrics of a poll, writing the previous hours once passed."""
+        hour = dt_util.as_utc(now).replace(minute=0, second=0, microsecond=0)
+        if passed := [start for start in self._hours if start != hour]:
+            self._async_write({start: self._hours.pop(start) for start in passed})
+        self._names.update(
+            (mac, station.remote.hostname) for mac, station in stations.items()
+        )
+
+        aggregates = self._hours.setdefault(hour, {})
+        for mac, metrics in station_metrics.items():
+            for metric in STATISTICS_METRICS:
+                if (value := metrics.get(metric)) is None:
+                    continue
+                if (aggregate := aggregates.get((mac, metric))) is None:
+                    aggregates[mac, metric] = [1, value, value, value]
+                    continue
+                aggregate[0] += 1
+                aggregate[1] += value
+                aggregate[2] = min(aggregate[2], value)
+                aggregate[3] = max(aggregate[3], value)
+
+        if not self._save_pending:
+            # Survive a restart, the pending write picks up the latest hour
+            self._save_pending = True
+            self._store.async_delay_save(
+                self._data_to_save, STATISTICS_SAVE_DELAY.total_seconds()
+            )
+
+    @callback
+    def _async_write(self, hours: dict[datetime, Aggregates]) -> None:
+        """Write aggregated hours, all hours of a statistic in one call."""
+        if RECORDER_DOMAIN not in self._hass.config.components:
+            _LOGGER.debug("Recorder not loaded, dropping airOS station statistics")
+            return
+
+        statistics: defaultdict[tuple[str, str], list[StatisticData]] = defaultdict(
+            list
+        )
+        for start, aggregates in sorted(hours.items()):
+            for key, (count, total, minimum, maximum) in aggregates.items():
+                statistics[key].append(
+                    StatisticData(
+                        start=start, mean=total / count, min=minimum, max=maximum
+                    )
+                )
+
+        for (mac, metric), data in statistics.items():
+            name, unit = STATISTICS_METRICS[metric]
+            async_add_external_statistics(
+                self._hass,
+                StatisticMetaData(
+                    mean_type=StatisticMeanType.ARITHMETIC,
+                    has_sum=False,
+                    name=f"{self._names.get(mac, mac)} {name}",
+                    source=DOMAIN,
+                    statistic_id=statistic_id(self._device_id, mac, metric),
+                    unit_of_measurement=unit,
+                ),
+                data,
+            )
+        self.written += len(statistics)
@@ -0,0 +1,129 @@
+"""Per-station metric extraction for airOS."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from operator import attrgetter
+
+from airos.data import Station
+
+from homeassistant.helpers.typing import StateType
+
+# Metric key and the attribute path it is read from on a Station
+STATION_METRICS: dict[str, str] = {
+    "signal": "signal",
+    "rssi": "rssi",
+    "noisefloor": "noisefloor",
+    "chainrssi": "chainrssi",
+    "tx_latency": "tx_latency",
+    "dl_linkscore": "dl_linkscore",
+    "ul_linkscore": "ul_linkscore",
+    "dl_capacity_expect": "dl_capacity_expect",
+    "ul_capacity_expect": "ul_capacity_expect",
+    "remote_tx_throughput": "remote.tx_throughput",
+    "remote_rx_throughput": "remote.rx_throughput",
+    "remote_cpuload": "remote.cpuload",
+    "remote_temperature": "remote.temperature",
+    "remote_freeram": "remote.freeram",
+    "remote_uptime": "remote.uptime",
+}
+
+# Cumulative counters of a station used to derive rates
+RATE_COUNTERS: dict[str, str] = {
+    "tx_packets": "tx_packets",
+    "tx_lretries": "tx_lretries",
+    "tx_sretries": "tx_sretries",
+    "remote_tx_bytes": "remote.tx_bytes",
+    "remote_rx_bytes": "remote.rx_bytes",
+}
+
+# Metric keys derived from the counters
+RATE_METRICS = ("tx_packet_rate", "retry_ratio", "remote_tx_rate", "remote_rx_rate")
+
+# Number of receive chains reported as individual metrics
+CHAIN_COUNT = 2
+
+type StationMetrics = dict[str, StateType]
+
+_METRIC_KEYS = tuple(STATION_METRICS)
+# A single attrgetter reads all paths of a station in one call
+_get_metrics = attrgetter(*STATION_METRICS.values())
+_get_counters = attrgetter(*RATE_COUNTERS.values())
+
+
+def extract_station_metrics(
+    stations: dict[str, Station],
+) -> dict[str, StationMetrics]:
+    """Extract the metrics of all stations in one pass."""
+    metrics: dict[str, StationMetrics] = {}
+    for mac, station in stations.items():
+        values = dict(zip(_METRIC_KEYS, _get_metrics(station), strict=True))
+        chainrssi = values.pop("chainrssi")
+        for chain in range(CHAIN_COUNT):
+            values[f"chain{chain}_rssi"] = (
+                chainrssi[chain] if chain < len(chainrssi) else None
+            )
+        metrics[mac] = values
+    return metrics
+
+
+@dataclass(slots=True)
+class CounterSample:
+    """Counters of a station at a point in time."""
+
+    timestamp: float
+    uptime: int
+    counters: tuple[int, ...]
+
+
+def _derive_rates(
+    previous: CounterSample | None, sample: CounterSample
+) -> StationMetrics:
+    """Return the rates between two samples, None after a counter reset."""
+    # A lower uptime means the station reassociated or the remote rebooted
+    if previous is None or sample.uptime < previous.uptime:
+        return dict.fromkeys(RATE_METRICS)
+    if (elapsed := sample.timestamp - previous.timestamp) <= 0:
+        return dict.fromkeys(RATE_METRICS)
+
+    deltas = [
+        current - last
+        for current, last in zip(sample.counters, previous.counters, strict=True)
+    ]
+    if any(delta < 0 for delta in deltas):
+        return dict.fromkeys(RATE_METRICS)
+
+    tx_packets, tx_lretries, tx_sretries, remote_tx_bytes, remote_rx_bytes = deltas
+    return {
+        "tx_packet_rate": round(tx_packets / elapsed, 2),
+        "retry_ratio": round((tx_lretries + tx_sretries) / tx_packets * 100, 2)
+        if tx_packets
+        else None,
+        "remote_tx_rate": round(remote_tx_bytes / elapsed, 2),
+        "remote_rx_rate": round(remote_rx_bytes / elapsed, 2),
+    }
+
+
+class StationRateTracker:
+    """Derive per-second rates from the cumulative counters of stations.
+
+    Only the previous sample of each connected station is kept, departed
+    stations are dropped so they start over when associating again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._samples: dict[str, CounterSample] = {}
+
+    def update(
+        self, stations: dict[str, Station], timestamp: float
+    ) -> dict[str, StationMetrics]:
+        """Store new samples, returning the rates per station."""
+        samples: dict[str, CounterSample] = {}
+        rates: dict[str, StationMetrics] = {}
+        for mac, station in stations.items():
+            sample = CounterSample(timestamp, station.uptime, _get_counters(station))
+            rates[mac] = _derive_rates(self._samples.get(mac), sample)
+            samples[mac] = sample
+        self._samples = samples
+        return rates
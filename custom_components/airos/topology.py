@@ -0,0 +1,170 @@
+"""Topology of all airOS devices and their stations."""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+from airos.airos8 import AirOSData
+from airos.data import Station
+
+from homeassistant.core import callback
+
+# Link between an access point and a station, by device id
+type Link = tuple[str, str]
+
+
+@dataclass(slots=True)
+class TopologyNode:
+    """A device in the topology, configured or only seen as a station."""
+
+    device_id: str
+    hostname: str
+    # Wireless MAC of the device as reported by the other end of its link
+    macs: set[str] = field(default_factory=set)
+    config_entry_id: str | None = None
+    access_point: str | None = None
+    stations: set[str] = field(default_factory=set)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the node for the websocket command and service."""
+        return {
+            "device_id": self.device_id,
+            "hostname": self.hostname,
+            "macs": sorted(self.macs),
+            "config_entry_id": self.config_entry_id,
+            "access_point": self.access_point,
+            "stations": sorted(self.stations),
+        }
+
+
+class AirOSTopology:
+    """Index the links between all airOS devices by device id and MAC.
+
+    Both ends of a link can report it, an access point through its stations
+    and a configured station through its access point. Links are counted per
+    reporting config entry, so a refresh only touches the links that
+    appeared or disappeared since the previous refresh of that entry.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the topology."""
+        self._nodes: dict[str, TopologyNode] = {}
+        self._macs: dict[str, str] = {}
+        self._link_count: Counter[Link] = Counter()
+        # Links reported by every config entry on its latest refresh
+        self._entry_links: dict[str, frozenset[Link]] = {}
+        self._entry_devices: dict[str, str] = {}
+
+    def _node(self, device_id: str, hostname: str) -> TopologyNode:
+        """Return the node of a device, added when unknown."""
+        if (node := self._nodes.get(device_id)) is None:
+            node = self._nodes[device_id] = TopologyNode(device_id, hostname)
+        return node
+
+    @callback
+    def async_update(
+        self, entry_id: str, data: AirOSData, stations: dict[str, Station]
+    ) -> None:
+        """Update the links reported by a config entry with its latest status."""
+        device_id = data.host.device_id
+        node = self._node(device_id, data.host.hostname)
+        node.hostname = data.host.hostname
+        node.config_entry_id = entry_id
+        self._entry_devices[entry_id] = device_id
+
+        is_access_point = data.wireless.mode.value.startswith("ap")
+        links: set[Link] = set()
+        for mac, station in stations.items():
+            remote = station.remote
+            remote_node = self._node(remote.device_id, remote.hostname)
+            if mac not in remote_node.macs:
+                remote_node.macs.add(mac)
+                self._macs[mac] = remote.device_id
+            links.add(
+                (device_id, remote.device_id)
+                if is_access_point
+                else (remote.device_id, device_id)
+            )
+
+        previous = self._entry_links.get(entry_id, frozenset())
+        self._entry_links[entry_id] = frozenset(links)
+        for link in links - previous:
+            self._add_link(link)
+        for link in previous - links:
+            self._remove_link(link)
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        """Remove the links reported by an unloaded config entry."""
+        for link in self._entry_links.pop(entry_id, frozenset()):
+            self._remove_link(link)
+        if (device_id := self._entry_devices.pop(entry_id, None)) is not None and (
+            node := self._nodes.get(device_id)
+        ) is not None:
+            node.config_entry_id = None
+            self._prune(node)
+
+    def _add_link(self, link: Link) -> None:
+        """Count a report of a link, connecting both nodes on the first one."""
+        self._link_count[link] += 1
+        if self._link_count[link] > 1:
+            return
+        access_point, station = link
+        self._nodes[access_point].stations.add(station)
+        self._nodes[station].access_point = access_point
+
+    def _remove_link(self, link: Link) -> None:
+        """Drop a report of a link, disconnecting both nodes on the last one."""
+        self._link_count[link] -= 1
+        if self._link_count[link] > 0:
+            return
+        del self._link_count[link]
+        access_point, station = link
+        ap_node = self._nodes[access_point]
+        ap_node.stations.discard(station)
+        station_node = self._nodes[station]
+        if station_node.access_point == access_point:
+            station_node.access_point = None
+        self._prune(ap_node)
+        self._prune(station_node)
+
+    def _prune(self, node: TopologyNode) -> None:
+        """Forget a device that is neither configured nor linked."""
+        if node.config_entry_id or node.access_point or node.stations:
+            return
+        del self._nodes[node.device_id]
+        for mac in node.macs:
+            if self._macs.get(mac) == node.device_id:
+                del self._macs[mac]
+
+    def get(
+        self, device_id: str | None = None, mac: str | None = None
+    ) -> TopologyNode | None:
+        """Return the node of a device by device id or MAC."""
+        if device_id is None and mac is not None:
+            device_id = self._macs.get(mac.lower())
+        if device_id is None:
+            return None
+        return self._nodes.get(device_id)
+
+    def lookup(
+        self, device_id: str | None = None, mac: str | None = None
+    ) -> dict[str, Any] | None:
+        """Return a device with the access point and stations it is linked to."""
+        if (node := self.get(device_id, mac)) is None:
+            return None
+        return {
+            "device": node.as_dict(),
+            "access_point": self._nodes[node.access_point].as_dict()
+            if node.access_point is not None
+            else None,
+            "stations": [
+                self._nodes[station].as_dict() for station in sorted(node.stations)
+            ],
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all nodes of the topology."""
+        return {"nodes": [node.as_dict() for node in self._nodes.values()]}
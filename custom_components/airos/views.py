@@ -0,0 +1,48 @@
+"""HTTP views of the Ubiquiti airOS integration."""
+
+from __future__ import annotations
+
+from aiohttp import web
+from aiohttp.hdrs import CONTENT_DISPOSITION, CONTENT_TYPE
+from homeassistant.components.http import KEY_HASS, HomeAssistantView, require_admin
+from homeassistant.helpers.json import json_bytes
+
+from .const import DOMAIN
+from .coordinator import AirOSConfigEntry
+from .diagnostics import async_entry_diagnostics, entry_history
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+NDJSON_FILENAME = f"{DOMAIN}-diagnostics.ndjson"
+
+
+class AirOSDiagnosticsView(HomeAssistantView):
+    """Stream the diagnostics of all airOS devices, one JSON line per device."""
+
+    url = f"/api/{DOMAIN}/diagnostics"
+    name = f"api:{DOMAIN}:diagnostics"
+
+    @require_admin
+    async def get(self, request: web.Request) -> web.StreamResponse:
+        """Stream the redacted diagnostics of every loaded config entry."""
+        hass = request.app[KEY_HASS]
+        response = web.StreamResponse(
+            headers={
+                CONTENT_TYPE: NDJSON_CONTENT_TYPE,
+                CONTENT_DISPOSITION: f'attachment; filename="{NDJSON_FILENAME}"',
+            }
+        )
+        await response.prepare(request)
+
+        entry: AirOSConfigEntry
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN):
+            # Built, written and released per device, a site is never held at once
+            line = {
+                "entry_id": entry.entry_id,
+                "title": entry.title,
+                **await async_entry_diagnostics(hass, entry),
+                "history": entry_history(entry),
+            }
+            await response.write(json_bytes(line) + b"\n")
+
+        await response.write_eof()
+        return response
@@ -0,0 +1,46 @@
+"""Websocket commands of the Ubiquiti airOS integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import ATTR_DEVICE_ID, ATTR_MAC, DOMAIN
+from .models import AIROS_DATA
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the airOS websocket commands."""
+    websocket_api.async_register_command(hass, websocket_topology)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/topology",
+        vol.Exclusive(ATTR_DEVICE_ID, "device"): str,
+        vol.Exclusive(ATTR_MAC, "device"): str,
+    }
+)
+@callback
+def websocket_topology(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return a device with its links, or all devices without a device or MAC."""
+    topology = hass.data[AIROS_DATA].topology
+    if ATTR_DEVICE_ID not in msg and ATTR_MAC not in msg:
+        connection.send_result(msg["id"], topology.as_dict())
+        return
+
+    if (result := topology.lookup(msg.get(ATTR_DEVICE_ID), msg.get(ATTR_MAC))) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "airOS device not found"
+        )
+        return
+    connection.send_result(msg["id"], result)
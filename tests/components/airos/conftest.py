@@ -1,7 +1,7 @@
 """Common fixtures for the Ubiquiti airOS tests."""
 
 from collections.abc import Generator
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -9,7 +9,7 @@ from homeassistant.components.airos.const import DOMAIN
 from homeassistant.components.airos.coordinator import AirOSData
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 
-from tests.common import MockConfigEntry, load_json_object_fixture
+from tests.common import MockConfigEntry, load_fixture, load_json_object_fixture
 
 
 @pytest.fixture
@@ -35,6 +35,10 @@ def mock_airos_client(
     """Fixture to mock the AirOS API client."""
     mock_airos = AsyncMock()
     mock_airos.status.return_value = ap_fixture
+    mock_airos.last_response = load_fixture("ap-ptp.json", DOMAIN)
+    mock_airos.invalidate_session = MagicMock()
+    mock_airos.login_count = 1
+    mock_airos.relogin_count = 0
 
     if hasattr(request, "param"):
         mock_airos.login.side_effect = request.param
@@ -43,12 +47,10 @@ def mock_airos_client(
 
     with (
         patch(
-            "homeassistant.components.airos.config_flow.AirOS", return_value=mock_airos
+            "homeassistant.components.airos.config_flow.AirOSClient",
+            return_value=mock_airos,
         ),
-        patch(
-            "homeassistant.components.airos.coordinator.AirOS", return_value=mock_airos
-        ),
-        patch("homeassistant.components.airos.AirOS", return_value=mock_airos),
+        patch("homeassistant.components.airos.AirOSClient", return_value=mock_airos),
     ):
         yield mock_airos
 
@@ -0,0 +1,285 @@
+"""Stand-in airOS 8 HTTP server for load and soak testing.
+
+Emulates the login, status and stakick endpoints used by the integration,
+serving payloads generated from ``fixtures/ap-ptp.json``. Every device
+listens on its own HTTPS port on localhost with a self-signed certificate,
+like a real device, so a fleet of hundreds of devices can run next to the
+Home Assistant test instance.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from functools import cache
+import ipaddress
+import json
+from pathlib import Path
+import random
+import secrets
+import ssl
+from tempfile import TemporaryDirectory
+import time
+from typing import Any
+
+from aiohttp import web
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+FIXTURE = Path(__file__).parent / "fixtures" / "ap-ptp.json"
+
+_LOGIN_PATH = "/api/auth"
+_STATUS_PATH = "/status.cgi"
+_STAKICK_PATH = "/stakick.cgi"
+
+
+def make_status_payload(
+    station_count: int, signal: int = -59, device_id: str | None = None
+) -> dict[str, Any]:
+    """Build a status payload with the fixture station repeated."""
+    payload = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    station = payload["wireless"]["sta"][0]
+    stations = []
+    for index in range(station_count):
+        clone = copy.deepcopy(station)
+        clone["mac"] = f"02:00:00:00:{index >> 8:02X}:{index & 0xFF:02X}"
+        clone["signal"] = signal
+        clone["remote"]["hostname"] = f"station-{index}"
+        stations.append(clone)
+    payload["wireless"]["sta"] = stations
+    payload["wireless"]["count"] = station_count
+    if device_id is not None:
+        payload["host"]["device_id"] = device_id
+        payload["host"]["hostname"] = f"airOS {device_id[-6:]}"
+    return payload
+
+
+@cache
+def server_ssl_context() -> ssl.SSLContext:
+    """Return a TLS context with a self-signed certificate for localhost."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "airOS emulator")])
+    now = datetime.now(UTC)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]
+            ),
+            critical=False,
+        )
+        .sign(key, hashes.SHA256())
+    )
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    with TemporaryDirectory() as directory:
+        cert_file = Path(directory) / "cert.pem"
+        key_file = Path(directory) / "key.pem"
+        cert_file.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+        key_file.write_bytes(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+        context.load_cert_chain(cert_file, key_file)
+    return context
+
+
+@dataclass(kw_only=True)
+class EmulatorConfig:
+    """Behaviour of an emulated airOS device."""
+
+    username: str = "ubnt"
+    password: str = "ubnt"
+    stations: int = 1
+    # Seconds added to every response
+    latency: float = 0.0
+    # Fraction of requests answered with an internal server error
+    error_rate: float = 0.0
+    # Seconds a session stays valid, None to never expire
+    session_lifetime: float | None = None
+    seed: int | None = None
+
+
+@dataclass
+class EmulatorStats:
+    """Requests served by an emulated airOS device."""
+
+    logins: int = 0
+    failed_logins: int = 0
+    status_requests: int = 0
+    expired_sessions: int = 0
+    kicks: int = 0
+    errors: int = 0
+    sessions: dict[str, float] = field(default_factory=dict)
+
+
+class AirOSDeviceEmulator:
+    """A single emulated airOS 8 device."""
+
+    def __init__(self, device_id: str, config: EmulatorConfig | None = None) -> None:
+        """Initialize the device."""
+        self.device_id = device_id
+        self.config = config or EmulatorConfig()
+        self.stats = EmulatorStats()
+        self.payload = make_status_payload(self.config.stations, device_id=device_id)
+        # Seeded per device, devices sharing a config should not fail in step
+        self._random = random.Random(
+            None if self.config.seed is None else f"{self.config.seed}-{device_id}"
+        )
+        # Cookie names are per device as the HA client session shares one jar
+        self._cookie = f"AIROS_{device_id[-12:].upper()}"
+        self._kicked: set[str] = set()
+        self._runner: web.AppRunner | None = None
+        self.port: int | None = None
+
+        app = web.Application()
+        app.router.add_post(_LOGIN_PATH, self._handle_login)
+        app.router.add_get(_STATUS_PATH, self._handle_status)
+        app.router.add_post(_STAKICK_PATH, self._handle_stakick)
+        self._app = app
+
+    @property
+    def host(self) -> str:
+        """Return the host to configure the integration with."""
+        return f"127.0.0.1:{self.port}"
+
+    async def start(self) -> None:
+        """Start listening on a free port on localhost."""
+        self._runner = web.AppRunner(self._app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(
+            self._runner, "127.0.0.1", 0, ssl_context=server_ssl_context()
+        )
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        """Stop the device."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def expire_sessions(self) -> None:
+        """Invalidate all sessions, as a device reboot would."""
+        self.stats.sessions.clear()
+
+    async def _respond(self) -> web.Response | None:
+        """Apply latency and return an error response when one is due."""
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+        if self.config.error_rate and self._random.random() < self.config.error_rate:
+            self.stats.errors += 1
+            return web.Response(status=500, text="Internal Server Error")
+        return None
+
+    def _session_valid(self, request: web.Request) -> bool:
+        """Return whether the request carries a live session."""
+        token = request.cookies.get(self._cookie)
+        expires = self.stats.sessions.get(token) if token else None
+        if expires is None:
+            return False
+        if time.monotonic() > expires:
+            del self.stats.sessions[token]
+            self.stats.expired_sessions += 1
+            return False
+        return request.headers.get("X-CSRF-ID") == token
+
+    async def _handle_login(self, request: web.Request) -> web.Response:
+        """Handle a login, handing out a session cookie and CSRF token."""
+        if (error := await self._respond()) is not None:
+            return error
+
+        form = await request.post()
+        if (
+            form.get("username") != self.config.username
+            or form.get("password") != self.config.password
+        ):
+            self.stats.failed_logins += 1
+            return web.json_response({"ok": False}, status=401)
+
+        self.stats.logins += 1
+        token = secrets.token_hex(16)
+        lifetime = self.config.session_lifetime
+        self.stats.sessions[token] = (
+            time.monotonic() + lifetime if lifetime is not None else float("inf")
+        )
+        response = web.json_response({"ok": True, "fullName": self.config.username})
+        response.set_cookie(self._cookie, token, path="/", httponly=True)
+        response.headers["X-CSRF-ID"] = token
+        return response
+
+    async def _handle_status(self, request: web.Request) -> web.Response:
+        """Return the device status, redirecting to login without a session."""
+        if (error := await self._respond()) is not None:
+            return error
+        if not self._session_valid(request):
+            # airOS sends the browser to the login page once the session is gone
+            raise web.HTTPFound("/login.cgi")
+
+        self.stats.status_requests += 1
+        payload = self.payload
+        stations = []
+        for station in payload["wireless"]["sta"]:
+            if station["mac"] in self._kicked:
+                continue
+            station["signal"] = -59 + self._random.randint(-3, 3)
+            station["uptime"] += 1
+            station["tx_packets"] += self._random.randint(0, 1000)
+            stations.append(station)
+        # Kicked stations reassociate by the next poll
+        self._kicked.clear()
+        payload["host"]["uptime"] += 1
+        return web.json_response(
+            {**payload, "wireless": {**payload["wireless"], "sta": stations}}
+        )
+
+    async def _handle_stakick(self, request: web.Request) -> web.Response:
+        """Disconnect a station until the next status request."""
+        if (error := await self._respond()) is not None:
+            return error
+        if not self._session_valid(request):
+            raise web.HTTPFound("/login.cgi")
+
+        form = await request.post()
+        mac = form.get("staid")
+        if not any(
+            station["mac"] == mac for station in self.payload["wireless"]["sta"]
+        ):
+            return web.Response(status=400, text="Unknown station")
+        self.stats.kicks += 1
+        self._kicked.add(mac)
+        return web.Response(text="ok")
+
+
+class AirOSFleetEmulator:
+    """A fleet of emulated airOS devices on localhost."""
+
+    def __init__(self) -> None:
+        """Initialize the fleet."""
+        self.devices: list[AirOSDeviceEmulator] = []
+
+    async def start(self, count: int, config: EmulatorConfig | None = None) -> None:
+        """Start a number of devices sharing the same behaviour."""
+        devices = [
+            AirOSDeviceEmulator(f"{len(self.devices) + index:032x}", config)
+            for index in range(count)
+        ]
+        await asyncio.gather(*(device.start() for device in devices))
+        self.devices.extend(devices)
+
+    async def stop(self) -> None:
+        """Stop all devices."""
+        await asyncio.gather(*(device.stop() for device in self.devices))
+        self.devices.clear()
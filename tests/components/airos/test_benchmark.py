@@ -0,0 +1,203 @@
+"""Benchmarks for the Ubiquiti airOS integration.
+
+Skipped unless pytest-benchmark is installed. Results of a run are stored
+with ``--benchmark-autosave`` and a later run is compared against them with
+``--benchmark-compare``, see the README.
+
+The benchmarked code runs synchronously on the event loop of the test, so
+only callbacks and pure functions are measured. Setting up a config entry
+awaits on the event loop, so the test times it itself and stores the result
+with the extra info of the run.
+"""
+
+from collections.abc import Callable
+from statistics import fmean
+import time
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from homeassistant.components.airos.binary_sensor import AirOSClientBinarySensor
+from homeassistant.components.airos.button import AirOSClientButton
+from homeassistant.components.airos.const import DOMAIN
+from homeassistant.components.airos.coordinator import (
+    AirOSData,
+    AirOSDataUpdateCoordinator,
+)
+from homeassistant.components.airos.health import (
+    _score_numpy,
+    _score_python,
+    build_columns,
+)
+from homeassistant.components.airos.sensor import STATION_SENSORS, AirOSStationSensor
+from homeassistant.components.airos.stations import extract_station_metrics
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+
+from . import setup_integration
+from .emulator import make_status_payload
+
+from tests.common import MockConfigEntry
+
+pytest.importorskip("pytest_benchmark")
+
+STATION_COUNTS = [1, 50, 200, 500]
+ROUNDS = 5
+# Stations of the access point set up through the config entries
+SETUP_STATION_COUNT = 300
+
+# Entities every platform creates for the connected stations
+STATION_ENTITY_FACTORIES: dict[
+    Platform, Callable[[AirOSDataUpdateCoordinator], list[Entity]]
+] = {
+    Platform.SENSOR: lambda coordinator: [
+        AirOSStationSensor(coordinator, mac, description)
+        for mac in coordinator.stations
+        for description in STATION_SENSORS
+    ],
+    Platform.BINARY_SENSOR: lambda coordinator: [
+        AirOSClientBinarySensor(coordinator, mac) for mac in coordinator.stations
+    ],
+    Platform.BUTTON: lambda coordinator: [
+        AirOSClientButton(coordinator, mac) for mac in coordinator.stations
+    ],
+}
+
+
+async def _setup_integration(
+    hass: HomeAssistant, config_entry: MockConfigEntry, platforms: list[Platform]
+) -> None:
+    """Set up the integration forwarding only the given platforms."""
+    with patch("homeassistant.components.airos._PLATFORMS", platforms):
+        await setup_integration(hass, config_entry)
+
+
+@pytest.mark.parametrize("station_count", STATION_COUNTS)
+def test_parse_status(benchmark: Any, station_count: int) -> None:
+    """Benchmark decoding a status payload."""
+    payload = make_status_payload(station_count)
+
+    data = benchmark(AirOSData.from_dict, payload)
+
+    assert len(data.wireless.sta) == station_count
+
+
+@pytest.mark.parametrize("station_count", STATION_COUNTS)
+@pytest.mark.parametrize("vectorised", [True, False])
+def test_health_scoring(benchmark: Any, station_count: int, vectorised: bool) -> None:
+    """Benchmark scoring the link health of all stations."""
+    if vectorised:
+        pytest.importorskip("numpy")
+    data = AirOSData.from_dict(make_status_payload(station_count))
+    stations = {station.mac.lower(): station for station in data.wireless.sta}
+    columns = build_columns(
+        stations.values(), extract_station_metrics(stations).values()
+    )
+
+    scores = benchmark(_score_numpy if vectorised else _score_python, columns)
+
+    assert len(scores) == station_count
+
+
+@pytest.mark.usefixtures("mock_airos_client")
+@pytest.mark.parametrize("station_count", STATION_COUNTS)
+@pytest.mark.parametrize("platform", list(STATION_ENTITY_FACTORIES))
+async def test_station_entities(
+    hass: HomeAssistant,
+    benchmark: Any,
+    mock_config_entry: MockConfigEntry,
+    platform: Platform,
+    station_count: int,
+) -> None:
+    """Benchmark creating the entities of a platform for every station."""
+    await _setup_integration(hass, mock_config_entry, [])
+    coordinator = mock_config_entry.runtime_data
+    coordinator._process(AirOSData.from_dict(make_status_payload(station_count)))
+
+    entities = benchmark.pedantic(
+        STATION_ENTITY_FACTORIES[platform], args=(coordinator,), rounds=ROUNDS
+    )
+
+    assert len(entities) >= station_count
+
+
+# Only the extra info of the benchmark is set, the fixture times nothing
+@pytest.mark.filterwarnings("ignore:Benchmark fixture was not used")
+async def test_config_entry_setup(
+    hass: HomeAssistant,
+    benchmark: Any,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Benchmark setting up a config entry with a few hundred stations."""
+    mock_airos_client.status.return_value = AirOSData.from_dict(
+        make_status_payload(SETUP_STATION_COUNT)
+    )
+    mock_config_entry.add_to_hass(hass)
+
+    durations: list[float] = []
+    for _ in range(ROUNDS):
+        if mock_config_entry.state is ConfigEntryState.LOADED:
+            assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+            await hass.async_block_till_done()
+        started = time.perf_counter()
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+        durations.append(time.perf_counter() - started)
+
+    benchmark.extra_info["config_entry_setup_s"] = {
+        "min": min(durations),
+        "mean": fmean(durations),
+        "max": max(durations),
+    }
+    domains = [
+        entry.domain
+        for entry in er.async_entries_for_config_entry(
+            er.async_get(hass), mock_config_entry.entry_id
+        )
+    ]
+    for platform in (Platform.SENSOR, Platform.BINARY_SENSOR, Platform.BUTTON):
+        assert domains.count(platform) >= SETUP_STATION_COUNT
+
+
+@pytest.mark.parametrize("station_count", STATION_COUNTS)
+async def test_refresh_fan_out(
+    hass: HomeAssistant,
+    benchmark: Any,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    station_count: int,
+) -> None:
+    """Benchmark processing a status until every entity is updated."""
+    payloads = [
+        AirOSData.from_dict(make_status_payload(station_count, signal))
+        for signal in (-59, -60)
+    ]
+    mock_airos_client.status.return_value = payloads[0]
+    await _setup_integration(
+        hass,
+        mock_config_entry,
+        [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.BUTTON],
+    )
+    coordinator = mock_config_entry.runtime_data
+
+    def _next_payload() -> tuple[tuple[AirOSData], dict[str, Any]]:
+        # Alternate the signal so every station entity has a changed value
+        payloads.reverse()
+        return (payloads[0],), {}
+
+    def _update(data: AirOSData) -> None:
+        coordinator._process(data)
+        coordinator.async_set_updated_data(data)
+
+    benchmark.pedantic(_update, setup=_next_payload, rounds=ROUNDS)
+    await hass.async_block_till_done()
+
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, "device0123_02:00:00:00:00:00_signal"
+    )
+    assert hass.states.get(entity_id).state == str(payloads[0].wireless.sta[0].signal)
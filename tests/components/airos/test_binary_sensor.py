@@ -1,9 +1,17 @@
 """Test the Ubiquiti airOS binary sensors."""
 
+from dataclasses import replace
 from unittest.mock import AsyncMock
 
+from homeassistant.components.airos.const import DOMAIN
 from homeassistant.components.airos.coordinator import AirOSData
-from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    STATE_OFF,
+    STATE_ON,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 from syrupy.assertion import SnapshotAssertion
@@ -31,3 +39,93 @@ async def test_all_entities(
     """Test all entities."""
     await setup_integration(hass, mock_config_entry)
 
+
+async def test_client_connectivity(
+    hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    ap_fixture: AirOSData,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the connectivity of a station follows the station index."""
+    await setup_integration(hass, mock_config_entry)
+
+    entity_id = entity_registry.async_get_entity_id(
+        "binary_sensor", DOMAIN, "device0123_01:23:45:67:89:ab_connectivity"
+    )
+    assert entity_id is not None
+    assert hass.states.get(entity_id).state == STATE_ON
+
+    mock_airos_client.status.return_value = replace(
+        ap_fixture, wireless=replace(ap_fixture.wireless, sta=[])
+    )
+    await mock_config_entry.runtime_data.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_id).state == STATE_OFF
+
+
+async def test_client_associating_later(
+    hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    ap_fixture: AirOSData,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test a station associating after setup gets its entities without reload."""
+    await setup_integration(hass, mock_config_entry)
+
+    unique_id = "device0123_aa:bb:cc:dd:ee:ff_connectivity"
+    assert (
+        entity_registry.async_get_entity_id("binary_sensor", DOMAIN, unique_id) is None
+    )
+
+    station = ap_fixture.wireless.sta[0]
+    mock_airos_client.status.return_value = replace(
+        ap_fixture,
+        wireless=replace(
+            ap_fixture.wireless,
+            sta=[station, replace(station, mac="AA:BB:CC:DD:EE:FF")],
+        ),
+    )
+    await mock_config_entry.runtime_data.async_refresh()
+    await hass.async_block_till_done()
+
+    entity_id = entity_registry.async_get_entity_id("binary_sensor", DOMAIN, unique_id)
+    assert entity_id is not None
+    assert hass.states.get(entity_id).state == STATE_ON
+    # Added without reloading, which would have polled once more
+    assert mock_airos_client.status.call_count == 2
+
+
+async def test_interface_binary_sensors(
+    hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    ap_fixture: AirOSData,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the link and duplex of an interface follow its status."""
+    await setup_integration(hass, mock_config_entry)
+
+    plugged = entity_registry.async_get_entity_id(
+        "binary_sensor", DOMAIN, "device0123_eth0_plugged"
+    )
+    duplex = entity_registry.async_get_entity_id(
+        "binary_sensor", DOMAIN, "device0123_eth0_duplex"
+    )
+    assert hass.states.get(plugged).state == STATE_ON
+    assert hass.states.get(duplex).state == STATE_ON
+
+    mock_airos_client.status.return_value = replace(
+        ap_fixture,
+        interfaces=[
+            replace(interface, status=replace(interface.status, duplex=False))
+            for interface in ap_fixture.interfaces
+        ],
+    )
+    await mock_config_entry.runtime_data.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(plugged).state == STATE_ON
+    assert hass.states.get(duplex).state == STATE_OFF
@@ -0,0 +1,63 @@
+"""Test the Ubiquiti airOS buttons."""
+
+from dataclasses import replace
+from unittest.mock import AsyncMock
+
+from homeassistant.components.airos.const import DOMAIN
+from homeassistant.components.airos.coordinator import AirOSData
+from homeassistant.components.button import DOMAIN as BUTTON_DOMAIN, SERVICE_PRESS
+from homeassistant.const import ATTR_ENTITY_ID, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from . import setup_integration
+
+from tests.common import MockConfigEntry
+
+BUTTON_UNIQUE_ID = "device0123_0123456789ab_restart_connection"
+
+
+async def test_restart_connection(
+    hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test pressing the button kicks the station."""
+    await setup_integration(hass, mock_config_entry)
+
+    entity_id = entity_registry.async_get_entity_id(
+        BUTTON_DOMAIN, DOMAIN, BUTTON_UNIQUE_ID
+    )
+    assert entity_id is not None
+
+    await hass.services.async_call(
+        BUTTON_DOMAIN, SERVICE_PRESS, {ATTR_ENTITY_ID: entity_id}, blocking=True
+    )
+
+    # The station is kicked by the MAC as reported by the device
+    mock_airos_client.stakick.assert_called_once_with("01:23:45:67:89:AB")
+
+
+async def test_departed_station_unavailable(
+    hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    ap_fixture: AirOSData,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the button of a departed station becomes unavailable."""
+    await setup_integration(hass, mock_config_entry)
+
+    entity_id = entity_registry.async_get_entity_id(
+        BUTTON_DOMAIN, DOMAIN, BUTTON_UNIQUE_ID
+    )
+    assert hass.states.get(entity_id).state != STATE_UNAVAILABLE
+
+    mock_airos_client.status.return_value = replace(
+        ap_fixture, wireless=replace(ap_fixture.wireless, sta=[])
+    )
+    await mock_config_entry.runtime_data.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
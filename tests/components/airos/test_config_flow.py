@@ -1,7 +1,10 @@
 """Test the Ubiquiti airOS config flow."""
 
+from dataclasses import replace
+import ipaddress
+import struct
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 from airos.exceptions import (
     ConnectionAuthenticationError,
@@ -10,12 +13,35 @@ from airos.exceptions import (
 )
 import pytest
 
-from homeassistant.components.airos.const import DOMAIN
+import aiohttp
+from homeassistant.components.airos.const import (
+    CONF_DEVICES,
+    CONF_MAX_CONCURRENT_POLLS,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_POLL_JITTER,
+    CONF_REMOTE_REPORT,
+    CONF_STATION_STATISTICS,
+    CONF_SUBNET,
+    DEFAULT_MAX_CONCURRENT_POLLS,
+    DEFAULT_POLL_JITTER,
+    DOMAIN,
+)
 from homeassistant.components.airos.coordinator import AirOSData
+from homeassistant.components.airos.discovery import (
+    DiscoveredDevice,
+    ScanResult,
+    async_scan,
+    parse_discovery_response,
+)
 from homeassistant.config_entries import SOURCE_USER
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from tests.common import MockConfigEntry
+from tests.test_util.aiohttp import AiohttpClientMocker
 
 MOCK_CONFIG = {
     CONF_HOST: "1.1.1.1",
@@ -34,6 +60,11 @@ async def test_form_creates_entry(
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": SOURCE_USER}
     )
+    assert result["type"] is FlowResultType.MENU
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "manual"}
+    )
     assert result["type"] is FlowResultType.FORM
     assert result["errors"] == {}
 
@@ -52,6 +83,9 @@ async def test_form_creates_entry(
     result2 = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": SOURCE_USER}
     )
+    result2 = await hass.config_entries.flow.async_configure(
+        result2["flow_id"], {"next_step_id": "manual"}
+    )
 
     result2 = await hass.config_entries.flow.async_configure(
         result2["flow_id"],
@@ -82,6 +116,9 @@ async def test_form_exception_handling(
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": SOURCE_USER}
     )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "manual"}
+    )
 
     result = await hass.config_entries.flow.async_configure(
         result["flow_id"],
@@ -103,3 +140,251 @@ async def test_form_exception_handling(
     assert result["title"] == "NanoStation 5AC ap name"
     assert result["data"] == MOCK_CONFIG
     assert len(mock_setup_entry.mock_calls) == 1
+
+
+async def test_reauth(
+    hass: HomeAssistant,
+    mock_setup_entry: AsyncMock,
+    mock_airos_client: AsyncMock,
+) -> None:
+    """Test reauthentication updates the password of the entry."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=MOCK_CONFIG, unique_id="03aa0d0b40fed0a47088293584ef5432"
+    )
+    entry.add_to_hass(hass)
+
+    result = await entry.start_reauth_flow(hass)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "reauth_confirm"
+
+    mock_airos_client.login.side_effect = ConnectionAuthenticationError
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_PASSWORD: "wrong-password"}
+    )
+    assert result["errors"] == {"base": "invalid_auth"}
+
+    mock_airos_client.login.side_effect = None
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_PASSWORD: "new-password"}
+    )
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reauth_successful"
+    assert entry.data == {**MOCK_CONFIG, CONF_PASSWORD: "new-password"}
+
+
+async def test_reauth_other_device(
+    hass: HomeAssistant,
+    mock_setup_entry: AsyncMock,
+    mock_airos_client: AsyncMock,
+) -> None:
+    """Test reauthentication aborts when another device answers."""
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, unique_id="other")
+    entry.add_to_hass(hass)
+
+    result = await entry.start_reauth_flow(hass)
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_PASSWORD: "new-password"}
+    )
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "unique_id_mismatch"
+    assert entry.data == MOCK_CONFIG
+
+
+async def test_options_flow(
+    hass: HomeAssistant,
+    mock_setup_entry: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test setting the poll interval bounds."""
+    mock_config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_MIN_SCAN_INTERVAL: 120, CONF_MAX_SCAN_INTERVAL: 60},
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_scan_interval"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_MIN_SCAN_INTERVAL: 30, CONF_MAX_SCAN_INTERVAL: 600},
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert mock_config_entry.options == {
+        CONF_MIN_SCAN_INTERVAL: 30,
+        CONF_MAX_SCAN_INTERVAL: 600,
+        CONF_STATION_STATISTICS: False,
+        CONF_REMOTE_REPORT: False,
+        CONF_MAX_CONCURRENT_POLLS: DEFAULT_MAX_CONCURRENT_POLLS,
+        CONF_POLL_JITTER: DEFAULT_POLL_JITTER,
+    }
+
+
+def _with_device(ap_fixture: AirOSData, device_id: str) -> AirOSData:
+    """Return the fixture status of another device."""
+    return replace(
+        ap_fixture,
+        host=replace(ap_fixture.host, device_id=device_id, hostname=f"ap {device_id}"),
+    )
+
+
+async def test_scan_creates_entries(
+    hass: HomeAssistant,
+    mock_setup_entry: AsyncMock,
+    mock_airos_client: AsyncMock,
+    ap_fixture: AirOSData,
+) -> None:
+    """Test devices found by a subnet scan are added in one flow."""
+    MockConfigEntry(domain=DOMAIN, unique_id="configured").add_to_hass(hass)
+    hosts = ["10.0.0.1", "10.0.0.2", "10.0.0.3", "10.0.0.4"]
+    mock_airos_client.status.side_effect = [
+        _with_device(ap_fixture, "configured"),
+        _with_device(ap_fixture, "new1"),
+        _with_device(ap_fixture, "new2"),
+        ConnectionAuthenticationError,
+        # Validated again by the flow adding the second device
+        _with_device(ap_fixture, "new2"),
+    ]
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "scan"}
+    )
+    assert result["step_id"] == "scan"
+
+    with patch(
+        "homeassistant.components.airos.config_flow.async_scan",
+        return_value=ScanResult(
+            {host: DiscoveredDevice(host=host) for host in hosts}, ["10.0.0.5"]
+        ),
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_SUBNET: "10.0.0.0/29", CONF_USERNAME: "ubnt", CONF_PASSWORD: "pw"},
+        )
+        assert result["type"] is FlowResultType.SHOW_PROGRESS
+        assert result["progress_action"] == "scan"
+        await hass.async_block_till_done()
+
+    result = await hass.config_entries.flow.async_configure(result["flow_id"])
+
+    # Configured devices and devices refusing the credentials are left out
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "select"
+    assert result["description_placeholders"] == {"unknown": "10.0.0.5"}
+    assert mock_airos_client.login.call_count == 4
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_DEVICES: ["10.0.0.2", "10.0.0.3"]}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["title"] == "ap new1"
+    assert result["data"] == {
+        CONF_HOST: "10.0.0.2",
+        CONF_USERNAME: "ubnt",
+        CONF_PASSWORD: "pw",
+    }
+    entries = hass.config_entries.async_entries(DOMAIN)
+    assert {entry.unique_id for entry in entries} == {"configured", "new1", "new2"}
+    assert len(mock_setup_entry.mock_calls) == 2
+
+
+@pytest.mark.parametrize(
+    ("subnet", "error"),
+    [("10.0.0.300/24", "invalid_subnet"), ("10.0.0.0/16", "subnet_too_large")],
+)
+async def test_scan_invalid_subnet(
+    hass: HomeAssistant, mock_setup_entry: AsyncMock, subnet: str, error: str
+) -> None:
+    """Test only subnets of a limited size are scanned."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "scan"}
+    )
+
+    with patch(
+        "homeassistant.components.airos.config_flow.async_scan",
+        return_value=ScanResult(),
+    ) as mock_scan:
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_SUBNET: subnet, CONF_USERNAME: "ubnt", CONF_PASSWORD: "pw"},
+        )
+        assert result["errors"] == {CONF_SUBNET: error}
+        mock_scan.assert_not_called()
+
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_SUBNET: "10.0.0.0/24", CONF_USERNAME: "ubnt", CONF_PASSWORD: "pw"},
+        )
+        await hass.async_block_till_done()
+
+    result = await hass.config_entries.flow.async_configure(result["flow_id"])
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "no_devices_found"
+
+
+async def test_scan_fingerprint(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test only hosts recognized as airOS are returned as devices."""
+    aioclient_mock.get("https://10.0.0.1/", cookies={"AIROS_0123456789AB": "x"})
+    aioclient_mock.get("https://10.0.0.2/", text="<title>airOS</title>")
+    aioclient_mock.get("https://10.0.0.3/", text="<title>Router</title>")
+    aioclient_mock.get("https://10.0.0.4/", exc=aiohttp.ClientConnectionError)
+    aioclient_mock.get("https://10.0.0.5/", exc=TimeoutError)
+    discovered = {"10.0.0.6": DiscoveredDevice(host="10.0.0.6", hostname="ap")}
+
+    with patch(
+        "homeassistant.components.airos.discovery.async_discover",
+        return_value=discovered,
+    ):
+        result = await async_scan(
+            ipaddress.ip_network("10.0.0.0/29"),
+            async_get_clientsession(hass, verify_ssl=False),
+        )
+
+    assert result.devices == {
+        "10.0.0.1": DiscoveredDevice(host="10.0.0.1"),
+        "10.0.0.2": DiscoveredDevice(host="10.0.0.2"),
+        **discovered,
+    }
+    # A web server that is not airOS never gets the credentials
+    assert result.unknown == ["10.0.0.3"]
+    assert aioclient_mock.call_count == 5
+
+
+def test_parse_discovery_response() -> None:
+    """Test parsing a response of the Ubiquiti discovery protocol."""
+    fields = [
+        (0x02, bytes.fromhex("0123456789ab") + bytes([10, 0, 0, 1])),
+        (0x03, b"WA.ar934x.v8.7.17"),
+        (0x0B, b"NanoStation 5AC ap name"),
+        (0x0C, b"NS-5AC"),
+        (0x14, b"NanoStation 5AC loco"),
+    ]
+    payload = b"".join(
+        struct.pack("!BH", field, len(value)) + value for field, value in fields
+    )
+    packet = struct.pack("!BBH", 1, 0, len(payload)) + payload
+
+    assert parse_discovery_response("10.0.0.1", packet) == DiscoveredDevice(
+        host="10.0.0.1",
+        hostname="NanoStation 5AC ap name",
+        model="NanoStation 5AC loco",
+        mac="01:23:45:67:89:ab",
+        firmware="WA.ar934x.v8.7.17",
+    )
+    assert parse_discovery_response("10.0.0.1", b"\x01\x00\x00\x00") is None
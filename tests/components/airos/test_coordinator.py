@@ -1,6 +1,10 @@
 """Coordinator Ubiquiti airOS tests."""
 
 from asyncio import TimeoutError
+from dataclasses import replace
+from datetime import timedelta
+import json
+import time
 from typing import Any
 from unittest.mock import AsyncMock
 
@@ -8,16 +12,49 @@ from airos.exceptions import (
     ConnectionAuthenticationError,
     DataMissingError,
     DeviceConnectionError,
+    KeyDataMissingError,
 )
 import pytest
 
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.components.airos.breaker import BreakerState
+from homeassistant.components.airos.client import decode_status
+from homeassistant.components.airos.const import (
+    BREAKER_MIN_BACKOFF,
+    BREAKER_THRESHOLD,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_REMOTE_REPORT,
+    DOMAIN,
+    EVENT_STATION_CONNECTED,
+    EVENT_STATION_DISCONNECTED,
+    EVENT_STATION_ROAMED,
+    REMOTE_REPORT_DIRECT_POLL,
+    SCAN_INTERVAL,
+)
 from homeassistant.components.airos.coordinator import (
     AirOSData,
     AirOSDataUpdateCoordinator,
 )
+from homeassistant.components.airos.events import StationEvents, StationOwners
+from homeassistant.components.airos.health import (
+    _score_numpy,
+    _score_python,
+    build_columns,
+    score_stations,
+)
+from homeassistant.components.airos.projection import PROJECTION_FIELDS
+from homeassistant.components.airos.remote import RemoteReports
+from homeassistant.components.airos.scheduler import AirOSPollScheduler
+from homeassistant.components.airos.stations import StationRateTracker
+from homeassistant.components.airos.topology import AirOSTopology
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import ConfigEntryError, UpdateFailed
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from tests.common import MockConfigEntry, async_capture_events, load_fixture
+
+REPORT_MAX_AGE = timedelta(minutes=2)
 
 
 @pytest.fixture
@@ -27,20 +64,19 @@ def mock_hass():
 
 
 @pytest.mark.parametrize(
-    ("mock_airos_client", "expectation_error", "expected_key"),
+    ("side_effect", "expectation_error", "expected_key"),
     [
-        (ConnectionAuthenticationError, ConfigEntryError, "invalid_auth"),
+        (ConnectionAuthenticationError, ConfigEntryAuthFailed, "invalid_auth"),
         (TimeoutError, UpdateFailed, "cannot_connect"),
         (DeviceConnectionError, UpdateFailed, "cannot_connect"),
         (DataMissingError, UpdateFailed, "error_data_missing"),
     ],
-    indirect=["mock_airos_client"],
 )
 async def test_coordinator_async_update_data_exceptions(
     mock_hass: HomeAssistant,
     mock_config_entry: ConfigEntry,
     mock_airos_client: AsyncMock,
-    ap_fixture: AirOSData,
+    side_effect: type[Exception],
     expected_key: str,
     expectation_error: Any,
 ) -> None:
@@ -48,9 +84,477 @@ async def test_coordinator_async_update_data_exceptions(
     coordinator = AirOSDataUpdateCoordinator(
         mock_hass, mock_config_entry, mock_airos_client
     )
+    mock_airos_client.status.side_effect = side_effect
 
     with pytest.raises(expectation_error) as excinfo:
         await coordinator._async_update_data()
     assert excinfo.value.translation_key == expected_key
-    mock_airos_client.login.assert_called_once()
-    mock_airos_client.status.assert_not_called()
+    mock_airos_client.status.assert_called_once()
+    mock_airos_client.invalidate_session.assert_called_once()
+
+
+async def test_coordinator_adaptive_poll_interval(
+    mock_hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_airos_client: AsyncMock,
+    ap_fixture: AirOSData,
+) -> None:
+    """Test the poll interval stretches while stable and drops on changes."""
+    coordinator = AirOSDataUpdateCoordinator(
+        mock_hass, mock_config_entry, mock_airos_client
+    )
+    assert coordinator.update_interval == SCAN_INTERVAL
+
+    # First update keeps the interval, shifted once by the start offset
+    await coordinator._async_update_data()
+    assert coordinator.poll_interval.interval == SCAN_INTERVAL
+    assert coordinator.update_interval >= SCAN_INTERVAL
+
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == SCAN_INTERVAL * 1.5
+
+    station = ap_fixture.wireless.sta[0]
+    mock_airos_client.status.return_value = replace(
+        ap_fixture,
+        wireless=replace(
+            ap_fixture.wireless, sta=[replace(station, signal=station.signal - 10)]
+        ),
+    )
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=15)
+
+
+async def test_coordinator_uses_scheduler_slot(
+    mock_hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_airos_client: AsyncMock,
+) -> None:
+    """Test polls are counted by the shared scheduler."""
+    scheduler = AirOSPollScheduler(max_concurrent=1, jitter=0)
+    coordinator = AirOSDataUpdateCoordinator(
+        mock_hass, mock_config_entry, mock_airos_client, scheduler
+    )
+    unregister = scheduler.async_register(coordinator)
+
+    await coordinator._async_update_data()
+    await coordinator._async_update_data()
+
+    stats = scheduler.as_dict()
+    assert stats["registered"] == 1
+    assert stats["requests"] == 2
+    assert stats["in_flight"] == 0
+    assert stats["queue_depth"] == 0
+    assert coordinator.update_interval == SCAN_INTERVAL * 1.5
+
+    unregister()
+    assert scheduler.as_dict()["registered"] == 0
+
+
+async def test_coordinator_poll_instrumentation(
+    mock_hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_airos_client: AsyncMock,
+    ap_fixture: AirOSData,
+) -> None:
+    """Test poll phases are timed and failures counted by exception class."""
+    coordinator = AirOSDataUpdateCoordinator(
+        mock_hass, mock_config_entry, mock_airos_client
+    )
+    mock_airos_client.status.side_effect = [
+        ap_fixture,
+        DeviceConnectionError,
+        DeviceConnectionError,
+        TimeoutError,
+    ]
+
+    await coordinator._async_update_data()
+    last_success = coordinator.instrumentation.last_success
+    assert last_success is not None
+
+    for _ in range(3):
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+    timing = coordinator.instrumentation.as_dict()
+    assert timing["failures"] == {"DeviceConnectionError": 2, "TimeoutError": 1}
+    assert timing["last_success"] == last_success.isoformat()
+    # Every failure resets the session, so the next attempt logs in again
+    assert mock_airos_client.invalidate_session.call_count == 3
+    assert timing["phases"]["process"]["samples"] == 1
+    assert sum(timing["phases"]["process"]["histogram"].values()) == 1
+    # Login, request and decode are only timed by the HTTP client
+    assert timing["phases"]["login"]["samples"] == 0
+    assert timing["phases"]["request"]["samples"] == 0
+
+
+async def test_coordinator_circuit_breaker(
+    mock_hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_airos_client: AsyncMock,
+    ap_fixture: AirOSData,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test polls back off after repeated connection failures."""
+    coordinator = AirOSDataUpdateCoordinator(
+        mock_hass, mock_config_entry, mock_airos_client
+    )
+    mock_airos_client.status.side_effect = DeviceConnectionError
+
+    for _ in range(BREAKER_THRESHOLD):
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+    assert coordinator.breaker.state is BreakerState.OPEN
+    assert coordinator.update_interval == BREAKER_MIN_BACKOFF
+
+    # Open breaker refuses polls without touching the device
+    with pytest.raises(UpdateFailed) as excinfo:
+        await coordinator._async_update_data()
+    assert excinfo.value.translation_key == "device_unreachable"
+    assert mock_airos_client.status.call_count == BREAKER_THRESHOLD
+
+    # A failing probe doubles the backoff
+    freezer.tick(BREAKER_MIN_BACKOFF)
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    assert mock_airos_client.status.call_count == BREAKER_THRESHOLD + 1
+    assert coordinator.breaker.state is BreakerState.OPEN
+    assert coordinator.update_interval == BREAKER_MIN_BACKOFF * 2
+
+    # A successful probe closes the breaker
+    mock_airos_client.status.side_effect = None
+    freezer.tick(BREAKER_MIN_BACKOFF * 2)
+    assert await coordinator._async_update_data() == ap_fixture
+    assert coordinator.breaker.as_dict() == {
+        "state": "closed",
+        "consecutive_failures": 0,
+        "opened": 2,
+        "backoff_s": 0,
+        "next_probe": None,
+    }
+
+
+async def test_coordinator_remote_report(
+    mock_hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    ap_fixture: AirOSData,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a device reported by its access point is only polled as a fallback."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={},
+        options={CONF_REMOTE_REPORT: True},
+        unique_id="device0123",
+    )
+    reports = RemoteReports()
+    coordinator = AirOSDataUpdateCoordinator(
+        mock_hass, entry, mock_airos_client, remote_reports=reports
+    )
+    # Stations and interfaces need a direct poll first
+    coordinator.data = await coordinator._async_update_data()
+    assert mock_airos_client.status.call_count == 1
+
+    station = ap_fixture.wireless.sta[0]
+    remote = replace(station.remote, device_id="device0123", cpuload=99.0)
+    reports.update(
+        "ap",
+        {station.mac: replace(station, remote=remote)},
+        time.monotonic(),
+        REPORT_MAX_AGE.total_seconds(),
+    )
+
+    data = await coordinator._async_update_data()
+    assert data.host.cpuload == 99.0
+    assert data.wireless.throughput.tx == remote.tx_throughput
+    assert mock_airos_client.status.call_count == 1
+    assert coordinator.remote_report_count == 1
+    # The report goes through the same processing as a poll
+    assert coordinator.instrumentation.as_dict()["phases"]["process"]["samples"] == 2
+
+    # The access point stopped reporting the device
+    freezer.tick(REPORT_MAX_AGE)
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator.data.host.cpuload == ap_fixture.host.cpuload
+    assert mock_airos_client.status.call_count == 2
+
+    # Reports of an unloaded access point are dropped
+    reports.update(
+        "ap",
+        {station.mac: replace(station, remote=remote)},
+        time.monotonic(),
+        REPORT_MAX_AGE.total_seconds(),
+    )
+    reports.async_remove("ap")
+    assert reports.get("device0123", time.monotonic()) is None
+
+    # Fresh reports are ignored once a direct poll is due
+    freezer.tick(REMOTE_REPORT_DIRECT_POLL + timedelta(seconds=1))
+    reports.update(
+        "ap",
+        {station.mac: replace(station, remote=remote)},
+        time.monotonic(),
+        REPORT_MAX_AGE.total_seconds(),
+    )
+    await coordinator._async_update_data()
+    assert mock_airos_client.status.call_count == 3
+    assert coordinator.remote_report_count == 1
+
+
+async def test_coordinator_remote_report_max_interval(
+    mock_hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    ap_fixture: AirOSData,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test reports of an access point at its max interval last until the next one."""
+    scheduler = AirOSPollScheduler()
+    reports = RemoteReports()
+    ap = AirOSDataUpdateCoordinator(
+        mock_hass,
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={},
+            options={CONF_MAX_SCAN_INTERVAL: 600},
+            unique_id="ap",
+        ),
+        mock_airos_client,
+        scheduler,
+        remote_reports=reports,
+    )
+    station_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={},
+        options={CONF_REMOTE_REPORT: True},
+        unique_id="device0123",
+    )
+    coordinator = AirOSDataUpdateCoordinator(
+        mock_hass,
+        station_entry,
+        mock_airos_client,
+        scheduler,
+        remote_reports=reports,
+    )
+    coordinator.data = await coordinator._async_update_data()
+    assert mock_airos_client.status.call_count == 1
+
+    station = ap_fixture.wireless.sta[0]
+    remote = replace(station.remote, device_id="device0123", age=0)
+    ap.update_interval = ap.poll_interval.maximum
+    ap._process(
+        replace(
+            ap_fixture,
+            wireless=replace(
+                ap_fixture.wireless, sta=[replace(station, remote=remote)]
+            ),
+        )
+    )
+    assert ap.remote_report_max_age == 2 * 600 + scheduler.jitter
+
+    # Still fresh right before the access point polls again
+    freezer.tick(ap.poll_interval.maximum)
+    await coordinator._async_update_data()
+    assert mock_airos_client.status.call_count == 1
+    assert coordinator.remote_report_count == 1
+
+    # Expired once the access point missed its next poll as well
+    freezer.tick(ap.poll_interval.maximum + timedelta(seconds=scheduler.jitter + 1))
+    assert reports.get("device0123", time.monotonic()) is None
+
+
+async def test_coordinator_projection(
+    mock_hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_airos_client: AsyncMock,
+) -> None:
+    """Test polls decode only the fields required by entities once they are added."""
+    coordinator = AirOSDataUpdateCoordinator(
+        mock_hass, mock_config_entry, mock_airos_client
+    )
+
+    await coordinator._async_update_data()
+    mock_airos_client.status.assert_called_with(keep=None)
+
+    coordinator.async_start_projection()
+    await coordinator._async_update_data()
+    mock_airos_client.status.assert_called_with(keep=frozenset())
+
+    release = coordinator.async_require_fields({"chainrssi"})
+    coordinator.async_require_fields({"chainrssi", "airmax"})
+    await coordinator._async_update_data()
+    mock_airos_client.status.assert_called_with(keep=frozenset({"chainrssi", "airmax"}))
+
+    release()
+    assert coordinator.projection == frozenset({"chainrssi", "airmax"})
+
+
+def test_decode_status_projection(ap_fixture: AirOSData) -> None:
+    """Test fields left out of the projection are not decoded."""
+    response = load_fixture("ap-ptp.json", DOMAIN)
+    status = json.loads(response)
+
+    assert decode_status(response) == ap_fixture
+    assert decode_status(response, keep=PROJECTION_FIELDS) == ap_fixture
+
+    data = decode_status(response, keep={"chainrssi"})
+    station = data.wireless.sta[0]
+    assert station.chainrssi == ap_fixture.wireless.sta[0].chainrssi
+    assert station.remote == replace(
+        ap_fixture.wireless.sta[0].remote,
+        tx_ratedata=status["wireless"]["sta"][0]["remote"]["tx_ratedata"],
+        ethlist=status["wireless"]["sta"][0]["remote"]["ethlist"],
+        gps=status["wireless"]["sta"][0]["remote"]["gps"],
+        service=status["wireless"]["sta"][0]["remote"]["service"],
+    )
+    assert station.airmax == status["wireless"]["sta"][0]["airmax"]
+    assert data.interfaces == status["interfaces"]
+    assert data.host == ap_fixture.host
+
+    del status["wireless"]["sta"][0]["remote"]["hostname"]
+    with pytest.raises(KeyDataMissingError):
+        decode_status(json.dumps(status), keep=())
+
+
+async def test_station_events(hass: HomeAssistant, ap_fixture: AirOSData) -> None:
+    """Test stations associating, leaving and roaming between devices."""
+    station = ap_fixture.wireless.sta[0]
+    mac = station.mac.lower()
+    owners = StationOwners()
+    ap1 = StationEvents(hass, "entry1", owners)
+    ap2 = StationEvents(hass, "entry2", owners)
+    connected = async_capture_events(hass, EVENT_STATION_CONNECTED)
+    disconnected = async_capture_events(hass, EVENT_STATION_DISCONNECTED)
+    roamed = async_capture_events(hass, EVENT_STATION_ROAMED)
+
+    # Stations connected at the first poll fire nothing
+    ap1.async_update(None, {mac: station}, [])
+    ap2.async_update(None, {}, [])
+    ap1.async_update({mac: station}, {mac: station}, [])
+    await hass.async_block_till_done()
+    assert not connected
+    assert not disconnected
+
+    ap1.async_update({mac: station}, {}, [{"mac": station.mac, "reason_code": 3}])
+    ap2.async_update({}, {mac: station}, [])
+    await hass.async_block_till_done()
+
+    assert len(disconnected) == 1
+    assert disconnected[0].data == {
+        "config_entry_id": "entry1",
+        "mac": mac,
+        "hostname": station.remote.hostname,
+        "signal": station.signal,
+        "uptime": station.uptime,
+        "last_disc": station.last_disc,
+        "disconnect_info": {"mac": station.mac, "reason_code": 3},
+    }
+    assert [event.data["config_entry_id"] for event in connected] == ["entry2"]
+    assert len(roamed) == 1
+    assert roamed[0].data["config_entry_id"] == "entry2"
+    assert roamed[0].data["from_config_entry_id"] == "entry1"
+
+    assert [event["event"] for event in ap1.log] == [EVENT_STATION_DISCONNECTED]
+    assert [event["event"] for event in ap2.log] == [
+        EVENT_STATION_CONNECTED,
+        EVENT_STATION_ROAMED,
+    ]
+
+    # Reassociating with the same device is no roam
+    ap2.async_update({mac: station}, {}, [])
+    ap2.async_update({}, {mac: station}, [])
+    await hass.async_block_till_done()
+    assert len(connected) == 2
+    assert len(roamed) == 1
+
+
+def test_station_health(ap_fixture: AirOSData) -> None:
+    """Test stations are scored on signal, linkscore, capacity, retries and chains."""
+    station = ap_fixture.wireless.sta[0]
+    stations = {"healthy": station}
+    metrics = {"healthy": {"retry_ratio": None}}
+    assert score_stations(stations, metrics) == {"healthy": 82}
+
+    stations["retrying"] = station
+    metrics["retrying"] = {"retry_ratio": 10.0}
+    stations["weak"] = replace(station, signal=-70, ul_linkscore=40)
+    metrics["weak"] = {"retry_ratio": None}
+    assert score_stations(stations, metrics) == {
+        "healthy": 82,
+        "retrying": 72,
+        "weak": 42,
+    }
+    assert score_stations({}, {}) == {}
+
+
+def test_station_health_vectorised(ap_fixture: AirOSData) -> None:
+    """Test scoring with NumPy matches scoring one station at a time."""
+    pytest.importorskip("numpy")
+    station = ap_fixture.wireless.sta[0]
+    stations = [
+        replace(station, signal=signal, ul_linkscore=linkscore, chainrssi=chains)
+        for signal in (-50, -59, -65, -80)
+        for linkscore in (20, 86, 100)
+        for chains in ([35, 32, 0], [40, 20, 0], [])
+    ]
+    columns = build_columns(
+        stations,
+        ({"retry_ratio": retry_ratio} for retry_ratio in [None, 5.0, 30.0] * 12),
+    )
+
+    assert _score_numpy(columns) == _score_python(columns)
+
+
+def test_topology_roaming(ap_fixture: AirOSData) -> None:
+    """Test a station roaming between access points moves in the topology."""
+    station = ap_fixture.wireless.sta[0]
+    device_id = station.remote.device_id
+    other_ap = replace(
+        ap_fixture, host=replace(ap_fixture.host, device_id="other", hostname="Other")
+    )
+    topology = AirOSTopology()
+
+    topology.async_update("entry_a", ap_fixture, {"01:23:45:67:89:ab": station})
+    topology.async_update("entry_b", other_ap, {})
+    assert topology.get(mac="01:23:45:67:89:AB").access_point == (
+        ap_fixture.host.device_id
+    )
+
+    topology.async_update("entry_b", other_ap, {"01:23:45:67:89:ab": station})
+    topology.async_update("entry_a", ap_fixture, {})
+    assert topology.get(device_id).access_point == "other"
+    assert topology.get(ap_fixture.host.device_id).stations == set()
+    assert topology.get("other").stations == {device_id}
+
+    topology.async_remove("entry_b")
+    assert topology.get(device_id) is None
+    assert topology.get(mac="01:23:45:67:89:ab") is None
+    assert topology.get("other") is None
+
+
+def test_station_rates(ap_fixture: AirOSData) -> None:
+    """Test counters are turned into rates and resets are detected."""
+    station = ap_fixture.wireless.sta[0]
+    mac = station.mac.lower()
+    tracker = StationRateTracker()
+
+    rates = tracker.update({mac: station}, 100.0)
+    assert rates[mac] == dict.fromkeys(rates[mac])
+
+    later = replace(
+        station,
+        uptime=station.uptime + 10,
+        tx_packets=station.tx_packets + 1000,
+        tx_lretries=station.tx_lretries + 20,
+        tx_sretries=station.tx_sretries + 30,
+        remote=replace(station.remote, tx_bytes=station.remote.tx_bytes + 5000),
+    )
+    rates = tracker.update({mac: later}, 110.0)
+    assert rates[mac] == {
+        "tx_packet_rate": 100.0,
+        "retry_ratio": 5.0,
+        "remote_tx_rate": 500.0,
+        "remote_rx_rate": 0.0,
+    }
+
+    # Reassociation restarts the station uptime and counters
+    rates = tracker.update({mac: station}, 120.0)
+    assert rates[mac] == dict.fromkeys(rates[mac])
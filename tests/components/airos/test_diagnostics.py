@@ -1,10 +1,15 @@
 """Diagnostic tests for airOS."""
 
+from http import HTTPStatus
+import json
 from unittest.mock import MagicMock
 
 from homeassistant.components.airos.coordinator import AirOSData
+from homeassistant.components.airos.diagnostics import TO_REDACT_AIROS, redact_airos
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
 from homeassistant.core import HomeAssistant
 from syrupy.assertion import SnapshotAssertion
+from syrupy.filters import props
 
 from . import setup_integration
 
@@ -25,7 +30,43 @@ async def test_diagnostics(
 
     await setup_integration(hass, mock_config_entry)
 
-    assert (
-        await get_diagnostics_for_config_entry(hass, hass_client, mock_config_entry)
-        == snapshot
+    diagnostics = await get_diagnostics_for_config_entry(
+        hass, hass_client, mock_config_entry
     )
+    # Timings differ between runs
+    assert diagnostics == snapshot(exclude=props("timing"))
+    assert diagnostics["timing"]["failures"] == {}
+    assert diagnostics["timing"]["last_success"] is not None
+    assert diagnostics["timing"]["phases"]["process"]["samples"] == 1
+
+
+def test_redactor(ap_fixture: AirOSData) -> None:
+    """Test the single pass redactor matches the generic one."""
+    data = ap_fixture.to_dict()
+
+    assert redact_airos(data) == async_redact_data(data, TO_REDACT_AIROS)
+    assert data["host"]["device_id"] != REDACTED
+
+
+async def test_diagnostics_stream(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    mock_airos_client: MagicMock,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test the diagnostics of all devices are streamed as NDJSON."""
+    await setup_integration(hass, mock_config_entry)
+
+    client = await hass_client()
+    response = await client.get("/api/airos/diagnostics")
+
+    assert response.status == HTTPStatus.OK
+    assert response.content_type == "application/x-ndjson"
+    (line,) = [json.loads(line) for line in (await response.text()).splitlines()]
+    assert line["entry_id"] == mock_config_entry.entry_id
+    assert line["entry_data"]["password"] == REDACTED
+    assert line["data"]["host"]["device_id"] == REDACTED
+    assert line["session"]["polls"] == 1
+    (station,) = line["history"]
+    assert station["mac"] == REDACTED
+    assert station["signal"]["samples"] == 1
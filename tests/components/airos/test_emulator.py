@@ -0,0 +1,192 @@
+"""Test the Ubiquiti airOS integration against emulated devices."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+import os
+from unittest.mock import AsyncMock
+
+import pytest
+
+from homeassistant.components.airos.const import BREAKER_THRESHOLD, DOMAIN
+from homeassistant.components.airos.models import AIROS_DATA
+from homeassistant.config_entries import SOURCE_USER, ConfigEntryState
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from .emulator import AirOSDeviceEmulator, AirOSFleetEmulator, EmulatorConfig
+
+from tests.common import MockConfigEntry
+
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+# Raise for a longer soak, e.g. AIROS_SOAK_DEVICES=500 AIROS_SOAK_POLLS=50
+SOAK_DEVICES = int(os.environ.get("AIROS_SOAK_DEVICES", "20"))
+SOAK_POLLS = int(os.environ.get("AIROS_SOAK_POLLS", "5"))
+
+
+@pytest.fixture
+async def fleet() -> AsyncGenerator[AirOSFleetEmulator]:
+    """Return a fleet of emulated devices, stopped after the test."""
+    fleet = AirOSFleetEmulator()
+    yield fleet
+    await fleet.stop()
+
+
+def _config_entry(device: AirOSDeviceEmulator) -> MockConfigEntry:
+    """Return a config entry for an emulated device."""
+    return MockConfigEntry(
+        title=device.payload["host"]["hostname"],
+        domain=DOMAIN,
+        data={
+            CONF_HOST: device.host,
+            CONF_USERNAME: device.config.username,
+            CONF_PASSWORD: device.config.password,
+        },
+        unique_id=device.device_id,
+    )
+
+
+async def _setup_entries(
+    hass: HomeAssistant, fleet: AirOSFleetEmulator
+) -> list[MockConfigEntry]:
+    """Set up a config entry for every device of the fleet."""
+    entries = [_config_entry(device) for device in fleet.devices]
+    for entry in entries:
+        entry.add_to_hass(hass)
+    # Setting up the integration sets up all of its entries
+    await hass.config_entries.async_setup(entries[0].entry_id)
+    await hass.async_block_till_done()
+    return entries
+
+
+async def test_config_flow(
+    hass: HomeAssistant, fleet: AirOSFleetEmulator, mock_setup_entry: AsyncMock
+) -> None:
+    """Test the config flow talks to a device over HTTP."""
+    await fleet.start(1)
+    device = fleet.devices[0]
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "manual"}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_HOST: device.host, CONF_USERNAME: "ubnt", CONF_PASSWORD: "ubnt"},
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["result"].unique_id == device.device_id
+    assert device.stats.logins == 1
+
+
+async def test_session_reuse_and_expiry(
+    hass: HomeAssistant, fleet: AirOSFleetEmulator
+) -> None:
+    """Test the coordinator keeps its session and logs in again once it expires."""
+    await fleet.start(1, EmulatorConfig(stations=5))
+    device = fleet.devices[0]
+    (entry,) = await _setup_entries(hass, fleet)
+    coordinator = entry.runtime_data
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+
+    assert device.stats.logins == 1
+    assert device.stats.status_requests == 3
+    assert len(coordinator.stations) == 5
+    # Login and polls share the kept-alive connection
+    connections = hass.data[AIROS_DATA].connections.as_dict()
+    assert connections["created"] == 1
+    assert connections["reused"] == 3
+
+    device.expire_sessions()
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.airos_device.relogin_count == 1
+    assert device.stats.logins == 2
+
+
+async def test_stakick_after_session_expiry(
+    hass: HomeAssistant, fleet: AirOSFleetEmulator
+) -> None:
+    """Test a kick refused for an expired session is retried after logging in."""
+    await fleet.start(1, EmulatorConfig(stations=2))
+    device = fleet.devices[0]
+    (entry,) = await _setup_entries(hass, fleet)
+    client = entry.runtime_data.airos_device
+    mac = device.payload["wireless"]["sta"][0]["mac"]
+
+    device.expire_sessions()
+    assert await client.stakick(mac)
+
+    assert client.relogin_count == 1
+    assert device.stats.logins == 2
+    assert device.stats.kicks == 1
+
+
+async def test_concurrent_stakicks_share_relogin(
+    hass: HomeAssistant, fleet: AirOSFleetEmulator
+) -> None:
+    """Test concurrent kicks refused for an expired session log in only once."""
+    await fleet.start(1, EmulatorConfig(stations=3))
+    device = fleet.devices[0]
+    (entry,) = await _setup_entries(hass, fleet)
+    client = entry.runtime_data.airos_device
+    macs = [station["mac"] for station in device.payload["wireless"]["sta"]]
+
+    # A station that is not connected is refused without logging in again
+    assert not await client.stakick("00:00:00:00:00:00")
+    assert client.relogin_count == 0
+
+    device.expire_sessions()
+    assert all(await asyncio.gather(*(client.stakick(mac) for mac in macs)))
+
+    assert client.relogin_count == 1
+    assert device.stats.logins == 2
+    assert device.stats.kicks == 3
+
+
+async def test_fleet_soak(hass: HomeAssistant, fleet: AirOSFleetEmulator) -> None:
+    """Test a fleet of devices polled concurrently with latency and errors."""
+    config = EmulatorConfig(stations=10, latency=0.01, session_lifetime=0.5, seed=1)
+    await fleet.start(SOAK_DEVICES, config)
+    entries = await _setup_entries(hass, fleet)
+    assert all(entry.state is ConfigEntryState.LOADED for entry in entries)
+
+    # Devices share the config, from now on some requests fail
+    config.error_rate = 0.1
+    coordinators = [entry.runtime_data for entry in entries]
+    for _ in range(SOAK_POLLS):
+        await asyncio.gather(
+            *(coordinator.async_refresh() for coordinator in coordinators)
+        )
+
+    scheduler = hass.data[AIROS_DATA].scheduler.as_dict()
+    assert scheduler["registered"] == SOAK_DEVICES
+    assert scheduler["in_flight"] == 0
+    # A device whose breaker opened skips its remaining polls, which happens
+    # after BREAKER_THRESHOLD failures at the earliest
+    assert scheduler["requests"] == sum(
+        coordinator.poll_count for coordinator in coordinators
+    )
+    assert (
+        SOAK_DEVICES * (1 + min(SOAK_POLLS, BREAKER_THRESHOLD))
+        <= scheduler["requests"]
+        <= SOAK_DEVICES * (SOAK_POLLS + 1)
+    )
+    assert sum(device.stats.errors for device in fleet.devices) > 0
+
+    # Every device recovers once the errors stop, unless its breaker waits for a probe
+    config.error_rate = 0
+    tripped = [coordinator.breaker.is_open for coordinator in coordinators]
+    await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+
+    for coordinator, is_open in zip(coordinators, tripped, strict=True):
+        assert coordinator.last_update_success is not is_open
+        if not is_open:
+            assert len(coordinator.stations) == 10
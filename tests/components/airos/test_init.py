@@ -0,0 +1,189 @@
+"""Test the Ubiquiti airOS setup."""
+
+import asyncio
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock
+
+from airos.exceptions import ConnectionAuthenticationError, DeviceConnectionError
+import pytest
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.components.airos.const import (
+    CONF_MAX_CONCURRENT_POLLS,
+    CONF_POLL_JITTER,
+    DEFAULT_POLL_JITTER,
+    DOMAIN,
+    SNAPSHOT_SAVE_DELAY,
+)
+from homeassistant.components.airos.models import AIROS_DATA
+from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntryState
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from . import setup_integration
+
+from tests.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    load_json_object_fixture,
+)
+
+SIGNAL_UNIQUE_ID = "device0123_01:23:45:67:89:ab_signal"
+
+
+def _store_snapshot(
+    hass_storage: dict[str, Any], config_entry: MockConfigEntry
+) -> None:
+    """Store a status of the device of the config entry."""
+    status = load_json_object_fixture("ap-ptp.json", DOMAIN)
+    status["host"]["device_id"] = config_entry.unique_id
+    hass_storage[f"{DOMAIN}.{config_entry.entry_id}"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{config_entry.entry_id}",
+        "data": status,
+    }
+
+
+async def test_setup_from_snapshot(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test setup uses the stored status while the device is offline."""
+    _store_snapshot(hass_storage, mock_config_entry)
+    mock_airos_client.status.side_effect = DeviceConnectionError
+
+    await setup_integration(hass, mock_config_entry)
+
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    coordinator = mock_config_entry.runtime_data
+    assert coordinator.stale
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, SIGNAL_UNIQUE_ID
+    )
+    assert entity_id is not None
+    assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+    # The first live poll waits for the start offset of the device
+    mock_airos_client.status.assert_not_called()
+
+    freezer.tick(timedelta(seconds=DEFAULT_POLL_JITTER))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    mock_airos_client.status.assert_called_once()
+    assert coordinator.stale
+
+    mock_airos_client.status.side_effect = None
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert not coordinator.stale
+    assert hass.states.get(entity_id).state == "-59"
+
+
+async def test_setup_from_snapshot_invalid_auth(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a refused password on the first live poll starts reauthentication."""
+    _store_snapshot(hass_storage, mock_config_entry)
+    mock_airos_client.status.side_effect = ConnectionAuthenticationError
+
+    await setup_integration(hass, mock_config_entry)
+    freezer.tick(timedelta(seconds=DEFAULT_POLL_JITTER))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert mock_config_entry.runtime_data.stale
+    (flow,) = hass.config_entries.flow.async_progress()
+    assert flow["step_id"] == "reauth_confirm"
+    assert flow["context"]["source"] == SOURCE_REAUTH
+    assert flow["context"]["entry_id"] == mock_config_entry.entry_id
+
+
+async def test_snapshot_saved(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the last good status is stored in compact form."""
+    await setup_integration(hass, mock_config_entry)
+    key = f"{DOMAIN}.{mock_config_entry.entry_id}"
+    assert key not in hass_storage
+
+    freezer.tick(SNAPSHOT_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    status = hass_storage[key]["data"]
+    assert status["interfaces"]
+    station = status["wireless"]["sta"][0]
+    assert station["mac"] == "01:23:45:67:89:AB"
+    assert station["airmax"]["rx"]["evm"] == []
+    assert station["tx_ratedata"] == []
+
+    await hass.config_entries.async_remove(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert key not in hass_storage
+
+
+@pytest.mark.usefixtures("mock_airos_client")
+async def test_unload_closes_connections(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test the kept-alive connections are closed with the last device."""
+    other_entry = MockConfigEntry(
+        domain=DOMAIN, data=mock_config_entry.data, unique_id="device4567"
+    )
+    other_entry.add_to_hass(hass)
+    await setup_integration(hass, mock_config_entry)
+    assert other_entry.state is ConfigEntryState.LOADED
+    session = hass.data[AIROS_DATA].connections.async_get_session(hass)
+
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    assert not session.closed
+
+    assert await hass.config_entries.async_unload(other_entry.entry_id)
+    assert session.closed
+
+
+async def test_scheduler_options(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test the shared poll limit follows the options of the first device."""
+    first_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=mock_config_entry.data,
+        options={CONF_MAX_CONCURRENT_POLLS: 1, CONF_POLL_JITTER: 0},
+        unique_id="device4567",
+    )
+    first_entry.add_to_hass(hass)
+    await setup_integration(hass, mock_config_entry)
+    scheduler = hass.data[AIROS_DATA].scheduler
+    assert scheduler.max_concurrent == 1
+    assert scheduler.start_offset() == 0
+
+    released = asyncio.Event()
+
+    async def _request() -> None:
+        async with scheduler.slot():
+            await released.wait()
+
+    requests = [asyncio.create_task(_request()) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert scheduler.in_flight == 1
+    assert scheduler.queue_depth == 1
+
+    released.set()
+    await asyncio.gather(*requests)
+    assert scheduler.in_flight == 0
@@ -1,10 +1,18 @@
 """Test the Ubiquiti airOS sensors."""
 
+from dataclasses import replace
 from datetime import timedelta
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
+
+import pytest
 
 from freezegun.api import FrozenDateTimeFactory
-from homeassistant.components.airos.const import SCAN_INTERVAL
+from homeassistant.components.airos.const import (
+    CONF_STATION_STATISTICS,
+    DOMAIN,
+    HISTORY_SIZE,
+    SCAN_INTERVAL,
+)
 from homeassistant.components.airos.coordinator import AirOSData
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
@@ -50,3 +58,276 @@ async def test_all_entities(
         f"Sensor {expected_entity_id} changed unexpectedly"
     )
     mock_airos_client.status.assert_called()
+
+
+async def test_station_sensors(
+    hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test station sensors read the metrics extracted by the coordinator."""
+    await setup_integration(hass, mock_config_entry)
+
+    metrics = mock_config_entry.runtime_data.station_metrics["01:23:45:67:89:ab"]
+    assert metrics["signal"] == -59
+    assert metrics["chain0_rssi"] == 35
+    assert metrics["chain1_rssi"] == 32
+    assert metrics["remote_tx_throughput"] == 16023
+
+    entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, "device0123_01:23:45:67:89:ab_signal"
+    )
+    assert entity_id is not None
+    assert hass.states.get(entity_id).state == "-59"
+
+
+async def test_link_health_sensors(
+    hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the health of every station and the least healthy stations."""
+    await setup_integration(hass, mock_config_entry)
+
+    entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, "device0123_01:23:45:67:89:ab_health"
+    )
+    assert hass.states.get(entity_id).state == "82"
+
+    state = hass.states.get("sensor.nanostation_5ac_ap_name_worst_link_health")
+    assert state.state == "82"
+    assert state.attributes["stations"] == [
+        {
+            "mac": "01:23:45:67:89:ab",
+            "hostname": "NanoStation 5AC sta name",
+            "health": 82,
+        }
+    ]
+
+
+async def test_unchanged_values_not_written(
+    hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    ap_fixture: AirOSData,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test only entities whose value changed write state on an update."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = mock_config_entry.runtime_data
+
+    antenna_gain = "sensor.nanostation_5ac_ap_name_antenna_gain"
+    frequency = "sensor.nanostation_5ac_ap_name_wireless_frequency"
+    reported = hass.states.get(antenna_gain).last_reported
+    frequency_reported = hass.states.get(frequency).last_reported
+
+    freezer.tick(timedelta(seconds=1))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(antenna_gain).last_reported == reported
+    assert coordinator.skipped_count > 0
+
+    mock_airos_client.status.return_value = replace(
+        ap_fixture, wireless=replace(ap_fixture.wireless, antenna_gain=16)
+    )
+    freezer.tick(timedelta(seconds=1))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(antenna_gain).state == "16"
+    assert hass.states.get(frequency).last_reported == frequency_reported
+
+
+async def test_interface_sensors(
+    hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    ap_fixture: AirOSData,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test interface sensors only write state when their interface changed."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = mock_config_entry.runtime_data
+    entity_registry = er.async_get(hass)
+
+    eth0 = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, "device0123_eth0_speed"
+    )
+    ath0 = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, "device0123_ath0_speed"
+    )
+    assert eth0 is not None
+    assert ath0 is not None
+    # Only wired ports are enabled by default
+    assert (
+        entity_registry.async_get(ath0).disabled_by
+        is er.RegistryEntryDisabler.INTEGRATION
+    )
+    assert hass.states.get(eth0).state == "1000"
+    reported = hass.states.get(eth0).last_reported
+
+    interfaces = [
+        replace(interface, status=replace(interface.status, speed=10, duplex=False))
+        if interface.ifname == "eth0"
+        else interface
+        for interface in ap_fixture.interfaces
+    ]
+    mock_airos_client.status.return_value = replace(ap_fixture, interfaces=interfaces)
+    freezer.tick(timedelta(seconds=1))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(eth0).state == "10"
+    assert hass.states.get(eth0).last_reported != reported
+    reported = hass.states.get(eth0).last_reported
+
+    mock_airos_client.status.return_value = replace(
+        ap_fixture,
+        interfaces=interfaces,
+        wireless=replace(ap_fixture.wireless, antenna_gain=16),
+    )
+    freezer.tick(timedelta(seconds=1))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(eth0).last_reported == reported
+
+
+async def test_station_history(
+    hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    ap_fixture: AirOSData,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test rolling statistics over the last polls of a station."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = mock_config_entry.runtime_data
+    station = ap_fixture.wireless.sta[0]
+
+    for signal in (-61, -57):
+        mock_airos_client.status.return_value = replace(
+            ap_fixture,
+            wireless=replace(
+                ap_fixture.wireless, sta=[replace(station, signal=signal)]
+            ),
+        )
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, "device0123_01:23:45:67:89:ab_signal"
+    )
+    attributes = hass.states.get(entity_id).attributes
+    assert attributes["min"] == -61
+    assert attributes["max"] == -57
+    assert attributes["mean"] == -59
+    assert attributes["p95"] == -57
+    assert attributes["samples"] == 3
+
+    mock_airos_client.status.return_value = replace(
+        ap_fixture, wireless=replace(ap_fixture.wireless, sta=[])
+    )
+    await coordinator.async_refresh()
+
+    assert coordinator.station_history.statistics("01:23:45:67:89:ab", "signal") is None
+
+
+async def test_station_history_steady_value(
+    hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    ap_fixture: AirOSData,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test rolling statistics follow the window while the value stays the same."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = mock_config_entry.runtime_data
+    station = ap_fixture.wireless.sta[0]
+    mock_airos_client.status.return_value = replace(
+        ap_fixture,
+        wireless=replace(ap_fixture.wireless, sta=[replace(station, signal=-65)]),
+    )
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, "device0123_01:23:45:67:89:ab_signal"
+    )
+    assert hass.states.get(entity_id).attributes["max"] == -59
+
+    # The higher signal slides out of the window while the state stays -65
+    for _ in range(HISTORY_SIZE):
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    state = hass.states.get(entity_id)
+    assert state.state == "-65"
+    assert state.attributes["max"] == -65
+    assert state.attributes["samples"] == HISTORY_SIZE
+
+
+@pytest.mark.usefixtures("recorder_mock")
+async def test_station_statistics(
+    hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    entity_registry: er.EntityRegistry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test station metrics are kept as hourly statistics instead of sensors."""
+    freezer.move_to("2025-08-01 10:15:00+00:00")
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={CONF_STATION_STATISTICS: True}
+    )
+
+    with patch(
+        "homeassistant.components.airos.station_statistics.async_add_external_statistics"
+    ) as mock_add_statistics:
+        await setup_integration(hass, mock_config_entry)
+        coordinator = mock_config_entry.runtime_data
+
+        assert (
+            entity_registry.async_get_entity_id(
+                "sensor", DOMAIN, "device0123_01:23:45:67:89:ab_signal"
+            )
+            is None
+        )
+
+        freezer.move_to("2025-08-01 10:45:00+00:00")
+        await coordinator.async_refresh()
+        mock_add_statistics.assert_not_called()
+
+        # A reload continues the hour rather than write it partially
+        status = mock_airos_client.status.return_value
+        station = replace(status.wireless.sta[0], signal=-65)
+        mock_airos_client.status.return_value = replace(
+            status, wireless=replace(status.wireless, sta=[station])
+        )
+        await hass.config_entries.async_reload(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+        mock_add_statistics.assert_not_called()
+        coordinator = mock_config_entry.runtime_data
+
+        freezer.move_to("2025-08-01 10:50:00+00:00")
+        await coordinator.async_refresh()
+
+        # The first poll of the next hour writes the previous one
+        freezer.move_to("2025-08-01 11:00:10+00:00")
+        await coordinator.async_refresh()
+
+    written = {
+        call.args[1]["statistic_id"]: (call.args[1], call.args[2])
+        for call in mock_add_statistics.call_args_list
+    }
+    assert len(written) == coordinator.long_term_statistics.written
+    metadata, (statistic,) = written["airos:device0123_01_23_45_67_89_ab_signal"]
+    assert metadata["unit_of_measurement"] == "dBm"
+    assert metadata["source"] == DOMAIN
+    assert statistic["start"].isoformat() == "2025-08-01T10:00:00+00:00"
+    assert statistic["min"] == -65
+    assert statistic["max"] == -59
@@ -0,0 +1,196 @@
+"""Test the Ubiquiti airOS services."""
+
+from unittest.mock import AsyncMock
+
+from airos.exceptions import DeviceConnectionError
+import pytest
+
+import aiohttp
+from homeassistant.components.airos.const import (
+    DOMAIN,
+    SERVICE_GET_TOPOLOGY,
+    SERVICE_KICK_STATIONS,
+)
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+
+from . import setup_integration
+
+from tests.common import MockConfigEntry
+from tests.typing import WebSocketGenerator
+
+MAC = "01:23:45:67:89:ab"
+AP_DEVICE_ID = "03aa0d0b40fed0a47088293584ef5432"
+STATION_DEVICE_ID = "d4f4cdf82961e619328a8f72f8d7653b"
+
+
+async def test_kick_stations_by_mac(
+    hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test kicking stations by MAC reuses the session of the device."""
+    await setup_integration(hass, mock_config_entry)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_KICK_STATIONS,
+        {"macs": [MAC.upper(), "aa:bb:cc:dd:ee:ff"]},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {
+        "entries": {
+            mock_config_entry.entry_id: {
+                MAC.upper(): {"kicked": True, "error": None},
+            },
+        },
+        "not_connected": ["aa:bb:cc:dd:ee:ff"],
+    }
+    mock_airos_client.stakick.assert_called_once_with(MAC.upper())
+    mock_airos_client.ensure_session.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("signal_below", "kicked"),
+    [(-50, True), (-70, False)],
+)
+async def test_kick_stations_by_signal(
+    hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    signal_below: int,
+    kicked: bool,
+) -> None:
+    """Test kicking the stations with a weak signal."""
+    await setup_integration(hass, mock_config_entry)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_KICK_STATIONS,
+        {"signal_below": signal_below},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert (mock_config_entry.entry_id in response["entries"]) is kicked
+    assert mock_airos_client.stakick.called is kicked
+
+
+@pytest.mark.parametrize(
+    "error", [DeviceConnectionError, TimeoutError, aiohttp.ClientConnectionError]
+)
+async def test_kick_stations_errors(
+    hass: HomeAssistant,
+    mock_airos_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+    error: type[Exception],
+) -> None:
+    """Test failures are reported per station and unknown devices rejected."""
+    await setup_integration(hass, mock_config_entry)
+    mock_airos_client.stakick.side_effect = error
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_KICK_STATIONS,
+        {"macs": MAC},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["entries"][mock_config_entry.entry_id][MAC.upper()] == {
+        "kicked": False,
+        "error": error.__name__,
+    }
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_KICK_STATIONS,
+            {ATTR_CONFIG_ENTRY_ID: "unknown", "macs": MAC},
+            blocking=True,
+            return_response=True,
+        )
+
+
+@pytest.mark.usefixtures("mock_airos_client")
+async def test_get_topology(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test looking up the access point of a station by MAC."""
+    await setup_integration(hass, mock_config_entry)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_TOPOLOGY,
+        {"mac": MAC.upper()},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {
+        "device": {
+            "device_id": STATION_DEVICE_ID,
+            "hostname": "NanoStation 5AC sta name",
+            "macs": [MAC],
+            "config_entry_id": None,
+            "access_point": AP_DEVICE_ID,
+            "stations": [],
+        },
+        "access_point": {
+            "device_id": AP_DEVICE_ID,
+            "hostname": "NanoStation 5AC ap name",
+            "macs": [],
+            "config_entry_id": mock_config_entry.entry_id,
+            "access_point": None,
+            "stations": [STATION_DEVICE_ID],
+        },
+        "stations": [],
+    }
+
+    with pytest.raises(ServiceValidationError) as excinfo:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_TOPOLOGY,
+            {"device_id": "unknown"},
+            blocking=True,
+            return_response=True,
+        )
+    assert excinfo.value.translation_key == "device_not_found"
+
+
+@pytest.mark.usefixtures("mock_airos_client")
+async def test_websocket_topology(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test looking up the stations of an access point over the websocket."""
+    await setup_integration(hass, mock_config_entry)
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": "airos/topology", "device_id": AP_DEVICE_ID}
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert [station["device_id"] for station in msg["result"]["stations"]] == [
+        STATION_DEVICE_ID
+    ]
+
+    await client.send_json_auto_id({"type": "airos/topology"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert len(msg["result"]["nodes"]) == 2
+
+    # Removed config entries leave no devices behind
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await client.send_json_auto_id({"type": "airos/topology"})
+    msg = await client.receive_json()
+    assert msg["result"] == {"nodes": []}
+
+    await client.send_json_auto_id({"type": "airos/topology", "mac": MAC})
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "not_found"